@@ -0,0 +1,8 @@
+"""
+Authentication backends package.
+"""
+
+from .cached_token_authentication import CachedTokenAuthentication
+from .signed_token_authentication import SignedTokenAuthentication, TokenUser
+
+__all__ = ["CachedTokenAuthentication", "SignedTokenAuthentication", "TokenUser"]
@@ -0,0 +1,34 @@
+"""
+Cached token authentication.
+"""
+
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from authentication.services import token_cache
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication com cache de token -> usuário.
+
+    Em regime, requisições autenticadas não consultam o banco para
+    autenticar: o SELECT de Token + User só acontece na primeira requisição
+    com o token (ou após a entrada expirar/ser invalidada).
+    """
+
+    def authenticate_credentials(self, key):
+        if not token_cache.enabled():
+            return super().authenticate_credentials(key)
+
+        token = token_cache.get(key)
+        if token is None:
+            user, token = super().authenticate_credentials(key)
+            token_cache.set(key, token)
+            return user, token
+
+        if not token.user.is_active:
+            raise AuthenticationFailed(_("User inactive or deleted."))
+        return token.user, token
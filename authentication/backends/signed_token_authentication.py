@@ -0,0 +1,67 @@
+"""
+Signed token authentication.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core import signing
+from django.utils.functional import SimpleLazyObject
+
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+from rest_framework.exceptions import AuthenticationFailed
+
+from authentication.services import signed_tokens
+
+
+class TokenUser(SimpleLazyObject):
+    """
+    Usuário de um access token assinado.
+
+    ``pk``/``id`` vêm do token, sem consulta: views que só filtram pelo
+    usuário autenticado não tocam a tabela de usuários. Qualquer outro
+    atributo carrega o User (uma busca pela PK) na primeira vez; se ele foi
+    removido ou desativado depois da emissão do token, a requisição falha
+    com 401 em vez de seguir com um usuário anônimo "autenticado".
+    """
+
+    def __init__(self, user_id):
+        def load():
+            user = get_user_model().objects.filter(pk=user_id, is_active=True).first()
+            if user is None:
+                raise AuthenticationFailed("Usuário inativo ou removido.")
+            return user
+
+        super().__init__(load)
+        self.__dict__.update(
+            pk=user_id, id=user_id, is_authenticated=True, is_anonymous=False
+        )
+
+    def __bool__(self):
+        # Permissões testam ``request.user and ...``: não carregar por isso
+        return True
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """
+    Autenticação por access token assinado (``Authorization: Bearer ...``).
+
+    A verificação é só HMAC + expiração + lista de revogação em memória,
+    sem acesso ao banco. ``request.auth`` é o payload do token.
+    """
+
+    keyword = signed_tokens.TOKEN_TYPE
+
+    def authenticate(self, request):
+        auth = get_authorization_header(request).split()
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+        if len(auth) != 2:
+            raise AuthenticationFailed("Cabeçalho Authorization inválido.")
+
+        try:
+            payload = signed_tokens.verify(auth[1].decode())
+        except (signing.BadSignature, UnicodeError):
+            raise AuthenticationFailed("Token inválido ou expirado.")
+        return TokenUser(payload["u"]), payload
+
+    def authenticate_header(self, request):
+        return self.keyword
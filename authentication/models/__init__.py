@@ -0,0 +1,7 @@
+"""
+Authentication models package.
+"""
+
+from .refresh_token import RefreshToken
+
+__all__ = ["RefreshToken"]
@@ -0,0 +1,45 @@
+"""
+RefreshToken model - Sessões dos tokens assinados.
+"""
+
+import uuid
+
+from django.conf import settings
+from django.db import models
+
+
+class RefreshToken(models.Model):
+    """
+    Sessão aberta no login com tokens assinados.
+
+    Guarda apenas o hash do refresh token atual, trocado a cada refresh
+    (um refresh token antigo deixa de valer). O ID da sessão vai dentro dos
+    access tokens; revogar a sessão (``revoked_at``) derruba o refresh e,
+    via lista de revogação em memória, os access tokens ainda válidos.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="refresh_tokens",
+        on_delete=models.CASCADE,
+        verbose_name="Usuário",
+    )
+
+    key_hash = models.CharField(max_length=64, unique=True, verbose_name="Hash")
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Criado em")
+    expires_at = models.DateTimeField(verbose_name="Expira em")
+    revoked_at = models.DateTimeField(null=True, blank=True, verbose_name="Revogado em")
+
+    class Meta:
+        verbose_name = "Refresh token"
+        verbose_name_plural = "Refresh tokens"
+        indexes = [
+            # Carga periódica da lista de revogação
+            models.Index(fields=["revoked_at"]),
+        ]
+
+    def __str__(self):
+        return f"Sessão {self.id} de {self.user_id}"
@@ -3,9 +3,11 @@ Authentication serializers package.
 """
 
 from .login_serializer import LoginSerializer
+from .refresh_serializer import RefreshSerializer
 from .register_serializer import RegisterSerializer
 
 __all__ = [
     "RegisterSerializer",
     "LoginSerializer",
+    "RefreshSerializer",
 ]
@@ -0,0 +1,13 @@
+"""
+Refresh serializer.
+"""
+
+from rest_framework import serializers
+
+
+class RefreshSerializer(serializers.Serializer):
+    """
+    Serializer para troca do refresh token por um novo par de tokens.
+    """
+
+    refresh = serializers.CharField()
@@ -0,0 +1,7 @@
+"""
+Authentication services package.
+"""
+
+from . import credentials, password_pool, signed_tokens, token_cache
+
+__all__ = ["credentials", "password_pool", "signed_tokens", "token_cache"]
@@ -0,0 +1,19 @@
+"""
+Credentials service - Credenciais retornadas por login e registro.
+"""
+
+from rest_framework.authtoken.models import Token
+
+from authentication.services import signed_tokens
+
+
+def issue(user):
+    """
+    Par access/refresh assinado (com ``SIGNED_TOKENS`` ativo) ou o Token do
+    banco do usuário, no formato da resposta.
+    """
+    if signed_tokens.enabled():
+        return signed_tokens.issue(user)
+
+    token, created = Token.objects.get_or_create(user=user)
+    return {"token": token.key}
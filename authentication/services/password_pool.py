@@ -0,0 +1,84 @@
+"""
+Password pool - Pool limitado para o hashing de senhas.
+
+O PBKDF2 de ``authenticate()``/``create_user()`` gasta dezenas de ms de CPU
+por chamada. Nas views assíncronas de login/registro (servidas via ASGI)
+esse trabalho roda em um pool de threads de tamanho fixo (o hashlib libera
+o GIL durante o PBKDF2), com uma fila limitada: uma rajada de logins ocupa
+no máximo ``MAX_WORKERS`` núcleos, e o excedente acima de ``MAX_QUEUE``
+é recusado na hora (429) em vez de acumular e atrasar o resto do tráfego.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import close_old_connections
+
+from core.conf import app_settings
+
+
+class PoolSaturated(Exception):
+    """Pool e fila cheios: a tarefa não foi aceita."""
+
+
+class PasswordPool:
+    """
+    ThreadPoolExecutor com limite de tarefas pendentes (em execução + fila).
+
+    Criado na primeira tarefa com as configurações vigentes; ``shutdown()``
+    descarta o pool para que seja recriado.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._slots = None
+
+    def _ensure(self):
+        with self._lock:
+            if self._executor is None:
+                options = app_settings("PASSWORD_HASHING_POOL")
+                self._executor = ThreadPoolExecutor(
+                    max_workers=options["MAX_WORKERS"],
+                    thread_name_prefix="password-pool",
+                )
+                self._slots = threading.BoundedSemaphore(
+                    options["MAX_WORKERS"] + options["MAX_QUEUE"]
+                )
+            return self._executor, self._slots
+
+    def submit(self, fn, *args, **kwargs):
+        """Agenda ``fn``; levanta PoolSaturated se não houver vaga."""
+        executor, slots = self._ensure()
+        if not slots.acquire(blocking=False):
+            raise PoolSaturated()
+        try:
+            future = executor.submit(self._call, fn, *args, **kwargs)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        return future
+
+    async def run(self, fn, *args, **kwargs):
+        """Executa ``fn`` no pool sem bloquear o event loop."""
+        return await asyncio.wrap_future(self.submit(fn, *args, **kwargs))
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            executor, self._executor, self._slots = self._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    @staticmethod
+    def _call(fn, *args, **kwargs):
+        # As threads do pool não passam pelo ciclo de request do Django
+        close_old_connections()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+
+pool = PasswordPool()
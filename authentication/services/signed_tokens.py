@@ -0,0 +1,192 @@
+"""
+Signed tokens - Access tokens assinados (HMAC) com refresh tokens.
+
+Alternativa ao Token do banco, ativada por ``SIGNED_TOKENS["ENABLED"]``:
+
+- access token: ``{"u": user_id, "s": session_id}`` assinado com HMAC
+  (``django.core.signing``, chave SECRET_KEY) e com timestamp. Verificá-lo
+  não consulta o banco; expira em ``ACCESS_TOKEN_LIFETIME`` segundos.
+- refresh token: segredo aleatório do qual só o hash fica em RefreshToken
+  (uma linha por sessão). Cada refresh troca o segredo e emite um novo par.
+- revogação: logout ou desativação do usuário marcam ``revoked_at`` na
+  sessão. Cada processo mantém em memória o conjunto de sessões revogadas
+  há menos de ``ACCESS_TOKEN_LIFETIME`` (as mais antigas não têm access
+  tokens válidos), recarregado a cada ``REVOCATION_REFRESH_INTERVAL``
+  segundos com uma consulta. Revogações do próprio processo valem na hora.
+"""
+
+import hashlib
+import secrets
+import threading
+import time
+import uuid
+from datetime import timedelta
+
+from django.core import signing
+from django.utils import timezone
+
+from authentication.models import RefreshToken
+from core.conf import app_settings
+
+SALT = "authentication.access"
+TOKEN_TYPE = "Bearer"
+
+
+def enabled():
+    return app_settings("SIGNED_TOKENS")["ENABLED"]
+
+
+def _hash(key):
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class RevocationList:
+    """
+    Sessões revogadas recentemente, em memória (por processo).
+
+    As revogações feitas neste processo são mantidas também entre as
+    recargas, pela validade do access token: as de usuários removidos não
+    ficam gravadas no banco (os RefreshTokens vão junto no cascade).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._revoked = frozenset()
+        self._added = {}
+        self._loaded_at = None
+
+    def __contains__(self, session_id):
+        interval = app_settings("SIGNED_TOKENS")["REVOCATION_REFRESH_INTERVAL"]
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > interval:
+            self.load()
+        return session_id in self._revoked
+
+    def load(self):
+        """Recarrega as sessões revogadas dentro da validade do access token."""
+        lifetime = app_settings("SIGNED_TOKENS")["ACCESS_TOKEN_LIFETIME"]
+        since = timezone.now() - timedelta(seconds=lifetime)
+        revoked = frozenset(
+            str(session_id)
+            for session_id in RefreshToken.objects.filter(
+                revoked_at__gte=since
+            ).values_list("id", flat=True)
+        )
+        now = time.monotonic()
+        with self._lock:
+            self._added = {
+                sid: added_at
+                for sid, added_at in self._added.items()
+                if now - added_at <= lifetime
+            }
+            self._revoked = revoked | self._added.keys()
+            self._loaded_at = now
+
+    def add(self, session_ids):
+        """Revogação feita neste processo: vale antes da próxima recarga."""
+        now = time.monotonic()
+        with self._lock:
+            for sid in session_ids:
+                self._added[str(sid)] = now
+            self._revoked = self._revoked | self._added.keys()
+
+    def clear(self):
+        with self._lock:
+            self._revoked = frozenset()
+            self._added = {}
+            self._loaded_at = None
+
+
+revocations = RevocationList()
+
+
+def access_token(user_id, session_id):
+    """Access token assinado para o usuário/sessão."""
+    return signing.dumps({"u": user_id, "s": str(session_id)}, salt=SALT)
+
+
+def verify(token):
+    """
+    Payload do access token (``{"u": ..., "s": ...}``), sem acessar o banco
+    (exceto a recarga periódica da lista de revogação).
+
+    Levanta ``signing.BadSignature`` (ou ``SignatureExpired``) se inválido,
+    expirado ou revogado.
+    """
+    payload = signing.loads(
+        token, salt=SALT, max_age=app_settings("SIGNED_TOKENS")["ACCESS_TOKEN_LIFETIME"]
+    )
+    if payload["s"] in revocations:
+        raise signing.BadSignature("Sessão revogada.")
+    return payload
+
+
+def _pair(user_id, session_id, refresh_key):
+    return {
+        "access": access_token(user_id, session_id),
+        "refresh": refresh_key,
+        "token_type": TOKEN_TYPE,
+        "expires_in": app_settings("SIGNED_TOKENS")["ACCESS_TOKEN_LIFETIME"],
+    }
+
+
+def _expires_at():
+    return timezone.now() + timedelta(
+        seconds=app_settings("SIGNED_TOKENS")["REFRESH_TOKEN_LIFETIME"]
+    )
+
+
+def issue(user):
+    """Abre uma sessão e retorna o par access/refresh."""
+    refresh_key = secrets.token_urlsafe(32)
+    session = RefreshToken.objects.create(
+        id=uuid.uuid4(),
+        user=user,
+        key_hash=_hash(refresh_key),
+        expires_at=_expires_at(),
+    )
+    return _pair(user.pk, session.pk, refresh_key)
+
+
+def refresh(refresh_key):
+    """
+    Troca o refresh token por um novo par. Retorna None se o refresh token
+    não existe (ou já foi trocado), expirou ou a sessão foi revogada.
+    """
+    new_key = secrets.token_urlsafe(32)
+    now = timezone.now()
+    session = (
+        RefreshToken.objects.filter(
+            key_hash=_hash(refresh_key), revoked_at__isnull=True, expires_at__gt=now
+        )
+        .values("id", "user_id")
+        .first()
+    )
+    if session is None:
+        return None
+
+    # Condicional no hash antigo: dois refreshes simultâneos com o mesmo
+    # token não geram duas sessões válidas
+    updated = RefreshToken.objects.filter(
+        pk=session["id"], key_hash=_hash(refresh_key)
+    ).update(key_hash=_hash(new_key), expires_at=_expires_at())
+    if not updated:
+        return None
+    return _pair(session["user_id"], session["id"], new_key)
+
+
+def revoke(session_ids):
+    """Revoga as sessões (refresh e access tokens ainda não expirados)."""
+    session_ids = list(session_ids)
+    RefreshToken.objects.filter(pk__in=session_ids, revoked_at__isnull=True).update(
+        revoked_at=timezone.now()
+    )
+    revocations.add(session_ids)
+
+
+def revoke_user(user_id):
+    """Revoga todas as sessões abertas do usuário."""
+    revoke(
+        RefreshToken.objects.filter(
+            user_id=user_id, revoked_at__isnull=True
+        ).values_list("id", flat=True)
+    )
@@ -0,0 +1,90 @@
+"""
+Token cache - Cache de tokens de autenticação já validados.
+
+Evita o SELECT de Token + User a cada requisição autenticada. Dois níveis:
+um LRU com expiração em memória (por processo) e, opcionalmente, um cache
+compartilhado do Django (``CACHES``), como no cache de fragmentos.
+
+As entradas são removidas no logout e, via signals, quando o token é
+apagado ou o usuário é alterado. Outros processos só veem a remoção no
+cache compartilhado; o nível em memória deles expira em ``TIMEOUT``
+segundos, que limita por quanto tempo um token revogado ainda é aceito.
+"""
+
+import copy
+import hashlib
+
+from django.core.cache import caches
+
+from core.cache import TTLCache
+from core.conf import DEFAULTS, app_settings
+
+KEY_PREFIX = "auth-token:"
+
+local = TTLCache(
+    DEFAULTS["AUTH_TOKEN_CACHE"]["MAX_SIZE"], DEFAULTS["AUTH_TOKEN_CACHE"]["TIMEOUT"]
+)
+
+
+def enabled():
+    return app_settings("AUTH_TOKEN_CACHE")["ENABLED"]
+
+
+def cache_key(key):
+    """Chave de cache do token (hash: o token não aparece no backend)."""
+    return KEY_PREFIX + hashlib.sha256(key.encode()).hexdigest()
+
+
+def get(key):
+    """
+    Token (com ``user``) em cache para ``key``, ou None.
+
+    Retorna cópias, para que alterações feitas durante uma requisição não
+    vazem para as seguintes.
+    """
+    name = cache_key(key)
+    token = local.get_many([name]).get(name)
+    backend = app_settings("AUTH_TOKEN_CACHE")["BACKEND"]
+    if token is None and backend:
+        token = caches[backend].get(name)
+        if token is not None:
+            _set_local({name: token})
+    if token is None:
+        return None
+
+    user = copy.copy(token.user)
+    token = copy.copy(token)
+    token.user = user
+    return token
+
+
+def set(key, token):
+    """Guarda o token validado (já com ``user`` carregado)."""
+    name = cache_key(key)
+    options = app_settings("AUTH_TOKEN_CACHE")
+    _set_local({name: token})
+    if options["BACKEND"]:
+        caches[options["BACKEND"]].set(name, token, timeout=options["TIMEOUT"])
+
+
+def invalidate(keys):
+    """Remove os tokens ``keys`` dos dois níveis."""
+    names = [cache_key(key) for key in keys]
+    if not names:
+        return
+    local.delete_many(names)
+    backend = app_settings("AUTH_TOKEN_CACHE")["BACKEND"]
+    if backend:
+        caches[backend].delete_many(names)
+
+
+def clear():
+    """Limpa apenas o nível em memória deste processo."""
+    local.clear()
+
+
+def _set_local(mapping):
+    options = app_settings("AUTH_TOKEN_CACHE")
+    local.max_size = options["MAX_SIZE"]
+    local.timeout = options["TIMEOUT"]
+    local.set_many(mapping)
@@ -0,0 +1,49 @@
+"""
+Authentication signals.
+
+Remove do cache de tokens as entradas de tokens apagados e de usuários
+alterados ou removidos, e revoga as sessões de tokens assinados de
+usuários desativados ou removidos.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from rest_framework.authtoken.models import Token
+
+from authentication.services import signed_tokens, token_cache
+
+User = get_user_model()
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    """Token apagado (logout, admin, cascade do usuário)."""
+    token_cache.invalidate([instance.key])
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, created, **kwargs):
+    """Usuário alterado (ex.: desativado, senha trocada): recarregar."""
+    if not created:
+        token_cache.invalidate(
+            Token.objects.filter(user_id=instance.pk).values_list("key", flat=True)
+        )
+
+
+@receiver(post_save, sender=User)
+def revoke_inactive_user_sessions(sender, instance, created, **kwargs):
+    """Usuário desativado: access/refresh tokens assinados deixam de valer."""
+    if not created and not instance.is_active:
+        signed_tokens.revoke_user(instance.pk)
+
+
+@receiver(pre_delete, sender=User)
+def revoke_deleted_user_sessions(sender, instance, **kwargs):
+    """
+    Usuário removido: as sessões entram na lista de revogação do processo
+    antes do cascade apagar os RefreshTokens (nos demais processos, o
+    TokenUser falha ao carregar o usuário).
+    """
+    signed_tokens.revoke_user(instance.pk)
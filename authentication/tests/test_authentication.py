@@ -0,0 +1,263 @@
+"""
+Testes para a autenticação por token com cache e por token assinado.
+"""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+
+from authentication.models import RefreshToken
+from authentication.services import signed_tokens, token_cache
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clean_token_cache():
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+@pytest.fixture
+def token():
+    """Fixture com token de um usuário."""
+    user = User.objects.create_user(username="testuser", password="testpass123")
+    return Token.objects.create(user=user)
+
+
+@pytest.fixture
+def token_client(token):
+    """Fixture com cliente autenticado pelo header Authorization."""
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Token {token.key}")
+    return client
+
+
+def auth_queries(context):
+    """Consultas à tabela de tokens capturadas em ``context``."""
+    return [q for q in context.captured_queries if "authtoken_token" in q["sql"]]
+
+
+@pytest.mark.django_db
+class TestCachedTokenAuthentication:
+    """Testes para o CachedTokenAuthentication."""
+
+    def test_cached_requests_skip_auth_queries(self, token_client):
+        """Testa que só a primeira requisição consulta Token + User."""
+        url = reverse("post-feed")
+
+        with CaptureQueriesContext(connection) as context:
+            assert token_client.get(url).status_code == status.HTTP_200_OK
+        assert len(auth_queries(context)) == 1
+
+        with CaptureQueriesContext(connection) as context:
+            assert token_client.get(url).status_code == status.HTTP_200_OK
+        assert auth_queries(context) == []
+
+    def test_invalid_token(self, token_client):
+        """Testa que token inexistente continua sendo rejeitado."""
+        token_client.credentials(HTTP_AUTHORIZATION="Token invalid")
+
+        response = token_client.get(reverse("post-feed"))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_logout_invalidates(self, token_client):
+        """Testa que o token deixa de valer logo após o logout."""
+        token_client.get(reverse("post-feed"))
+
+        response = token_client.post(reverse("auth-logout"))
+        assert response.status_code == status.HTTP_200_OK
+
+        response = token_client.get(reverse("post-feed"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_user_change_invalidates(self, token, token_client):
+        """Testa que desativar o usuário invalida a entrada em cache."""
+        token_client.get(reverse("post-feed"))
+
+        token.user.is_active = False
+        token.user.save()
+
+        response = token_client.get(reverse("post-feed"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_shared_backend(self, settings, token_client):
+        """Testa segundo nível compartilhado via CACHES."""
+        settings.AUTH_TOKEN_CACHE = {"BACKEND": "default"}
+        cache.clear()
+        token_client.get(reverse("post-feed"))
+
+        # Outro processo: memória vazia, encontra no cache compartilhado
+        token_cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            token_client.get(reverse("post-feed"))
+        assert auth_queries(context) == []
+
+        token_client.post(reverse("auth-logout"))
+        token_cache.clear()
+        response = token_client.get(reverse("post-feed"))
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        cache.clear()
+
+    def test_disabled(self, settings, token_client):
+        """Testa que, desativado, consulta o banco a cada requisição."""
+        settings.AUTH_TOKEN_CACHE = {"ENABLED": False}
+
+        for _ in range(2):
+            with CaptureQueriesContext(connection) as context:
+                token_client.get(reverse("post-feed"))
+            assert len(auth_queries(context)) == 1
+
+
+@pytest.mark.django_db
+class TestSignedTokens:
+    """Testes para os access tokens assinados e o refresh."""
+
+    @pytest.fixture(autouse=True)
+    def signed_mode(self, settings):
+        settings.SIGNED_TOKENS = {"ENABLED": True}
+        signed_tokens.revocations.clear()
+        yield
+        signed_tokens.revocations.clear()
+
+    @pytest.fixture
+    def credentials(self, api_client):
+        User.objects.create_user(username="testuser", password="testpass123")
+        response = api_client.post(
+            reverse("auth-login"),
+            {"username": "testuser", "password": "testpass123"},
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return response.data
+
+    @pytest.fixture
+    def api_client(self):
+        return APIClient()
+
+    def get_feed(self, client, access):
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+        return client.get(reverse("post-feed"))
+
+    def test_login_issues_signed_pair(self, credentials):
+        """Testa que o login emite access/refresh em vez do Token do banco."""
+        assert credentials["token_type"] == "Bearer"
+        assert {"access", "refresh", "expires_in"} <= set(credentials)
+        assert "token" not in credentials
+        assert not Token.objects.exists()
+        assert RefreshToken.objects.count() == 1
+
+    def test_register_issues_signed_pair(self, api_client):
+        """Testa que o registro também emite o par assinado."""
+        response = api_client.post(
+            reverse("auth-register"),
+            {
+                "username": "newuser",
+                "email": "new@example.com",
+                "password": "testpass123",
+                "password_confirm": "testpass123",
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert "access" in response.data
+
+    def test_access_token_without_queries(self, api_client, credentials):
+        """Testa que, com a lista de revogação carregada, autenticar não
+        consulta o banco."""
+        assert self.get_feed(api_client, credentials["access"]).status_code == 200
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.get_feed(api_client, credentials["access"])
+
+        assert response.status_code == status.HTTP_200_OK
+        tables = ("authtoken_token", "authentication_refreshtoken", "users_user")
+        assert not [
+            q
+            for q in context.captured_queries
+            if any(f'FROM "{table}"' in q["sql"] for table in tables)
+        ]
+
+    def test_invalid_and_expired_tokens(self, settings, api_client, credentials):
+        """Testa token adulterado e expirado."""
+        response = self.get_feed(api_client, credentials["access"] + "x")
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+        settings.SIGNED_TOKENS = {"ENABLED": True, "ACCESS_TOKEN_LIFETIME": -1}
+        response = self.get_feed(api_client, credentials["access"])
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_refresh_rotates(self, api_client, credentials):
+        """Testa que o refresh emite um novo par e invalida o refresh antigo."""
+        url = reverse("auth-refresh")
+        response = api_client.post(
+            url, {"refresh": credentials["refresh"]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["refresh"] != credentials["refresh"]
+        assert self.get_feed(api_client, response.data["access"]).status_code == 200
+
+        response = api_client.post(
+            url, {"refresh": credentials["refresh"]}, format="json"
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_logout_revokes_session(self, api_client, credentials):
+        """Testa que o logout derruba o access e o refresh token."""
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {credentials['access']}")
+        assert api_client.post(reverse("auth-logout")).status_code == 200
+
+        assert self.get_feed(api_client, credentials["access"]).status_code == 401
+        api_client.credentials()
+        response = api_client.post(
+            reverse("auth-refresh"), {"refresh": credentials["refresh"]}, format="json"
+        )
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_revocation_from_other_process(self, api_client, credentials):
+        """Testa que revogações gravadas por outro processo são recarregadas."""
+        assert self.get_feed(api_client, credentials["access"]).status_code == 200
+
+        RefreshToken.objects.update(revoked_at=timezone.now())
+        signed_tokens.revocations.clear()  # recarga vencida
+
+        assert self.get_feed(api_client, credentials["access"]).status_code == 401
+
+    def test_deactivated_user_is_revoked(self, api_client, credentials):
+        """Testa que desativar o usuário revoga as sessões."""
+        User.objects.filter(username="testuser").update(is_active=False)
+        user = User.objects.get(username="testuser")
+        user.save()
+
+        assert self.get_feed(api_client, credentials["access"]).status_code == 401
+
+    def test_deleted_user_is_revoked(self, api_client, credentials):
+        """Testa que remover o usuário revoga as sessões na hora."""
+        User.objects.filter(username="testuser").delete()
+
+        assert self.get_feed(api_client, credentials["access"]).status_code == 401
+
+    def test_deleted_user_in_other_process(self, api_client, credentials):
+        """
+        Testa 401 (e não 500) quando a view usa o usuário removido em outro
+        processo, cuja revogação este processo não viu.
+        """
+        User.objects.filter(username="testuser").delete()
+        signed_tokens.revocations.clear()
+        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {credentials['access']}")
+
+        response = api_client.post(reverse("post-list"), {"content": "Post"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
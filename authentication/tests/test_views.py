@@ -2,13 +2,22 @@
 Testes para as views de autenticação.
 """
 
+import json
+import threading
+
 from django.contrib.auth import get_user_model
+from django.test import AsyncRequestFactory
 from django.urls import reverse
 
 import pytest
+from asgiref.sync import async_to_sync
 from rest_framework import status
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APIClient
 
+from authentication.services import password_pool
+from authentication.views import AsyncLoginView, AsyncRegisterView
+
 User = get_user_model()
 
 
@@ -167,3 +176,108 @@ class TestLogoutView:
         response = api_client.post(url)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.fixture
+def pool(settings):
+    """Pool de hashing recriado com as configurações do teste."""
+    password_pool.pool.shutdown()
+    yield password_pool.pool
+    password_pool.pool.shutdown()
+
+
+def post_async(view_class, data):
+    """Executa a view assíncrona com um POST JSON."""
+    request = AsyncRequestFactory().post(
+        "/", data=json.dumps(data), content_type="application/json"
+    )
+    return async_to_sync(view_class.as_view())(request)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncAuthViews:
+    """Testes para as views assíncronas de login/registro."""
+
+    def test_register_and_login(self, pool, user_data):
+        """Testa registro e login com o hashing no pool."""
+        response = post_async(AsyncRegisterView, user_data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        body = json.loads(response.content)
+        assert body["user"]["username"] == "testuser"
+        assert Token.objects.get(user__username="testuser").key == body["token"]
+
+        response = post_async(
+            AsyncLoginView, {"username": "testuser", "password": "testpass123"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert json.loads(response.content)["token"] == body["token"]
+
+    def test_invalid_data(self, pool, user_data):
+        """Testa erros de validação e JSON inválido."""
+        response = post_async(
+            AsyncLoginView, {"username": "testuser", "password": "wrong"}
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        user_data["password_confirm"] = "different"
+        response = post_async(AsyncRegisterView, user_data)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "password_confirm" in json.loads(response.content)
+
+        response = post_async(AsyncLoginView, ["not", "an", "object"])
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_throttled_per_ip(self, settings, pool):
+        """Testa o limite por IP do login antes de usar o pool."""
+        settings.THROTTLE_BUCKETS = {
+            "ENABLED": True,
+            "USER_RATES": {"default": None},
+            "IP_RATES": {"default": None, "auth.login": "1/min"},
+        }
+        data = {"username": "testuser", "password": "wrong"}
+
+        assert post_async(AsyncLoginView, data).status_code == 400
+        response = post_async(AsyncLoginView, data)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response["Retry-After"] == "60"
+        # O registro tem o próprio escopo (sem limite aqui)
+        assert post_async(AsyncRegisterView, {}).status_code == 400
+
+    def test_saturated_pool(self, settings, pool):
+        """Testa 429 quando threads e fila estão ocupadas."""
+        settings.PASSWORD_HASHING_POOL = {"MAX_WORKERS": 1, "MAX_QUEUE": 0}
+        release = threading.Event()
+        busy = pool.submit(release.wait)
+        try:
+            response = post_async(
+                AsyncLoginView, {"username": "testuser", "password": "testpass123"}
+            )
+        finally:
+            release.set()
+            busy.result()
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response["Retry-After"] == "1"
+
+
+class TestPasswordPool:
+    """Testes para o pool limitado de hashing."""
+
+    def test_queue_limit(self, settings, pool):
+        """Testa que tarefas acima de MAX_WORKERS + MAX_QUEUE são recusadas."""
+        settings.PASSWORD_HASHING_POOL = {"MAX_WORKERS": 1, "MAX_QUEUE": 1}
+        release = threading.Event()
+        running = pool.submit(release.wait)
+        queued = pool.submit(lambda: "done")
+
+        with pytest.raises(password_pool.PoolSaturated):
+            pool.submit(lambda: "rejected")
+
+        release.set()
+        running.result()
+        assert queued.result() == "done"
+        # Vagas liberadas ao concluir
+        assert pool.submit(lambda: "again").result() == "again"
@@ -2,12 +2,30 @@
 Authentication URLs.
 """
 
+from django.conf import settings
 from django.urls import path
 
-from authentication.views import LoginView, LogoutView, RegisterView
+from authentication.views import (
+    AsyncLoginView,
+    AsyncRegisterView,
+    LoginView,
+    LogoutView,
+    RefreshView,
+    RegisterView,
+)
+
+# Via ASGI (config/asgi.py), login e registro usam as views assíncronas,
+# com o hashing de senha no pool limitado
+if settings.ASYNC_AUTH_VIEWS:
+    register_view = AsyncRegisterView.as_view()
+    login_view = AsyncLoginView.as_view()
+else:
+    register_view = RegisterView.as_view()
+    login_view = LoginView.as_view()
 
 urlpatterns = [
-    path("register/", RegisterView.as_view(), name="auth-register"),
-    path("login/", LoginView.as_view(), name="auth-login"),
+    path("register/", register_view, name="auth-register"),
+    path("login/", login_view, name="auth-login"),
     path("logout/", LogoutView.as_view(), name="auth-logout"),
+    path("refresh/", RefreshView.as_view(), name="auth-refresh"),
 ]
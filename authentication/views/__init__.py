@@ -2,12 +2,18 @@
 Authentication views package.
 """
 
+from .async_login_view import AsyncLoginView
+from .async_register_view import AsyncRegisterView
 from .login_view import LoginView
 from .logout_view import LogoutView
+from .refresh_view import RefreshView
 from .register_view import RegisterView
 
 __all__ = [
     "RegisterView",
     "LoginView",
     "LogoutView",
+    "RefreshView",
+    "AsyncLoginView",
+    "AsyncRegisterView",
 ]
@@ -0,0 +1,99 @@
+"""
+Async auth view.
+"""
+
+import math
+
+from django.http import HttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+import orjson
+from asgiref.sync import sync_to_async
+
+from authentication.services import credentials
+from authentication.services.password_pool import PoolSaturated, pool
+from core.renderers import FastJSONRenderer
+from core.throttling import IPTokenBucketThrottle
+from users.serializers import UserSerializer
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class AsyncAuthView(View):
+    """
+    Base das views assíncronas de login/registro (usadas via ASGI).
+
+    Recebem JSON, validam com os mesmos serializers das views DRF e rodam o
+    hashing da senha no pool limitado (``password_pool``), sem ocupar o
+    event loop nem uma thread de request. Como não passam pelo DRF, aplicam
+    o mesmo limite por IP (``throttle_scope``) antes do pool. Limite
+    atingido ou pool saturado respondem 429 com ``Retry-After``. As
+    respostas têm o mesmo formato das views DRF.
+    """
+
+    http_method_names = ["post", "options"]
+    serializer_class = None
+    throttle_scope = None
+    success_status = 200
+    retry_after = 1
+
+    async def post(self, request, *args, **kwargs):
+        throttle = IPTokenBucketThrottle()
+        if not throttle.allow_request(request, self):
+            return self.too_many_requests(
+                "Limite de requisições atingido, tente novamente mais tarde.",
+                math.ceil(throttle.wait()),
+            )
+
+        try:
+            data = orjson.loads(request.body or b"{}")
+        except orjson.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict):
+            return self.render({"detail": "JSON inválido."}, status=400)
+
+        serializer = self.serializer_class(data=data, context={"request": request})
+        try:
+            user = await self.get_user(serializer)
+        except PoolSaturated:
+            return self.too_many_requests(
+                "Servidor ocupado, tente novamente em instantes.", self.retry_after
+            )
+
+        if user is None:
+            return self.render(serializer.errors, status=400)
+
+        payload = await sync_to_async(self.get_payload)(user)
+        return self.render(payload, status=self.success_status)
+
+    async def get_user(self, serializer):
+        """
+        Valida o serializer e retorna o usuário (None se inválido).
+
+        Padrão: ``is_valid()`` inteiro no pool (ex.: ``authenticate()`` do
+        login) e o usuário em ``validated_data["user"]``.
+        """
+        if not await self.run_in_pool(serializer.is_valid):
+            return None
+        return serializer.validated_data["user"]
+
+    def get_payload(self, user):
+        """Dados do usuário + token (ou par access/refresh)."""
+        return {"user": UserSerializer(user).data, **credentials.issue(user)}
+
+    def render(self, data, status):
+        return HttpResponse(
+            FastJSONRenderer().render(data),
+            status=status,
+            content_type="application/json",
+        )
+
+    def too_many_requests(self, detail, retry_after):
+        response = self.render({"detail": detail}, status=429)
+        response["Retry-After"] = str(retry_after)
+        return response
+
+    async def run_in_pool(self, fn, *args):
+        """Executa ``fn`` no pool de hashing (PoolSaturated se cheio)."""
+        return await pool.run(fn, *args)
@@ -0,0 +1,17 @@
+"""
+Async login view.
+"""
+
+from authentication.serializers import LoginSerializer
+from authentication.views.async_auth_view import AsyncAuthView
+
+
+class AsyncLoginView(AsyncAuthView):
+    """
+    Versão assíncrona do LoginView.
+
+    POST /api/auth/login/ (com ``ASYNC_AUTH_VIEWS``, padrão via ASGI)
+    """
+
+    serializer_class = LoginSerializer
+    throttle_scope = "auth.login"
@@ -0,0 +1,27 @@
+"""
+Async register view.
+"""
+
+from asgiref.sync import sync_to_async
+
+from authentication.serializers import RegisterSerializer
+from authentication.views.async_auth_view import AsyncAuthView
+
+
+class AsyncRegisterView(AsyncAuthView):
+    """
+    Versão assíncrona do RegisterView.
+
+    POST /api/auth/register/ (com ``ASYNC_AUTH_VIEWS``, padrão via ASGI)
+    """
+
+    serializer_class = RegisterSerializer
+    throttle_scope = "auth.register"
+    success_status = 201
+
+    async def get_user(self, serializer):
+        # Validações (consultas de unicidade) fora do pool; só create_user()
+        # (PBKDF2 + INSERT) ocupa uma vaga
+        if not await sync_to_async(serializer.is_valid)():
+            return None
+        return await self.run_in_pool(serializer.save)
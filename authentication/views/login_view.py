@@ -3,11 +3,11 @@ Login view.
 """
 
 from rest_framework import generics, status
-from rest_framework.authtoken.models import Token
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from authentication.serializers import LoginSerializer
+from authentication.services import credentials
 from users.serializers import UserSerializer
 
 
@@ -20,21 +20,19 @@ class LoginView(generics.GenericAPIView):
 
     serializer_class = LoginSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "auth.login"
 
     def post(self, request, *args, **kwargs):
-        """Valida credenciais e retorna token."""
+        """Valida credenciais e retorna token (ou par access/refresh)."""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         user = serializer.validated_data["user"]
 
-        # Obter ou criar token
-        token, created = Token.objects.get_or_create(user=user)
-
-        # Retornar dados do usuário + token
+        # Retornar dados do usuário + token (ou par access/refresh)
         user_serializer = UserSerializer(user)
 
         return Response(
-            {"user": user_serializer.data, "token": token.key},
+            {"user": user_serializer.data, **credentials.issue(user)},
             status=status.HTTP_200_OK,
         )
@@ -8,6 +8,8 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from authentication.services import signed_tokens, token_cache
+
 
 class LogoutView(APIView):
     """
@@ -19,9 +21,17 @@ class LogoutView(APIView):
     permission_classes = [IsAuthenticated]
 
     def post(self, request):
-        """Deleta o token do usuário."""
-        # Deletar token do usuário (se existir)
-        Token.objects.filter(user=request.user).delete()
+        """Deleta o token do usuário (ou revoga a sessão do token assinado)."""
+        if isinstance(request.auth, dict):
+            # Payload de access token assinado: revogar a sessão
+            signed_tokens.revoke([request.auth["s"]])
+
+        tokens = Token.objects.filter(user_id=request.user.pk)
+        keys = list(tokens.values_list("key", flat=True))
+
+        # Deletar token do usuário (se existir) e removê-lo do cache na hora
+        tokens.delete()
+        token_cache.invalidate(keys)
 
         return Response(
             {"detail": "Logout realizado com sucesso."}, status=status.HTTP_200_OK
@@ -0,0 +1,33 @@
+"""
+Refresh view.
+"""
+
+from rest_framework import generics, status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from authentication.serializers import RefreshSerializer
+from authentication.services import signed_tokens
+
+
+class RefreshView(generics.GenericAPIView):
+    """
+    View para renovar o access token assinado.
+
+    POST /api/auth/refresh/
+    """
+
+    serializer_class = RefreshSerializer
+    permission_classes = [AllowAny]
+
+    def post(self, request, *args, **kwargs):
+        """Troca o refresh token por um novo par access/refresh."""
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        credentials = signed_tokens.refresh(serializer.validated_data["refresh"])
+        if credentials is None:
+            raise AuthenticationFailed("Refresh token inválido, expirado ou revogado.")
+
+        return Response(credentials, status=status.HTTP_200_OK)
@@ -3,11 +3,11 @@ Register view.
 """
 
 from rest_framework import generics, status
-from rest_framework.authtoken.models import Token
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 
 from authentication.serializers import RegisterSerializer
+from authentication.services import credentials
 from users.serializers import UserSerializer
 
 
@@ -20,21 +20,19 @@ class RegisterView(generics.GenericAPIView):
 
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
+    throttle_scope = "auth.register"
 
     def post(self, request, *args, **kwargs):
-        """Cria novo usuário e retorna token."""
+        """Cria novo usuário e retorna token (ou par access/refresh)."""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         user = serializer.save()
 
-        # Criar token para o usuário
-        token, created = Token.objects.get_or_create(user=user)
-
-        # Retornar dados do usuário + token
+        # Retornar dados do usuário + token (ou par access/refresh)
         user_serializer = UserSerializer(user)
 
         return Response(
-            {"user": user_serializer.data, "token": token.key},
+            {"user": user_serializer.data, **credentials.issue(user)},
             status=status.HTTP_201_CREATED,
         )
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# Login/registro assíncronos, com o hashing de senha em um pool limitado
+os.environ.setdefault("ASYNC_AUTH_VIEWS", "True")
 
 application = get_asgi_application()
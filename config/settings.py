@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 import os
 from pathlib import Path
 
+from core.conf import from_env
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -48,6 +50,7 @@ INSTALLED_APPS = [
     "rest_framework.authtoken",
     "corsheaders",
     # Local apps
+    "core",
     "authentication",
     "users",
     "posts",
@@ -57,14 +60,25 @@ MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    # Sessão, CSRF, mensagens e X-Frame-Options são pulados nas requisições
+    # para /api/ com header Authorization (LEAN_API_MIDDLEWARE)
+    "core.middleware.LeanSessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
-    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.LeanCsrfViewMiddleware",
+    "core.middleware.LeanAuthenticationMiddleware",
+    "core.middleware.LeanMessageMiddleware",
+    "core.middleware.LeanXFrameOptionsMiddleware",
 ]
 
+# Os settings em dict abaixo só trazem o que vem de variáveis de ambiente;
+# os padrões de cada um ficam em core/conf/defaults.py
+
+# Requisições com header Authorization nos PREFIXES pulam os middlewares de
+# sessão acima (o admin continua com a cadeia completa)
+LEAN_API_MIDDLEWARE = from_env(
+    "LEAN_API_MIDDLEWARE", ENABLED="LEAN_API_MIDDLEWARE_ENABLED"
+)
+
 ROOT_URLCONF = "config.urls"
 
 TEMPLATES = [
@@ -165,10 +179,108 @@ REST_FRAMEWORK = {
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 10,
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "authentication.backends.CachedTokenAuthentication",
+        "authentication.backends.SignedTokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
+    # JSON via orjson (mesma saída do JSONRenderer) e MessagePack opcional,
+    # escolhido pelo header Accept / Content-Type
+    "DEFAULT_RENDERER_CLASSES": [
+        "core.renderers.FastJSONRenderer",
+        "core.renderers.MessagePackRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "core.parsers.FastJSONParser",
+        "core.parsers.MessagePackParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    # Token bucket por usuário e por IP em cada ação (THROTTLE_BUCKETS)
+    "DEFAULT_THROTTLE_CLASSES": [
+        "core.throttling.UserTokenBucketThrottle",
+        "core.throttling.IPTokenBucketThrottle",
+    ],
+    # Proxies reversos confiáveis na frente da aplicação: o IP do cliente
+    # vem do X-Forwarded-For apenas com NUM_PROXIES > 0 (senão REMOTE_ADDR)
+    "NUM_PROXIES": int(os.environ.get("NUM_PROXIES", "0")),
 }
+
+# Timeline materializada (fan-out on write)
+# Quantidade de posts copiados para a timeline ao seguir um usuário
+TIMELINE_BACKFILL_SIZE = int(os.environ.get("TIMELINE_BACKFILL_SIZE", "200"))
+
+# Buffer de contadores de Post (curtidas/comentários)
+# Quando ativo, deltas são agregados em memória e gravados em lote (na
+# escrita vencida e por uma thread a cada FLUSH_INTERVAL segundos)
+POST_COUNTERS_BUFFER = from_env(
+    "POST_COUNTERS_BUFFER",
+    ENABLED="POST_COUNTERS_BUFFER_ENABLED",
+    FLUSH_INTERVAL="POST_COUNTERS_FLUSH_INTERVAL",
+    MAX_PENDING="POST_COUNTERS_MAX_PENDING",
+)
+
+# Cache de fragmentos serializados de Post (chave: id + updated_at)
+# BACKEND: alias em CACHES para compartilhar entre processos (vazio = memória)
+POST_FRAGMENT_CACHE = from_env(
+    "FRAGMENT_CACHE",
+    ENABLED="POST_FRAGMENT_CACHE_ENABLED",
+    MAX_SIZE="POST_FRAGMENT_CACHE_MAX_SIZE",
+    BACKEND="POST_FRAGMENT_CACHE_BACKEND",
+    TIMEOUT="POST_FRAGMENT_CACHE_TIMEOUT",
+)
+
+# Grafo social compacto em memória (por processo), carregado de Follow
+# MAX_AGE: segundos até recarregar do banco (follows feitos em outros workers)
+SOCIAL_GRAPH = from_env(
+    "SOCIAL_GRAPH",
+    ENABLED="SOCIAL_GRAPH_ENABLED",
+    MAX_AGE="SOCIAL_GRAPH_MAX_AGE",
+    COMPACT_THRESHOLD="SOCIAL_GRAPH_COMPACT_THRESHOLD",
+)
+
+# Cache de tokens de autenticação já validados (token -> usuário)
+# TIMEOUT: segundos que um token revogado em outro processo ainda é aceito
+# BACKEND: alias em CACHES para compartilhar entre processos (vazio = memória)
+AUTH_TOKEN_CACHE = from_env(
+    "AUTH_TOKEN_CACHE",
+    ENABLED="AUTH_TOKEN_CACHE_ENABLED",
+    MAX_SIZE="AUTH_TOKEN_CACHE_MAX_SIZE",
+    BACKEND="AUTH_TOKEN_CACHE_BACKEND",
+    TIMEOUT="AUTH_TOKEN_CACHE_TIMEOUT",
+)
+
+# Access tokens assinados (HMAC, sem consulta ao banco) + refresh tokens,
+# emitidos por login/registro no lugar do Token do banco quando ENABLED
+SIGNED_TOKENS = from_env(
+    "SIGNED_TOKENS",
+    ENABLED="SIGNED_TOKENS_ENABLED",
+    ACCESS_TOKEN_LIFETIME="SIGNED_TOKENS_ACCESS_LIFETIME",
+    REFRESH_TOKEN_LIFETIME="SIGNED_TOKENS_REFRESH_LIFETIME",
+    REVOCATION_REFRESH_INTERVAL="SIGNED_TOKENS_REVOCATION_REFRESH_INTERVAL",
+)
+
+# Login/registro assíncronos (padrão ao servir via config/asgi.py), com o
+# hashing de senha em um pool de MAX_WORKERS threads e até MAX_QUEUE tarefas
+# aguardando; acima disso, 429
+ASYNC_AUTH_VIEWS = os.environ.get("ASYNC_AUTH_VIEWS", "False") == "True"
+PASSWORD_HASHING_POOL = from_env(
+    "PASSWORD_HASHING_POOL",
+    MAX_WORKERS="PASSWORD_HASHING_MAX_WORKERS",
+    MAX_QUEUE="PASSWORD_HASHING_MAX_QUEUE",
+)
+
+# Limites de requisições (token bucket) por escopo "<basename>.<action>";
+# "default" vale para os demais. Baldes em memória, por processo
+THROTTLE_BUCKETS = from_env(
+    "THROTTLE_BUCKETS",
+    ENABLED="THROTTLE_ENABLED",
+    USER_RATES={"default": "THROTTLE_USER_RATE"},
+    IP_RATES={"default": "THROTTLE_IP_RATE"},
+)
+
+# Sugestões de quem seguir guardadas por usuário (comando refresh_suggestions)
+SUGGESTIONS_TOP_K = int(os.environ.get("SUGGESTIONS_TOP_K", "20"))
@@ -0,0 +1,15 @@
+"""
+Fixtures compartilhadas pelos testes de todos os apps.
+"""
+
+import pytest
+
+from core.throttling import token_bucket
+
+
+@pytest.fixture(autouse=True)
+def clear_throttle_buckets():
+    """Cada teste começa com os baldes de rate limit cheios."""
+    token_bucket.store.clear()
+    yield
+    token_bucket.store.clear()
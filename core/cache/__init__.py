@@ -0,0 +1,8 @@
+"""
+Core cache package.
+"""
+
+from .fragment_cache import FragmentCache, LRUCache
+from .ttl_cache import TTLCache
+
+__all__ = ["FragmentCache", "LRUCache", "TTLCache"]
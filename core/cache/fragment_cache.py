@@ -0,0 +1,113 @@
+"""
+Fragment cache - Cache de representações já serializadas.
+
+Dois níveis: um LRU limitado em memória (por processo) e, opcionalmente,
+um cache compartilhado do Django (``CACHES``) entre processos/servidores.
+As chaves devem carregar a versão do objeto (ex.: ``updated_at``), então
+uma edição gera uma chave nova e a entrada antiga apenas expira.
+"""
+
+import threading
+from collections import OrderedDict
+
+from django.core.cache import caches
+
+from core.conf import DEFAULTS, app_settings
+
+
+class LRUCache:
+    """Dicionário limitado que descarta as entradas usadas há mais tempo."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def get_many(self, keys):
+        """Retorna as chaves encontradas, marcando-as como recentes."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                if key in self._data:
+                    self._data.move_to_end(key)
+                    found[key] = self._data[key]
+        return found
+
+    def set_many(self, mapping):
+        """Grava as entradas, descartando as mais antigas acima do limite."""
+        with self._lock:
+            self._data.update(mapping)
+            for key in mapping:
+                self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def delete_many(self, keys):
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class FragmentCache:
+    """
+    Cache de fragmentos configurado por um dict em settings.
+
+    ``settings_name`` é o nome do setting (ex.: ``POST_FRAGMENT_CACHE``),
+    com os padrões em ``core.conf.DEFAULTS["FRAGMENT_CACHE"]``. Leituras e
+    gravações são sempre em lote para que uma página inteira custe um
+    acesso ao backend.
+    """
+
+    def __init__(self, settings_name):
+        self.settings_name = settings_name
+        self.local = LRUCache(DEFAULTS["FRAGMENT_CACHE"]["MAX_SIZE"])
+
+    @property
+    def options(self):
+        return app_settings(self.settings_name, defaults="FRAGMENT_CACHE")
+
+    @property
+    def enabled(self):
+        return self.options["ENABLED"]
+
+    def get_many(self, keys):
+        """Busca no LRU e, para as faltas, no cache compartilhado."""
+        found = self.local.get_many(keys)
+        backend = self.options["BACKEND"]
+        missing = [key for key in keys if key not in found]
+        if backend and missing:
+            shared = caches[backend].get_many(missing)
+            if shared:
+                self._set_local(shared)
+                found.update(shared)
+        return found
+
+    def get(self, key):
+        return self.get_many([key]).get(key)
+
+    def set_many(self, mapping):
+        """Grava nos dois níveis."""
+        if not mapping:
+            return
+        options = self.options
+        self._set_local(mapping)
+        if options["BACKEND"]:
+            caches[options["BACKEND"]].set_many(mapping, timeout=options["TIMEOUT"])
+
+    def set(self, key, value):
+        self.set_many({key: value})
+
+    def clear(self):
+        """Limpa apenas o nível em memória deste processo."""
+        self.local.clear()
+
+    def _set_local(self, mapping):
+        self.local.max_size = self.options["MAX_SIZE"]
+        self.local.set_many(mapping)
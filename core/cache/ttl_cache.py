@@ -0,0 +1,38 @@
+"""
+TTL cache - LRU limitado em memória com expiração por entrada.
+"""
+
+import time
+
+from core.cache.fragment_cache import LRUCache
+
+
+class TTLCache(LRUCache):
+    """
+    LRUCache cujas entradas expiram ``timeout`` segundos após gravadas.
+
+    Usado quando o valor pode mudar em outro processo sem que este seja
+    avisado: o timeout limita por quanto tempo uma entrada pode ficar
+    desatualizada.
+    """
+
+    def __init__(self, max_size, timeout):
+        super().__init__(max_size)
+        self.timeout = timeout
+
+    def get_many(self, keys):
+        now = time.monotonic()
+        found = {}
+        expired = []
+        for key, (expires, value) in super().get_many(keys).items():
+            if expires > now:
+                found[key] = value
+            else:
+                expired.append(key)
+        if expired:
+            self.delete_many(expired)
+        return found
+
+    def set_many(self, mapping):
+        expires = time.monotonic() + self.timeout
+        super().set_many({key: (expires, value) for key, value in mapping.items()})
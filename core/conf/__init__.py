@@ -0,0 +1,8 @@
+"""
+Core conf package.
+"""
+
+from .app_settings import app_settings, from_env
+from .defaults import DEFAULTS
+
+__all__ = ["DEFAULTS", "app_settings", "from_env"]
@@ -0,0 +1,55 @@
+"""
+App settings - Leitura dos settings em dict com os padrões do projeto.
+"""
+
+import os
+
+from django.conf import settings
+
+from core.conf.defaults import DEFAULTS
+
+
+def app_settings(name, defaults=None):
+    """
+    Retorna o setting ``name`` (dict) mesclado com ``DEFAULTS[defaults]``
+    (por padrão, ``DEFAULTS[name]``).
+
+    Lido a cada chamada, então ``override_settings`` vale na hora. A
+    mescla é rasa: um dict aninhado no settings substitui o padrão inteiro.
+    """
+    return {**DEFAULTS[defaults or name], **getattr(settings, name, {})}
+
+
+def _cast(value, default):
+    """Converte a variável de ambiente para o tipo do valor padrão."""
+    if isinstance(default, bool):
+        return value == "True"
+    if isinstance(default, (int, float)):
+        return type(default)(value)
+    return value or None
+
+
+def _read(defaults, variables):
+    values = {}
+    for key, variable in variables.items():
+        default = defaults[key]
+        if isinstance(variable, dict):
+            nested = _read(default, variable)
+            if nested:
+                values[key] = {**default, **nested}
+        elif variable in os.environ:
+            values[key] = _cast(os.environ[variable], default)
+    return values
+
+
+def from_env(name, **variables):
+    """
+    Valores de um setting com os padrões ``DEFAULTS[name]`` lidos de
+    variáveis de ambiente, para uso em ``config/settings.py``.
+
+    ``variables`` mapeia cada chave para o nome da variável (ou, em dicts
+    aninhados, para outro mapeamento). Só as variáveis definidas entram no
+    resultado, convertidas para o tipo do padrão; as demais chaves ficam
+    com ``DEFAULTS``.
+    """
+    return _read(DEFAULTS[name], variables)
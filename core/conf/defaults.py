@@ -0,0 +1,96 @@
+"""
+Defaults - Valores padrão dos settings em dict do projeto.
+
+Único lugar com os padrões: ``app_settings(nome)`` mescla o dict do
+settings com estes valores, e ``config/settings.py`` só define o que vem
+de variáveis de ambiente (``from_env``).
+"""
+
+import os
+
+DEFAULTS = {
+    # Requisições com header Authorization que pulam os middlewares de
+    # sessão, CSRF, mensagens e X-Frame-Options (core.middleware)
+    "LEAN_API_MIDDLEWARE": {
+        "ENABLED": True,
+        # Prefixos de caminho atendidos só por autenticação via header
+        "PREFIXES": ["/api/"],
+    },
+    # Buffer de contadores de Post (posts.services.counters)
+    "POST_COUNTERS_BUFFER": {
+        "ENABLED": False,
+        # Intervalo máximo (segundos) entre duas gravações do buffer
+        "FLUSH_INTERVAL": 2.0,
+        # Quantidade de contadores pendentes que força a gravação antecipada
+        "MAX_PENDING": 1000,
+    },
+    # Padrões de todo FragmentCache (core.cache), ex.: POST_FRAGMENT_CACHE
+    "FRAGMENT_CACHE": {
+        "ENABLED": True,
+        # Entradas mantidas no LRU em memória de cada processo
+        "MAX_SIZE": 10000,
+        # Alias em CACHES usado como segundo nível (None = apenas memória)
+        "BACKEND": None,
+        # Expiração (segundos) das entradas no cache compartilhado
+        "TIMEOUT": 3600,
+    },
+    # Grafo social em memória (users.services.graph)
+    "SOCIAL_GRAPH": {
+        "ENABLED": False,
+        # Idade máxima (segundos) do grafo antes de recarregar do banco
+        "MAX_AGE": 300,
+        # Alterações acumuladas no overlay antes de reconstruir os arrays
+        "COMPACT_THRESHOLD": 10000,
+    },
+    # Cache de tokens já validados (authentication.services.token_cache)
+    "AUTH_TOKEN_CACHE": {
+        "ENABLED": True,
+        # Tokens mantidos em memória em cada processo
+        "MAX_SIZE": 10000,
+        # Alias em CACHES usado como segundo nível (None = apenas memória)
+        "BACKEND": None,
+        # Expiração (segundos) das entradas nos dois níveis; limita por
+        # quanto tempo um token revogado em outro processo ainda é aceito
+        "TIMEOUT": 60,
+    },
+    # Access tokens assinados + refresh tokens
+    # (authentication.services.signed_tokens)
+    "SIGNED_TOKENS": {
+        "ENABLED": False,
+        # Validade (segundos) do access token
+        "ACCESS_TOKEN_LIFETIME": 300,
+        # Validade (segundos) do refresh token, renovada a cada refresh
+        "REFRESH_TOKEN_LIFETIME": 14 * 24 * 3600,
+        # Intervalo (segundos) entre recargas da lista de revogação
+        "REVOCATION_REFRESH_INTERVAL": 10,
+    },
+    # Pool do hashing de senhas das views assíncronas
+    # (authentication.services.password_pool)
+    "PASSWORD_HASHING_POOL": {
+        # Threads calculando hashes ao mesmo tempo
+        "MAX_WORKERS": max(1, (os.cpu_count() or 2) // 2),
+        # Tarefas aguardando uma thread livre antes de recusar
+        "MAX_QUEUE": 64,
+    },
+    # Limites de requisições por token bucket (core.throttling)
+    "THROTTLE_BUCKETS": {
+        "ENABLED": True,
+        # Taxas por escopo "<basename>.<action>" (ex.: "post.feed"); "default"
+        # vale para os escopos não listados. None desliga o limite do escopo.
+        "USER_RATES": {
+            "default": "1000/min",
+            "post.feed": "120/min",
+            "post.like": "60/min",
+            "like.create": "60/min",
+            "comment.create": "30/min",
+            "user.follow": "60/min",
+            "follow.create": "60/min",
+            "follow.bulk": "10/min",
+        },
+        "IP_RATES": {
+            "default": "2000/min",
+            "auth.login": "30/min",
+            "auth.register": "10/min",
+        },
+    },
+}
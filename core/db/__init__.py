@@ -0,0 +1,21 @@
+"""
+Core db package.
+"""
+
+from .counter_fields import CounterFieldsMixin
+from .pks import to_pk
+from .unique_writes import (
+    delete_existing,
+    delete_returning,
+    insert_ignore,
+    insert_ignore_many,
+)
+
+__all__ = [
+    "CounterFieldsMixin",
+    "delete_existing",
+    "delete_returning",
+    "insert_ignore",
+    "insert_ignore_many",
+    "to_pk",
+]
@@ -0,0 +1,31 @@
+"""
+Counter fields - Contadores desnormalizados preservados em ``save()``.
+"""
+
+
+class CounterFieldsMixin:
+    """
+    Mixin de model que não regrava os contadores em ``save()`` de update.
+
+    Os contadores (``counter_fields``) são mantidos só por UPDATEs com F()
+    e pelo buffer de contadores. Um ``save()`` completo (ex.: PATCH pela
+    API, admin) regravaria os valores lidos antes, desfazendo curtidas ou
+    follows gravados no intervalo; por isso o update usa ``update_fields``
+    com todos os campos concretos, exceto os contadores.
+    """
+
+    counter_fields = ()
+
+    def save(self, *args, **kwargs):
+        if (
+            not self._state.adding
+            and not args
+            and kwargs.get("update_fields") is None
+            and not kwargs.get("force_insert")
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.counter_fields
+            ]
+        super().save(*args, **kwargs)
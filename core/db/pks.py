@@ -0,0 +1,22 @@
+"""
+Pks - Conversão de IDs vindos da URL/query string.
+"""
+
+from django.db import connections, router
+
+
+def to_pk(model, value):
+    """
+    Converte ``value`` em pk de ``model``.
+
+    ``ValueError`` se não for inteiro ou estiver fora da faixa da coluna no
+    banco (ex.: BigAutoField, 64 bits com sinal): IDs fora da faixa não
+    existem e estouram o driver (OverflowError) se chegarem à consulta.
+    """
+    pk = int(value)
+    field = model._meta.pk
+    connection = connections[router.db_for_read(model)]
+    low, high = connection.ops.integer_field_range(field.get_internal_type())
+    if (low is not None and pk < low) or (high is not None and pk > high):
+        raise ValueError(f"ID fora da faixa: {pk}")
+    return pk
@@ -0,0 +1,190 @@
+"""
+Escritas idempotentes apoiadas nas constraints únicas do banco.
+
+Em vez de consultar ``exists()`` e depois inserir (duas idas ao banco e
+uma janela para requisições concorrentes colidirem), a escrita é um único
+statement e quem decide se a linha já existia é a constraint:
+
+- ``insert_ignore``: ``INSERT ... SELECT ... WHERE EXISTS(FKs)
+  ON CONFLICT DO NOTHING RETURNING pk`` (PostgreSQL e SQLite >= 3.35)
+- ``insert_ignore_many``: o mesmo em lote, ``INSERT ... VALUES ...
+  ON CONFLICT DO NOTHING RETURNING``, sem signals
+- ``delete_returning``/``delete_existing``: ``DELETE ... WHERE ...
+  RETURNING``, com as linhas que este statement de fato removeu
+
+Os signals ``post_save``/``post_delete`` só são enviados quando a linha foi
+de fato inserida/removida, então contadores e demais efeitos mantidos por
+receivers continuam corretos mesmo com requisições duplicadas simultâneas.
+O ``QuerySet.delete()`` do Django não serve aqui: o Collector faz SELECT e
+depois DELETE, e envia ``post_delete`` para todas as linhas selecionadas,
+inclusive as que uma requisição concorrente removeu no intervalo.
+"""
+
+from django.db import connections, router, transaction
+from django.db.models.signals import post_delete, post_save
+
+
+def insert_ignore(model, **values):
+    """
+    Insere uma linha de ``model`` se nenhuma constraint única conflitar.
+
+    Chaves estrangeiras inexistentes também resultam em nenhuma linha
+    (em vez de erro no commit). Retorna a instância criada ou None.
+    """
+    instance = model(**values)
+    alias = router.db_for_write(model, instance=instance)
+    connection = connections[alias]
+    quote = connection.ops.quote_name
+    meta = model._meta
+
+    columns, params, conditions = [], [], []
+    for field in meta.concrete_fields:
+        if field.primary_key:
+            continue
+        value = field.pre_save(instance, add=True)
+        columns.append(quote(field.column))
+        params.append(field.get_db_prep_save(value, connection))
+
+    condition_params = []
+    for field in meta.concrete_fields:
+        if not field.many_to_one:
+            continue
+        target = field.target_field
+        conditions.append(
+            f"EXISTS (SELECT 1 FROM {quote(target.model._meta.db_table)} "
+            f"WHERE {quote(target.column)} = %s)"
+        )
+        condition_params.append(getattr(instance, field.attname))
+
+    sql = (
+        f"INSERT INTO {quote(meta.db_table)} ({', '.join(columns)}) "
+        f"SELECT {', '.join(['%s'] * len(columns))} "
+        f"WHERE {' AND '.join(conditions) or '1 = 1'} "
+        f"ON CONFLICT DO NOTHING RETURNING {quote(meta.pk.column)}"
+    )
+
+    with transaction.atomic(using=alias):
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params + condition_params)
+            row = cursor.fetchone()
+        if row is None:
+            return None
+
+        instance.pk = row[0]
+        instance._state.adding = False
+        instance._state.db = alias
+        post_save.send(
+            sender=model,
+            instance=instance,
+            created=True,
+            update_fields=None,
+            raw=False,
+            using=alias,
+        )
+    return instance
+
+
+def insert_ignore_many(model, instances):
+    """
+    Insere ``instances`` em um único statement, ignorando as que conflitam
+    com uma constraint única, sem enviar signals.
+
+    As chaves estrangeiras não são verificadas (cabe a quem chama). Retorna
+    as linhas de fato inseridas por este statement, como novas instâncias.
+    """
+    instances = list(instances)
+    if not instances:
+        return []
+
+    alias = router.db_for_write(model, instance=instances[0])
+    connection = connections[alias]
+    quote = connection.ops.quote_name
+    meta = model._meta
+    fields = [field for field in meta.concrete_fields if not field.primary_key]
+
+    rows, params = [], []
+    for instance in instances:
+        rows.append(f"({', '.join(['%s'] * len(fields))})")
+        params.extend(
+            field.get_db_prep_save(field.pre_save(instance, add=True), connection)
+            for field in fields
+        )
+
+    columns = ", ".join(quote(field.column) for field in meta.concrete_fields)
+    sql = (
+        f"INSERT INTO {quote(meta.db_table)} "
+        f"({', '.join(quote(field.column) for field in fields)}) "
+        f"VALUES {', '.join(rows)} "
+        f"ON CONFLICT DO NOTHING RETURNING {columns}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return _from_rows(model, alias, cursor.fetchall())
+
+
+def delete_returning(queryset):
+    """
+    Remove as linhas de ``queryset`` (filtros simples, sem joins) em um
+    único ``DELETE ... RETURNING``, sem enviar signals.
+
+    Retorna as instâncias removidas por este statement: linhas removidas
+    antes por outra transação não aparecem.
+    """
+    model = queryset.model
+    alias = queryset.db
+    connection = connections[alias]
+    quote = connection.ops.quote_name
+    meta = model._meta
+
+    query = queryset.query
+    where, params = query.get_compiler(alias).compile(query.where)
+    columns = ", ".join(quote(field.column) for field in meta.concrete_fields)
+    sql = f"DELETE FROM {quote(meta.db_table)} WHERE {where} RETURNING {columns}"
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return _from_rows(model, alias, cursor.fetchall())
+
+
+def delete_existing(model, **filters):
+    """
+    Remove a linha de ``model`` identificada por ``filters``, se existir.
+
+    ``filters`` deve identificar no máximo uma linha (constraint única).
+    Retorna True se a linha foi removida (e só então envia ``post_delete``,
+    com a instância completa da linha removida).
+    """
+    queryset = model._default_manager.filter(**filters)
+    alias = queryset.db
+
+    with transaction.atomic(using=alias):
+        instances = delete_returning(queryset)
+        for instance in instances:
+            post_delete.send(
+                sender=model, instance=instance, using=alias, origin=instance
+            )
+    return bool(instances)
+
+
+def _from_rows(model, alias, rows):
+    """
+    Instâncias de ``model`` a partir de linhas com todas as colunas
+    concretas, com as conversões de tipo de uma leitura pelo ORM.
+    """
+    connection = connections[alias]
+    fields = model._meta.concrete_fields
+    columns = [field.get_col(model._meta.db_table) for field in fields]
+    converters = [
+        connection.ops.get_db_converters(col) + col.get_db_converters(connection)
+        for col in columns
+    ]
+    names = [field.attname for field in fields]
+    instances = []
+    for row in rows:
+        values = []
+        for col, col_converters, value in zip(columns, converters, row):
+            for converter in col_converters:
+                value = converter(value, col, connection)
+            values.append(value)
+        instances.append(model.from_db(alias, names, values))
+    return instances
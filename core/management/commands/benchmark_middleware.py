@@ -0,0 +1,111 @@
+"""
+Comando: benchmark_middleware
+
+Mede o custo por requisição da cadeia de middlewares padrão do Django
+(sessão, CSRF, autenticação, mensagens, X-Frame-Options) e da cadeia do
+projeto, que pula esses middlewares na API com token. A view é um stub que
+responde na hora, então a diferença é só o overhead dos middlewares (sem
+acessar o banco).
+"""
+
+import timeit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
+
+STOCK_MIDDLEWARE = [
+    "corsheaders.middleware.CorsMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+]
+
+SCENARIOS = [
+    ("API com token", "/api/posts/feed/", {"HTTP_AUTHORIZATION": "Token abc123"}),
+    ("API anônima", "/api/posts/", {}),
+    ("admin", "/admin/", {"HTTP_COOKIE": "sessionid=abc123"}),
+]
+
+
+@csrf_exempt
+def stub_view(request):
+    """View sem custo, como as do DRF (csrf_exempt)."""
+    return HttpResponse(b"{}", content_type="application/json")
+
+
+def build_chain(middleware):
+    """
+    Monta a cadeia de ``middleware`` como o handler do Django: cada um
+    envolve o próximo e os ``process_view`` rodam antes da view.
+    """
+    instances = []
+
+    def view_stage(request):
+        for instance in instances:
+            process_view = getattr(instance, "process_view", None)
+            if process_view:
+                response = process_view(request, stub_view, (), {})
+                if response:
+                    return response
+        return stub_view(request)
+
+    handler = view_stage
+    for path in reversed(middleware):
+        handler = import_string(path)(handler)
+        instances.insert(0, handler)
+    return handler
+
+
+class Command(BaseCommand):
+    help = "Compara o overhead por requisição das cadeias de middlewares."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=2000,
+            help="Requisições por medição (padrão: 2000).",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Medições por cadeia (padrão: 5)."
+        )
+
+    @override_settings(ALLOWED_HOSTS=["testserver"])
+    def handle(self, *args, **options):
+        factory = RequestFactory()
+        chains = {
+            "padrão": build_chain(STOCK_MIDDLEWARE),
+            "projeto": build_chain(settings.MIDDLEWARE),
+        }
+        number = options["number"]
+
+        self.stdout.write(
+            f"{'cenário':<16}{'caminho':<20}{'padrão µs':>12}{'projeto µs':>12}"
+            f"{'economia':>12}"
+        )
+        for name, path, headers in SCENARIOS:
+            timings = {}
+            for label, chain in chains.items():
+                best = min(
+                    timeit.repeat(
+                        lambda: chain(factory.get(path, **headers)),
+                        number=number,
+                        repeat=options["repeat"],
+                    )
+                )
+                timings[label] = best / number * 1_000_000
+
+            stock, lean = timings["padrão"], timings["projeto"]
+            self.stdout.write(
+                f"{name:<16}{path:<20}{stock:>12.1f}{lean:>12.1f}"
+                f"{stock - lean:>9.1f} µs"
+            )
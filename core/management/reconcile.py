@@ -0,0 +1,196 @@
+"""
+Base para comandos de reconciliação de contadores desnormalizados.
+
+Os contadores são recalculados com agregações agrupadas (GROUP BY) por
+faixas de ID, então a memória usada depende do tamanho do chunk e não do
+tamanho da tabela. Os chunks podem ser distribuídos em um pool de
+processos.
+"""
+
+import importlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.db.models import Count, Max, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def _init_worker():
+    """Inicializa o Django em cada processo do pool."""
+    import django
+
+    django.setup()
+
+
+def _run_chunk(command_path, start, end, fix):
+    """Executa a reconciliação de um chunk dentro de um processo do pool."""
+    module_path, class_name = command_path.rsplit(".", 1)
+    command_class = getattr(importlib.import_module(module_path), class_name)
+    try:
+        return command_class().reconcile_chunk(start, end, fix)
+    finally:
+        connections.close_all()
+
+
+class ReconcileCommand(BaseCommand):
+    """
+    Comando base de reconciliação.
+
+    Subclasses definem ``model`` (dono dos contadores) e ``counters``, um
+    dicionário ``{campo: (model de origem, campo FK)}``. Cada contador é
+    recalculado como ``COUNT(*)`` das linhas de origem agrupadas pela FK.
+    """
+
+    model = None
+    counters = {}
+
+    default_chunk_size = 10000
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=self.default_chunk_size,
+            help="Tamanho da faixa de IDs processada por vez.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Quantidade de processos usados para processar os chunks.",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Corrige os contadores divergentes (padrão: apenas relata).",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        workers = options["workers"]
+        fix = options["fix"]
+        if chunk_size < 1 or workers < 1:
+            raise CommandError("--chunk-size e --workers devem ser maiores que 0.")
+
+        bounds = self.model.objects.aggregate(first=Min("pk"), last=Max("pk"))
+        if bounds["first"] is None:
+            self.stdout.write("Nenhum registro para reconciliar.")
+            return
+
+        chunks = [
+            (start, start + chunk_size)
+            for start in range(bounds["first"], bounds["last"] + 1, chunk_size)
+        ]
+
+        totals = defaultdict(int)
+        for mismatches in self.run_chunks(chunks, workers, fix):
+            for pk, field, stored, actual in mismatches:
+                totals[field] += 1
+                if options["verbosity"] >= 2:
+                    self.stdout.write(
+                        f"{self.model.__name__} {pk}: {field} {stored} -> {actual}"
+                    )
+
+        self.report(totals, fix)
+
+    def run_chunks(self, chunks, workers, fix):
+        """Processa os chunks sequencialmente ou em um pool de processos."""
+        if workers == 1:
+            for start, end in chunks:
+                yield self.reconcile_chunk(start, end, fix)
+            return
+
+        # Conexões abertas não podem ser compartilhadas com os processos
+        connections.close_all()
+        command_path = f"{type(self).__module__}.{type(self).__name__}"
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker
+        ) as executor:
+            futures = [
+                executor.submit(_run_chunk, command_path, start, end, fix)
+                for start, end in chunks
+            ]
+            for future in futures:
+                yield future.result()
+
+    def reconcile_chunk(self, start, end, fix):
+        """
+        Compara os contadores gravados com os valores reais em [start, end).
+
+        Returns:
+            list: tuplas (pk, campo, valor gravado, valor real) divergentes
+        """
+        fields = list(self.counters)
+        stored = {
+            row["pk"]: row
+            for row in self.model.objects.filter(pk__gte=start, pk__lt=end)
+            .order_by()
+            .values("pk", *fields)
+        }
+
+        mismatches = []
+        for field, (source, fk_field) in self.counters.items():
+            actual = dict(
+                source.objects.filter(
+                    **{f"{fk_field}__gte": start, f"{fk_field}__lt": end}
+                )
+                .order_by()
+                .values(fk_field)
+                .annotate(total=Count("pk"))
+                .values_list(fk_field, "total")
+            )
+            for pk, row in stored.items():
+                if row[field] != actual.get(pk, 0):
+                    mismatches.append((pk, field, row[field], actual.get(pk, 0)))
+
+        if fix and mismatches:
+            self.apply_fixes(mismatches)
+        return mismatches
+
+    def apply_fixes(self, mismatches):
+        """
+        Corrige os contadores gravando o COUNT(*) calculado no próprio UPDATE.
+
+        Os valores lidos em ``reconcile_chunk`` só apontam quais linhas
+        corrigir: uma curtida/follow gravada entre a leitura e o UPDATE já
+        entra na contagem do UPDATE, sem ser somada duas vezes.
+        """
+        groups = defaultdict(list)
+        for pk, field, stored, actual in mismatches:
+            groups[field].append(pk)
+
+        with transaction.atomic():
+            for field, pks in groups.items():
+                self.model.objects.filter(pk__in=pks).update(
+                    **{field: self.count_of(field)}
+                )
+
+    def count_of(self, field):
+        """Subquery com o valor real do contador ``field`` da linha."""
+        source, fk_field = self.counters[field]
+        counts = (
+            source.objects.filter(**{fk_field: OuterRef("pk")})
+            .order_by()
+            .values(fk_field)
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts), 0)
+
+    def report(self, totals, fix):
+        """Escreve o resumo da reconciliação."""
+        if not totals:
+            self.stdout.write(self.style.SUCCESS("Todos os contadores estão corretos."))
+            return
+
+        for field, count in sorted(totals.items()):
+            self.stdout.write(f"{field}: {count} divergência(s)")
+
+        if fix:
+            self.stdout.write(self.style.SUCCESS("Contadores corrigidos."))
+        else:
+            self.stdout.write(
+                self.style.WARNING("Execute com --fix para corrigir os contadores.")
+            )
@@ -0,0 +1,22 @@
+"""
+Core middleware package.
+"""
+
+from .lean_api_mixin import LeanAPIMixin, is_lean
+from .lean_middleware import (
+    LeanAuthenticationMiddleware,
+    LeanCsrfViewMiddleware,
+    LeanMessageMiddleware,
+    LeanSessionMiddleware,
+    LeanXFrameOptionsMiddleware,
+)
+
+__all__ = [
+    "LeanAPIMixin",
+    "LeanAuthenticationMiddleware",
+    "LeanCsrfViewMiddleware",
+    "LeanMessageMiddleware",
+    "LeanSessionMiddleware",
+    "LeanXFrameOptionsMiddleware",
+    "is_lean",
+]
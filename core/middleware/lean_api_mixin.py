@@ -0,0 +1,51 @@
+"""
+Lean API mixin - Desvia middlewares de sessão nas requisições da API com token.
+
+Clientes da API se autenticam pelo header ``Authorization`` (Token/Bearer):
+não usam sessão, cookie de CSRF (as views do DRF já são ``csrf_exempt``),
+mensagens nem ``X-Frame-Options`` (respostas JSON). Para essas requisições,
+os middlewares com este mixin repassam direto para o próximo da cadeia.
+O restante (ex.: ``/admin/``, API navegável com sessão) segue pela cadeia
+completa.
+"""
+
+from core.conf import app_settings
+
+
+def is_lean(request):
+    """
+    Se a requisição vai para a API com credencial no header. Calculado uma
+    vez e guardado na requisição para os demais middlewares da cadeia.
+    """
+    try:
+        return request._lean_api
+    except AttributeError:
+        options = app_settings("LEAN_API_MIDDLEWARE")
+        request._lean_api = (
+            options["ENABLED"]
+            and "HTTP_AUTHORIZATION" in request.META
+            and request.path_info.startswith(tuple(options["PREFIXES"]))
+        )
+        return request._lean_api
+
+
+class LeanAPIMixin:
+    """
+    Pula o middleware (request, view e response) quando ``is_lean``.
+
+    Deve vir antes da classe do Django na herança; as subclasses continuam
+    sendo subclasses das originais, então os checks do admin passam.
+    """
+
+    def __call__(self, request):
+        if is_lean(request):
+            return self.get_response(request)
+        return super().__call__(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if is_lean(request):
+            return None
+        parent = getattr(super(), "process_view", None)
+        if parent is None:
+            return None
+        return parent(request, view_func, view_args, view_kwargs)
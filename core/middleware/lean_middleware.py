@@ -0,0 +1,31 @@
+"""
+Lean middleware - Middlewares de sessão do Django que pulam a API com token.
+"""
+
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.middleware.clickjacking import XFrameOptionsMiddleware
+from django.middleware.csrf import CsrfViewMiddleware
+
+from .lean_api_mixin import LeanAPIMixin
+
+
+class LeanSessionMiddleware(LeanAPIMixin, SessionMiddleware):
+    """SessionMiddleware sem carregar/gravar sessão na API com token."""
+
+
+class LeanCsrfViewMiddleware(LeanAPIMixin, CsrfViewMiddleware):
+    """CsrfViewMiddleware sem verificação nem cookie na API com token."""
+
+
+class LeanAuthenticationMiddleware(LeanAPIMixin, AuthenticationMiddleware):
+    """AuthenticationMiddleware sem usuário da sessão (o DRF autentica)."""
+
+
+class LeanMessageMiddleware(LeanAPIMixin, MessageMiddleware):
+    """MessageMiddleware sem storage de mensagens na API com token."""
+
+
+class LeanXFrameOptionsMiddleware(LeanAPIMixin, XFrameOptionsMiddleware):
+    """XFrameOptionsMiddleware sem o header em respostas JSON da API."""
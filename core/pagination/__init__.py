@@ -0,0 +1,7 @@
+"""
+Core pagination package.
+"""
+
+from .keyset_pagination import KeysetPagination
+
+__all__ = ["KeysetPagination"]
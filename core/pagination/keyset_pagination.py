@@ -0,0 +1,154 @@
+"""
+Keyset pagination - Paginação por cursor (max_id / since_id / limit).
+
+Diferente da paginação por número de página, não executa COUNT(*) nem
+OFFSET: cada página é um range scan no índice de ordenação, então a
+página N custa o mesmo que a primeira.
+"""
+
+from django.db.models import Q
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Paginação keyset ordenada do mais recente para o mais antigo.
+
+    Query parameters:
+    - max_id: retorna itens mais antigos que o item com este ID
+    - since_id: retorna itens mais recentes que o item com este ID (os mais
+      recentes primeiro, como em "carregar novos posts")
+    - limit: quantidade de itens por página (máximo ``max_limit``)
+
+    A ordenação usa (``ordering_field``, ``id_field``) de forma decrescente,
+    o que deve corresponder a um índice composto no banco.
+    """
+
+    ordering_field = "created_at"
+    id_field = "id"
+
+    default_limit = api_settings.PAGE_SIZE
+    max_limit = 100
+
+    max_id_query_param = "max_id"
+    since_id_query_param = "since_id"
+    limit_query_param = "limit"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Retorna a página solicitada como lista."""
+        self.request = request
+        self.limit = self.get_limit(request)
+        max_id = self.get_id(request, self.max_id_query_param)
+        since_id = self.get_id(request, self.since_id_query_param)
+
+        queryset = queryset.order_by(f"-{self.ordering_field}", f"-{self.id_field}")
+
+        if max_id is not None:
+            queryset = queryset.filter(self.get_cursor_filter(queryset, max_id, "lt"))
+        if since_id is not None:
+            queryset = queryset.filter(self.get_cursor_filter(queryset, since_id, "gt"))
+
+        # Buscar um item a mais para saber se existe próxima página
+        page = list(queryset[: self.limit + 1])
+        self.has_next = len(page) > self.limit
+        self.page = page[: self.limit]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_limit(self, request):
+        """Lê o parâmetro limit, respeitando o máximo permitido."""
+        value = request.query_params.get(self.limit_query_param)
+        if value is None:
+            return self.default_limit
+        try:
+            limit = int(value)
+        except ValueError:
+            raise ValidationError({self.limit_query_param: "Deve ser um inteiro."})
+        if limit < 1:
+            raise ValidationError({self.limit_query_param: "Deve ser maior que 0."})
+        return min(limit, self.max_limit)
+
+    def get_id(self, request, param):
+        """Lê um parâmetro de cursor (max_id/since_id)."""
+        value = request.query_params.get(param)
+        if value is None:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            raise ValidationError({param: "Deve ser um inteiro."})
+
+    def get_cursor_filter(self, queryset, item_id, lookup):
+        """
+        Monta o filtro keyset relativo ao item ``item_id``.
+
+        O valor de ordenação do item é lido com uma busca pontual. Se o item
+        não existir mais (ex: post deletado), compara apenas pelo ID, que
+        cresce junto com a data de criação.
+        """
+        ordering_value = (
+            queryset.filter(**{self.id_field: item_id})
+            .values_list(self.ordering_field, flat=True)
+            .first()
+        )
+        if ordering_value is None:
+            return Q(**{f"{self.id_field}__{lookup}": item_id})
+
+        return Q(**{f"{self.ordering_field}__{lookup}": ordering_value}) | Q(
+            **{
+                self.ordering_field: ordering_value,
+                f"{self.id_field}__{lookup}": item_id,
+            }
+        )
+
+    def get_item_id(self, item):
+        """Retorna o ID usado como cursor para um item da página."""
+        if isinstance(item, dict):
+            # Linhas de .values() (caminho rápido do FastReadMixin)
+            return item[self.id_field]
+        return getattr(item, self.id_field)
+
+    def get_next_link(self):
+        """Link para itens mais antigos que o último da página."""
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url, self.max_id_query_param, self.get_item_id(self.page[-1])
+        )
+
+    def get_previous_link(self):
+        """Link para itens mais recentes que o primeiro da página."""
+        if not self.page:
+            return None
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.max_id_query_param)
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(
+            url, self.since_id_query_param, self.get_item_id(self.page[0])
+        )
@@ -0,0 +1,8 @@
+"""
+Core parsers package.
+"""
+
+from .fast_json_parser import FastJSONParser
+from .msgpack_parser import MessagePackParser
+
+__all__ = ["FastJSONParser", "MessagePackParser"]
@@ -0,0 +1,33 @@
+"""
+FastJSONParser - JSONParser com decodificação via orjson.
+"""
+
+from django.conf import settings
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+from core.renderers import FastJSONRenderer
+
+
+class FastJSONParser(JSONParser):
+    """
+    Parser JSON padrão da API (``application/json``).
+
+    O orjson só lê UTF-8 e rejeita NaN/Infinity (equivalente a
+    ``STRICT_JSON``); outros charsets e o modo não estrito usam o JSONParser.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if not self.strict or encoding.lower().replace("_", "-") != "utf-8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
@@ -0,0 +1,22 @@
+"""
+MessagePackParser - Corpo de requisição em MessagePack.
+"""
+
+import msgpack
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+from core.renderers import MessagePackRenderer
+
+
+class MessagePackParser(BaseParser):
+    """Parser para ``Content-Type: application/msgpack``."""
+
+    media_type = "application/msgpack"
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, TypeError, msgpack.UnpackException) as exc:
+            raise ParseError("MessagePack parse error - %s" % str(exc))
@@ -0,0 +1,8 @@
+"""
+Core renderers package.
+"""
+
+from .fast_json_renderer import FastJSONRenderer
+from .msgpack_renderer import MessagePackRenderer
+
+__all__ = ["FastJSONRenderer", "MessagePackRenderer"]
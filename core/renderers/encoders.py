@@ -0,0 +1,15 @@
+"""
+Conversão de tipos não nativos para os renderers binários/rápidos.
+"""
+
+from rest_framework.utils.encoders import JSONEncoder
+
+_encoder = JSONEncoder()
+
+
+def encode_default(obj):
+    """
+    Converte ``obj`` como o encoder JSON do DRF (datas, Decimal, UUID,
+    strings lazy, querysets...), mantendo a saída idêntica ao JSONRenderer.
+    """
+    return _encoder.default(obj)
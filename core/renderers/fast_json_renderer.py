@@ -0,0 +1,34 @@
+"""
+FastJSONRenderer - JSONRenderer com codificação via orjson.
+
+Gera exatamente os mesmos bytes do JSONRenderer do DRF para as respostas
+compactas da API, mas codificando em C. Casos que o orjson não cobre
+(indentação, ``ensure_ascii``, saída não compacta) usam o JSONRenderer.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers.encoders import encode_default
+
+OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+class FastJSONRenderer(JSONRenderer):
+    """Renderer JSON padrão da API (``application/json``)."""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        indent = self.get_indent(accepted_media_type, renderer_context)
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=encode_default, option=OPTIONS)
+
+        # Mesmo escape do JSONRenderer: JSON como subconjunto estrito de JS
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
@@ -0,0 +1,26 @@
+"""
+MessagePackRenderer - Respostas em MessagePack (``application/msgpack``).
+
+Formato binário mais compacto que JSON, escolhido pelo cliente via
+``Accept: application/msgpack`` ou ``?format=msgpack``. Os tipos não
+nativos são convertidos como no JSON, então o conteúdo é o mesmo.
+"""
+
+import msgpack
+from rest_framework.renderers import BaseRenderer
+
+from core.renderers.encoders import encode_default
+
+
+class MessagePackRenderer(BaseRenderer):
+    """Renderer MessagePack."""
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
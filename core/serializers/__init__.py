@@ -0,0 +1,17 @@
+"""
+Core serializers package.
+"""
+
+from .dynamic_fields_mixin import DynamicFieldsMixin, FieldSet
+from .fast_serializer import FastSerializer
+from .fragment_cache_mixin import FragmentCacheListSerializer, FragmentCacheMixin
+from .viewer_state_mixin import ViewerStateMixin
+
+__all__ = [
+    "DynamicFieldsMixin",
+    "FieldSet",
+    "FastSerializer",
+    "FragmentCacheListSerializer",
+    "FragmentCacheMixin",
+    "ViewerStateMixin",
+]
@@ -0,0 +1,120 @@
+"""
+Sparse fieldsets - Seleção de campos via ?fields= / ?exclude= / ?expand=.
+
+Formato dos query parameters (listas separadas por vírgula):
+- fields: campos retornados; ``author.username`` seleciona subcampos de um
+  objeto aninhado (e o expande)
+- exclude: campos removidos da resposta
+- expand: objetos aninhados retornados completos
+
+Quando ``fields`` é informado, objetos aninhados não expandidos são
+retornados apenas como ID, sem precisar de join no banco.
+
+Campos listados em ``context["sideload"]`` viram ``<campo>_id`` (o objeto
+vai para ``includes`` da resposta, ver core.views.SideloadMixin).
+"""
+
+from rest_framework import serializers
+
+
+def _split(value):
+    return [item.strip() for item in (value or "").split(",") if item.strip()]
+
+
+class FieldSet:
+    """Seleção de campos pedida pelo cliente."""
+
+    def __init__(self, fields=None, exclude=(), expand=()):
+        self.fields = None
+        self.nested = {}
+        if fields is not None:
+            self.fields = set()
+            for name in fields:
+                name, _, subfield = name.partition(".")
+                self.fields.add(name)
+                if subfield:
+                    self.nested.setdefault(name, set()).add(subfield)
+        self.exclude = set(exclude)
+        self.expand = set(expand)
+
+    @classmethod
+    def from_request(cls, request):
+        """Lê a seleção dos query parameters; None se nada foi pedido."""
+        params = request.query_params
+        if not any(param in params for param in ("fields", "exclude", "expand")):
+            return None
+        return cls(
+            fields=_split(params["fields"]) if "fields" in params else None,
+            exclude=_split(params.get("exclude")),
+            expand=_split(params.get("expand")),
+        )
+
+    def includes(self, name):
+        """Indica se o campo deve aparecer na resposta."""
+        if name in self.exclude:
+            return False
+        return self.fields is None or name in self.fields
+
+    def expands(self, name):
+        """Indica se o objeto aninhado deve ser retornado completo."""
+        if not self.includes(name):
+            return False
+        return self.fields is None or name in self.expand or name in self.nested
+
+    def subfields(self, name):
+        """Subcampos pedidos de um objeto aninhado (None = todos)."""
+        return self.nested.get(name)
+
+
+class DynamicFieldsMixin:
+    """
+    Aplica o FieldSet (``context["fieldset"]``) e os campos side-loaded
+    (``context["sideload"]``) do contexto ao serializer.
+
+    Deve vir antes de ``serializers.ModelSerializer`` nas bases.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        fieldset = self.context.get("fieldset")
+        if fieldset is not None:
+            self.apply_fieldset(fieldset)
+        sideload = self.context.get("sideload")
+        if sideload:
+            self.apply_sideload(sideload)
+
+    def apply_fieldset(self, fieldset):
+        for name in list(self.fields):
+            if not fieldset.includes(name):
+                self.fields.pop(name)
+                continue
+
+            field = self.fields[name]
+            if not isinstance(field, serializers.BaseSerializer):
+                continue
+
+            if not fieldset.expands(name):
+                # Apenas o ID, lido da coluna FK sem acessar a relação
+                self.fields[name] = serializers.ReadOnlyField(source=f"{name}_id")
+                continue
+
+            subfields = fieldset.subfields(name)
+            if subfields:
+                for subname in list(field.fields):
+                    if subname not in subfields:
+                        field.fields.pop(subname)
+
+    def apply_sideload(self, sideload):
+        """Troca cada objeto side-loaded por ``<campo>_id``, na mesma posição."""
+        if not any(name in self.fields for name in sideload):
+            return
+
+        # Reordenar direto no dict interno do BindingDict, sem religar os campos
+        bound = self.fields.fields
+        fields = list(bound.items())
+        bound.clear()
+        for name, field in fields:
+            if name in sideload:
+                self.fields[f"{name}_id"] = serializers.ReadOnlyField()
+            else:
+                bound[name] = field
@@ -0,0 +1,113 @@
+"""
+Fast serializer - Serialização de leitura sem a maquinaria do DRF.
+
+Monta dicionários diretamente a partir de linhas de ``.values()``, sem
+instanciar models nem resolver campos do ModelSerializer a cada objeto.
+A saída deve ser idêntica (byte a byte, após renderizar) à do serializer
+DRF equivalente; cada subclasse tem um teste de paridade.
+"""
+
+from rest_framework import serializers
+
+# Instâncias reutilizadas apenas para formatar valores exatamente como o DRF
+_datetime_field = serializers.DateTimeField()
+
+
+class FastSerializer:
+    """
+    Serializer de leitura baseado em linhas de ``.values()``.
+
+    Atributos de subclasse:
+    - model: model de origem (usado para resolver o storage de arquivos)
+    - fields: campos de saída, na mesma ordem do serializer DRF
+    - datetime_fields: campos formatados como DateTimeField do DRF
+    - file_fields: campos de arquivo/imagem (convertidos em URL)
+    - nested: ``{campo: (FastSerializer, lookup)}`` para objetos aninhados,
+      lidos com o prefixo ``lookup__`` na mesma linha
+
+    Campos calculados são definidos com métodos ``get_<campo>(row, prefix)``;
+    o que eles precisam buscar em lote (ex.: estado do usuário autenticado)
+    é carregado em ``prepare(rows, prefix)``, chamado antes de serializar.
+    """
+
+    model = None
+    fields = ()
+    datetime_fields = ()
+    file_fields = ()
+    nested = {}
+
+    def __init__(self, context=None):
+        self.context = context or {}
+        self.request = self.context.get("request")
+        self.nested_serializers = {
+            field: (serializer_class(context=self.context), lookup)
+            for field, (serializer_class, lookup) in self.nested.items()
+        }
+
+    @property
+    def viewer(self):
+        """Usuário autenticado da requisição (None para anônimos)."""
+        user = getattr(self.request, "user", None)
+        if user is None or not user.is_authenticated:
+            return None
+        return user
+
+    @classmethod
+    def value_fields(cls, prefix=""):
+        """Lookups a passar para ``.values()``, incluindo os aninhados."""
+        lookups = []
+        for field in cls.fields:
+            if field in cls.nested:
+                serializer_class, lookup = cls.nested[field]
+                lookups.extend(serializer_class.value_fields(f"{prefix}{lookup}__"))
+            elif not hasattr(cls, f"get_{field}"):
+                lookups.append(f"{prefix}{field}")
+        lookups.extend(f"{prefix}{field}" for field in cls.extra_value_fields())
+        return lookups
+
+    @classmethod
+    def extra_value_fields(cls):
+        """Colunas lidas apenas por métodos ``get_<campo>``."""
+        return ()
+
+    def prepare(self, rows, prefix=""):
+        """Carrega em lote os dados dos getters para ``rows``."""
+        for serializer, lookup in self.nested_serializers.values():
+            serializer.prepare(rows, f"{prefix}{lookup}__")
+
+    def to_representation(self, row, prefix=""):
+        """Converte uma linha de ``.values()`` no dicionário de saída."""
+        data = {}
+        for field in self.fields:
+            if field in self.nested_serializers:
+                serializer, lookup = self.nested_serializers[field]
+                data[field] = serializer.to_representation(row, f"{prefix}{lookup}__")
+                continue
+
+            getter = getattr(self, f"get_{field}", None)
+            if getter is not None:
+                data[field] = getter(row, prefix)
+                continue
+
+            value = row[f"{prefix}{field}"]
+            if field in self.datetime_fields:
+                value = _datetime_field.to_representation(value)
+            elif field in self.file_fields:
+                value = self.file_url(field, value)
+            data[field] = value
+        return data
+
+    def many(self, rows):
+        """Serializa uma sequência de linhas."""
+        rows = list(rows)
+        self.prepare(rows)
+        return [self.to_representation(row) for row in rows]
+
+    def file_url(self, field, name):
+        """URL de um arquivo, absoluta quando há request (como no DRF)."""
+        if not name:
+            return None
+        url = self.model._meta.get_field(field).storage.url(name)
+        if self.request is not None:
+            return self.request.build_absolute_uri(url)
+        return url
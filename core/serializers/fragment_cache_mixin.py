@@ -0,0 +1,150 @@
+"""
+Fragment cache - Reaproveita a representação serializada de cada objeto.
+
+A parte estável da representação (campos que só mudam quando o objeto é
+salvo) é guardada por (pk, ``fragment_version_field``). Os campos em
+``live_fields`` (contadores, objetos aninhados de outros models) são
+recalculados a cada resposta e mesclados ao fragmento.
+
+Em listagens, o ListSerializer busca os fragmentos da página inteira em
+uma só leitura do cache e serializa apenas os objetos que faltaram.
+"""
+
+import hashlib
+
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+
+class FragmentCacheListSerializer(serializers.ListSerializer):
+    """ListSerializer que pré-carrega os fragmentos da página em lote."""
+
+    def to_representation(self, data):
+        if not self.child.fragment_cache.enabled:
+            return super().to_representation(data)
+
+        items = list(data.all() if hasattr(data, "all") else data)
+        self.child.prefetch_fragments(items)
+        try:
+            return [self.child.to_representation(item) for item in items]
+        finally:
+            self.child.store_fragments()
+
+
+class FragmentCacheMixin:
+    """
+    Cache de fragmentos para ModelSerializers.
+
+    Deve vir antes de ``serializers.ModelSerializer`` nas bases (e depois
+    de DynamicFieldsMixin). Requer ``fragment_cache`` (core.cache.FragmentCache)
+    e ``Meta.list_serializer_class = FragmentCacheListSerializer``.
+    """
+
+    fragment_cache = None
+    fragment_version_field = "updated_at"
+    live_fields = ()
+
+    @property
+    def fragment_signature(self):
+        """
+        Identifica a variante do fragmento: os campos estáveis selecionados
+        (sparse fieldsets) e a URL base usada em campos de arquivo.
+        """
+        if not hasattr(self, "_fragment_signature"):
+            request = self.context.get("request")
+            base_url = request.build_absolute_uri("/") if request else ""
+            fields = ",".join(
+                field.field_name
+                for field in self._readable_fields
+                if field.field_name not in self.live_fields
+            )
+            self._fragment_signature = hashlib.md5(
+                f"{fields}|{base_url}".encode(), usedforsecurity=False
+            ).hexdigest()[:12]
+        return self._fragment_signature
+
+    def get_fragment_key(self, instance):
+        """Chave do fragmento (None para objetos ainda sem versão)."""
+        version = getattr(instance, self.fragment_version_field)
+        if instance.pk is None or version is None:
+            return None
+        return (
+            f"{self.Meta.model._meta.label_lower}:{instance.pk}:"
+            f"{version.isoformat()}:{self.fragment_signature}"
+        )
+
+    def prefetch_fragments(self, instances):
+        """Busca em lote os fragmentos de ``instances``."""
+        keys = [self.get_fragment_key(instance) for instance in instances]
+        self._fragments = self.fragment_cache.get_many(
+            [key for key in keys if key is not None]
+        )
+        self._new_fragments = {}
+
+    def store_fragments(self):
+        """Grava em lote os fragmentos gerados desde ``prefetch_fragments``."""
+        self.fragment_cache.set_many(self._new_fragments)
+        del self._fragments, self._new_fragments
+
+    def get_fragment(self, instance):
+        """Fragmento do cache ou, na falta, serializado agora."""
+        key = self.get_fragment_key(instance)
+        prefetched = getattr(self, "_fragments", None)
+        if key is None:
+            fragment = None
+        elif prefetched is not None:
+            fragment = prefetched.get(key)
+        else:
+            fragment = self.fragment_cache.get(key)
+
+        if fragment is None:
+            fields = [
+                field
+                for field in self._readable_fields
+                if field.field_name not in self.live_fields
+            ]
+            fragment = self._represent(instance, fields)
+            if key is not None and prefetched is not None:
+                self._new_fragments[key] = fragment
+            elif key is not None:
+                self.fragment_cache.set(key, fragment)
+        return fragment
+
+    def to_representation(self, instance):
+        if not self.fragment_cache.enabled:
+            return super().to_representation(instance)
+
+        fragment = self.get_fragment(instance)
+        live = self._represent(
+            instance,
+            [f for f in self._readable_fields if f.field_name in self.live_fields],
+        )
+        # Mesma ordem de campos da serialização sem cache
+        return {
+            field.field_name: (
+                live[field.field_name]
+                if field.field_name in live
+                else fragment[field.field_name]
+            )
+            for field in self._readable_fields
+            if field.field_name in live or field.field_name in fragment
+        }
+
+    def _represent(self, instance, fields):
+        """Mesmo laço de ``Serializer.to_representation`` para ``fields``."""
+        ret = {}
+        for field in fields:
+            try:
+                attribute = field.get_attribute(instance)
+            except SkipField:
+                continue
+
+            check_for_none = (
+                attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            )
+            if check_for_none is None:
+                ret[field.field_name] = None
+            else:
+                ret[field.field_name] = field.to_representation(attribute)
+        return ret
@@ -0,0 +1,84 @@
+"""
+Viewer state - Campos relativos a quem faz a requisição.
+
+Campos como ``liked_by_me`` dependem do usuário autenticado. Calculados
+objeto a objeto, custariam uma consulta por item; aqui, na primeira
+leitura, o estado é buscado de uma vez para todos os objetos deste
+serializer na resposta (a página inteira, inclusive quando aninhado).
+"""
+
+from django.db import models
+
+from rest_framework import serializers
+
+
+def _flatten(values):
+    """Expande listas, querysets e managers (relações many) em objetos."""
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, models.Manager):
+            yield from value.all()
+        elif isinstance(value, (list, tuple, models.QuerySet)):
+            # QuerySet já avaliado pelo ListSerializer: usa o cache de resultados
+            yield from value
+        else:
+            yield value
+
+
+class ViewerStateMixin:
+    """
+    Estado do usuário autenticado em lote para ModelSerializers.
+
+    Subclasses sobrescrevem ``get_viewer_state(viewer, pks)`` retornando
+    ``{nome: set de pks}`` e leem cada objeto com ``viewer_state(nome, obj)``.
+    Estados ausentes e usuários anônimos resultam em False, sem consultas.
+    """
+
+    def get_viewer(self):
+        request = self.context.get("request")
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return None
+        return user
+
+    def get_viewer_state(self, viewer, pks):
+        """Estados do ``viewer`` para os objetos ``pks``; padrão: nenhum."""
+        return {}
+
+    def viewer_state(self, name, obj):
+        """Estado ``name`` do viewer para ``obj``."""
+        viewer = self.get_viewer()
+        if viewer is None:
+            return False
+
+        if obj.pk not in getattr(self, "_viewer_pks", ()):
+            pks = {instance.pk for instance in self.get_response_instances()}
+            pks.add(obj.pk)
+            self._viewer_pks = pks
+            self._viewer_state = self.get_viewer_state(viewer, pks)
+        return obj.pk in self._viewer_state.get(name, ())
+
+    def get_response_instances(self):
+        """
+        Todos os objetos serializados por este serializer na resposta,
+        seguindo os ``source`` desde o serializer raiz.
+        """
+        path = []
+        node = self
+        while node.parent is not None:
+            if not isinstance(node.parent, serializers.ListSerializer):
+                path.append(node.source_attrs)
+            node = node.parent
+
+        instance = getattr(node, "instance", None)
+        if instance is None:
+            return []
+        instances = list(_flatten([instance]))
+
+        for attrs in reversed(path):
+            for attr in attrs:
+                instances = list(
+                    _flatten(getattr(instance, attr, None) for instance in instances)
+                )
+        return instances
@@ -0,0 +1,63 @@
+"""
+Testes para o cache de fragmentos do app core.
+"""
+
+from unittest import mock
+
+from django.core.cache import cache
+
+from core.cache import FragmentCache, LRUCache, TTLCache
+
+
+class TestLRUCache:
+    """Testes para o LRUCache."""
+
+    def test_evicts_least_recently_used(self):
+        """Testa descarte da entrada usada há mais tempo."""
+        lru = LRUCache(max_size=2)
+        lru.set_many({"a": 1, "b": 2})
+        lru.get_many(["a"])
+        lru.set_many({"c": 3})
+
+        assert lru.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+        assert len(lru) == 2
+
+
+class TestTTLCache:
+    """Testes para o TTLCache."""
+
+    def test_entries_expire(self):
+        """Testa que entradas vencidas não são retornadas e são descartadas."""
+        ttl = TTLCache(max_size=10, timeout=60)
+        with mock.patch("core.cache.ttl_cache.time.monotonic", return_value=0):
+            ttl.set_many({"a": 1})
+        with mock.patch("core.cache.ttl_cache.time.monotonic", return_value=59):
+            assert ttl.get_many(["a"]) == {"a": 1}
+        with mock.patch("core.cache.ttl_cache.time.monotonic", return_value=60):
+            assert ttl.get_many(["a"]) == {}
+        assert len(ttl) == 0
+
+
+class TestFragmentCache:
+    """Testes para o FragmentCache."""
+
+    def test_local_only(self, settings):
+        """Testa cache apenas em memória."""
+        settings.TEST_FRAGMENT_CACHE = {"MAX_SIZE": 1}
+        fragments = FragmentCache("TEST_FRAGMENT_CACHE")
+        fragments.set_many({"a": 1, "b": 2})
+
+        assert fragments.get_many(["a", "b"]) == {"b": 2}
+
+    def test_shared_backend(self, settings):
+        """Testa segundo nível compartilhado via CACHES."""
+        settings.TEST_FRAGMENT_CACHE = {"BACKEND": "default"}
+        fragments = FragmentCache("TEST_FRAGMENT_CACHE")
+        cache.clear()
+        fragments.set_many({"a": 1})
+
+        # Outro processo: LRU vazio, encontra no cache compartilhado
+        fragments.clear()
+        assert fragments.get("a") == 1
+        assert fragments.local.get_many(["a"]) == {"a": 1}
+        cache.clear()
@@ -0,0 +1,59 @@
+"""
+Testes para a leitura dos settings em dict do app core.
+"""
+
+from core.conf import DEFAULTS, app_settings, from_env
+
+
+class TestAppSettings:
+    """Testes para a mescla dos settings com os padrões."""
+
+    def test_missing_setting_uses_defaults(self, settings):
+        """Testa os padrões quando o setting não existe."""
+        del settings.SOCIAL_GRAPH
+
+        assert app_settings("SOCIAL_GRAPH") == DEFAULTS["SOCIAL_GRAPH"]
+
+    def test_setting_overrides_defaults(self, settings):
+        """Testa que as chaves do setting substituem só as dos padrões."""
+        settings.SOCIAL_GRAPH = {"MAX_AGE": 10}
+
+        options = app_settings("SOCIAL_GRAPH")
+
+        assert options["MAX_AGE"] == 10
+        assert options["COMPACT_THRESHOLD"] == 10000
+
+
+class TestFromEnv:
+    """Testes para os settings lidos de variáveis de ambiente."""
+
+    def test_only_defined_variables(self, monkeypatch):
+        """Testa que variáveis ausentes ficam fora (valem os padrões)."""
+        monkeypatch.delenv("TEST_ENABLED", raising=False)
+        monkeypatch.setenv("TEST_MAX_AGE", "30")
+
+        assert from_env(
+            "SOCIAL_GRAPH", ENABLED="TEST_ENABLED", MAX_AGE="TEST_MAX_AGE"
+        ) == {"MAX_AGE": 30}
+
+    def test_values_have_the_default_type(self, monkeypatch):
+        """Testa a conversão pelo tipo do padrão (bool, float, None)."""
+        monkeypatch.setenv("TEST_ENABLED", "True")
+        monkeypatch.setenv("TEST_INTERVAL", "0.5")
+        monkeypatch.setenv("TEST_BACKEND", "")
+
+        assert from_env(
+            "POST_COUNTERS_BUFFER",
+            ENABLED="TEST_ENABLED",
+            FLUSH_INTERVAL="TEST_INTERVAL",
+        ) == {"ENABLED": True, "FLUSH_INTERVAL": 0.5}
+        assert from_env("FRAGMENT_CACHE", BACKEND="TEST_BACKEND") == {"BACKEND": None}
+
+    def test_nested_dicts_keep_other_keys(self, monkeypatch):
+        """Testa que um dict aninhado mantém as demais chaves padrão."""
+        monkeypatch.setenv("TEST_USER_RATE", "5/s")
+
+        rates = from_env("THROTTLE_BUCKETS", USER_RATES={"default": "TEST_USER_RATE"})
+
+        assert rates["USER_RATES"]["default"] == "5/s"
+        assert rates["USER_RATES"]["post.feed"] == "120/min"
@@ -0,0 +1,123 @@
+"""
+Testes para as escritas idempotentes do app core.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+
+import pytest
+
+from core.db import (
+    delete_existing,
+    delete_returning,
+    insert_ignore,
+    insert_ignore_many,
+)
+from posts.models import Like, Post
+
+User = get_user_model()
+
+
+@pytest.fixture
+def post():
+    """Fixture com post."""
+    author = User.objects.create_user(username="author", password="pass123")
+    return Post.objects.create(author=author, content="Post")
+
+
+@pytest.fixture
+def signals():
+    """Registra os signals de Like enviados durante o teste."""
+    sent = []
+
+    def on_save(sender, instance, created, **kwargs):
+        sent.append(("save", instance.post_id))
+
+    def on_delete(sender, instance, **kwargs):
+        sent.append(("delete", instance.post_id))
+
+    post_save.connect(on_save, sender=Like)
+    post_delete.connect(on_delete, sender=Like)
+    yield sent
+    post_save.disconnect(on_save, sender=Like)
+    post_delete.disconnect(on_delete, sender=Like)
+
+
+@pytest.mark.django_db
+class TestUniqueWrites:
+    """Testes para insert_ignore e delete_existing."""
+
+    def test_insert_ignore(self, post, signals):
+        """Testa que a segunda inserção é ignorada, sem signal."""
+        like = insert_ignore(Like, user=post.author, post_id=post.pk)
+
+        assert like.pk == Like.objects.get().pk
+        assert like.created_at is not None
+        assert insert_ignore(Like, user=post.author, post_id=post.pk) is None
+        assert signals == [("save", post.pk)]
+
+    def test_insert_ignore_missing_foreign_key(self, post, signals):
+        """Testa que FK inexistente não insere nem gera erro."""
+        assert insert_ignore(Like, user=post.author, post_id=999) is None
+        assert not Like.objects.exists()
+        assert signals == []
+
+    def test_delete_existing(self, post, signals):
+        """Testa que só a remoção efetiva envia post_delete."""
+        Like.objects.create(user=post.author, post=post)
+        signals.clear()
+
+        assert delete_existing(Like, user=post.author, post_id=post.pk)
+        assert not delete_existing(Like, user=post.author, post_id=post.pk)
+        assert not Like.objects.exists()
+        assert signals == [("delete", post.pk)]
+
+    def test_delete_existing_sends_the_deleted_row(self, post):
+        """Testa post_delete com a instância completa da linha removida."""
+        like = Like.objects.create(user=post.author, post=post)
+        received = []
+
+        def on_delete(sender, instance, **kwargs):
+            received.append(instance)
+
+        post_delete.connect(on_delete, sender=Like)
+        try:
+            delete_existing(Like, user=post.author, post_id=post.pk)
+        finally:
+            post_delete.disconnect(on_delete, sender=Like)
+
+        assert [(i.pk, i.user_id, i.created_at) for i in received] == [
+            (like.pk, like.user_id, like.created_at)
+        ]
+
+    def test_delete_returning(self, post):
+        """Testa que só as linhas removidas pelo statement são retornadas."""
+        users = [
+            User.objects.create_user(username=f"user{i}", password="pass123")
+            for i in range(3)
+        ]
+        for user in users[:2]:
+            Like.objects.create(user=user, post=post)
+
+        deleted = delete_returning(
+            Like.objects.filter(post=post, user_id__in=[u.pk for u in users])
+        )
+
+        assert sorted(like.user_id for like in deleted) == [users[0].pk, users[1].pk]
+        assert delete_returning(Like.objects.filter(post=post)) == []
+
+    def test_insert_ignore_many(self, post, signals):
+        """Testa que só as linhas inseridas pelo statement são retornadas."""
+        other = User.objects.create_user(username="other", password="pass123")
+        Like.objects.create(user=post.author, post=post)
+        signals.clear()
+
+        inserted = insert_ignore_many(
+            Like, [Like(user=post.author, post=post), Like(user=other, post=post)]
+        )
+
+        assert [(like.user_id, like.pk is not None) for like in inserted] == [
+            (other.pk, True)
+        ]
+        assert Like.objects.count() == 2
+        assert signals == []
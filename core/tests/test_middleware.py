@@ -0,0 +1,80 @@
+"""
+Testes para os middlewares enxutos da API do app core.
+"""
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import Client
+from django.urls import reverse
+
+import pytest
+from rest_framework.authtoken.models import Token
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestLeanAPIMiddleware:
+    """Testes para o desvio de sessão/CSRF/mensagens na API com token."""
+
+    @pytest.fixture
+    def token(self):
+        user = User.objects.create_user(username="user", password="pass123")
+        return Token.objects.create(user=user)
+
+    def test_token_request_skips_session_middlewares(self, token):
+        """Testa resposta da API com token sem X-Frame-Options nem cookies."""
+        response = Client().get(
+            reverse("post-feed"), HTTP_AUTHORIZATION=f"Token {token.key}"
+        )
+
+        assert response.status_code == 200
+        assert "X-Frame-Options" not in response
+        assert not response.cookies
+        assert not hasattr(response.wsgi_request, "session")
+
+    def test_api_without_token_keeps_full_stack(self):
+        """Testa que a API sem header Authorization passa pela cadeia completa."""
+        response = Client().get(reverse("post-list"))
+
+        assert response.status_code == 200
+        assert response["X-Frame-Options"] == "DENY"
+        assert hasattr(response.wsgi_request, "session")
+
+    def test_admin_keeps_session_and_csrf(self, token):
+        """Testa que o admin mantém sessão, CSRF e X-Frame-Options."""
+        response = Client().get(
+            reverse("admin:login"), HTTP_AUTHORIZATION=f"Token {token.key}"
+        )
+
+        assert response.status_code == 200
+        assert response["X-Frame-Options"] == "DENY"
+        assert "csrftoken" in response.cookies
+        assert hasattr(response.wsgi_request, "session")
+
+    def test_disabled(self, settings, token):
+        """Testa que ENABLED=False mantém a cadeia completa na API."""
+        settings.LEAN_API_MIDDLEWARE = {"ENABLED": False}
+
+        response = Client().get(
+            reverse("post-feed"), HTTP_AUTHORIZATION=f"Token {token.key}"
+        )
+
+        assert response.status_code == 200
+        assert response["X-Frame-Options"] == "DENY"
+
+
+class TestBenchmarkMiddleware:
+    """Testes para o comando benchmark_middleware."""
+
+    def test_reports_each_scenario(self):
+        """Testa relatório com as duas cadeias em cada cenário."""
+        out = StringIO()
+
+        call_command("benchmark_middleware", number=1, repeat=1, stdout=out)
+
+        output = out.getvalue()
+        for path in ["/api/posts/feed/", "/api/posts/", "/admin/"]:
+            assert path in output
@@ -0,0 +1,125 @@
+"""
+Testes para os renderers e parsers do app core.
+"""
+
+import io
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from django.utils import timezone
+
+import msgpack
+import pytest
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from core.parsers import FastJSONParser, MessagePackParser
+from core.renderers import FastJSONRenderer, MessagePackRenderer
+from posts.models import Post
+
+User = get_user_model()
+
+DATA = {
+    "id": 1,
+    "content": "Olá, mundo 🚀 \u2028 \u2029 fim",
+    "price": Decimal("9.90"),
+    "created_at": timezone.now(),
+    "nested": [{"a": None, "b": True, "c": 1.5}],
+    2: "chave numérica",
+}
+
+
+class TestFastJSONRenderer:
+    """Testes para o FastJSONRenderer."""
+
+    def test_same_bytes_as_json_renderer(self):
+        """Testa saída idêntica ao JSONRenderer do DRF."""
+        assert FastJSONRenderer().render(DATA) == JSONRenderer().render(DATA)
+
+    def test_indent_falls_back_to_json_renderer(self):
+        """Testa que indentação usa o JSONRenderer."""
+        media_type = "application/json; indent=4"
+
+        assert FastJSONRenderer().render(DATA, media_type) == JSONRenderer().render(
+            DATA, media_type
+        )
+
+    def test_none(self):
+        """Testa resposta vazia."""
+        assert FastJSONRenderer().render(None) == b""
+
+
+class TestParsers:
+    """Testes para o FastJSONParser e o MessagePackParser."""
+
+    def test_fast_json_parser(self):
+        """Testa leitura de JSON."""
+        stream = io.BytesIO('{"content": "Olá"}'.encode())
+
+        assert FastJSONParser().parse(stream) == {"content": "Olá"}
+
+    def test_fast_json_parser_invalid(self):
+        """Testa erro de parse em JSON inválido ou com NaN."""
+        for body in [b"{", b'{"a": NaN}']:
+            with pytest.raises(ParseError):
+                FastJSONParser().parse(io.BytesIO(body))
+
+    def test_msgpack_round_trip(self):
+        """Testa que o MessagePack preserva o conteúdo do JSON."""
+        data = {key: value for key, value in DATA.items() if key != 2}
+        payload = MessagePackRenderer().render(data)
+
+        assert MessagePackParser().parse(io.BytesIO(payload)) == FastJSONParser().parse(
+            io.BytesIO(FastJSONRenderer().render(data))
+        )
+
+    def test_msgpack_parser_invalid(self):
+        """Testa erro de parse em MessagePack inválido."""
+        with pytest.raises(ParseError):
+            MessagePackParser().parse(io.BytesIO(b"\xc1"))
+
+
+@pytest.mark.django_db
+class TestContentNegotiation:
+    """Testes de negociação do formato via Accept / Content-Type."""
+
+    @pytest.fixture
+    def user(self):
+        return User.objects.create_user(username="testuser", password="pass123")
+
+    def test_json_is_default(self, user):
+        """Testa JSON como formato padrão."""
+        Post.objects.create(author=user, content="Post")
+
+        response = APIClient().get(reverse("post-list"))
+
+        assert response["Content-Type"] == "application/json"
+        assert response.json()["results"][0]["content"] == "Post"
+
+    def test_msgpack_response(self, user):
+        """Testa resposta em MessagePack com o mesmo conteúdo do JSON."""
+        Post.objects.create(author=user, content="Post")
+        client = APIClient()
+
+        response = client.get(reverse("post-list"), HTTP_ACCEPT="application/msgpack")
+
+        assert response["Content-Type"] == "application/msgpack"
+        assert (
+            msgpack.unpackb(response.content) == client.get(reverse("post-list")).json()
+        )
+
+    def test_msgpack_request(self, user):
+        """Testa criação de post com corpo em MessagePack."""
+        client = APIClient()
+        client.force_authenticate(user=user)
+
+        response = client.post(
+            reverse("post-list"),
+            msgpack.packb({"content": "Via MessagePack"}),
+            content_type="application/msgpack",
+        )
+
+        assert response.status_code == 201
+        assert Post.objects.get().content == "Via MessagePack"
@@ -0,0 +1,159 @@
+"""
+Testes para o rate limiting por token bucket do app core.
+"""
+
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+
+import pytest
+from rest_framework.test import APIClient
+
+from core.throttling import LocalBucketStore, parse_rate
+
+User = get_user_model()
+
+
+class TestTokenBucket:
+    """Testes para o store de baldes em memória."""
+
+    def test_parse_rate(self):
+        """Testa conversão de taxa em capacidade e fichas por segundo."""
+        assert parse_rate("60/min") == (60, 1.0)
+        assert parse_rate("10/s") == (10, 10.0)
+        assert parse_rate("3600/hour") == (3600, 1.0)
+
+    @pytest.mark.parametrize("rate", ["0/min", "-1/s", "10/week", "abc", "10"])
+    def test_parse_invalid_rate(self, rate):
+        """Testa taxas inválidas (inclusive zero) recusadas com ValueError."""
+        with pytest.raises(ValueError):
+            parse_rate(rate)
+
+    def test_burst_then_refill(self):
+        """Testa consumo da capacidade e reabastecimento contínuo."""
+        store = LocalBucketStore()
+
+        assert [store.consume("k", 3, 1.0, now=0) for _ in range(3)] == [0, 0, 0]
+        assert store.consume("k", 3, 1.0, now=0) == pytest.approx(1.0)
+        assert store.consume("k", 3, 1.0, now=0.5) == pytest.approx(0.5)
+        assert store.consume("k", 3, 1.0, now=1.0) == 0
+
+    def test_refill_is_capped_at_capacity(self):
+        """Testa que o balde parado não acumula além da capacidade."""
+        store = LocalBucketStore()
+        store.consume("k", 2, 1.0, now=0)
+
+        waits = [store.consume("k", 2, 1.0, now=1000) for _ in range(3)]
+        assert waits[:2] == [0, 0]
+        assert waits[2] > 0
+
+    def test_keys_are_independent_and_bounded(self):
+        """Testa baldes separados por chave e descarte dos mais antigos."""
+        store = LocalBucketStore(max_keys=2)
+        store.consume("a", 1, 1.0, now=0)
+
+        assert store.consume("b", 1, 1.0, now=0) == 0
+        store.consume("c", 1, 1.0, now=0)
+        assert len(store) == 2
+        # "a" foi descartado e volta cheio
+        assert store.consume("a", 1, 1.0, now=0) == 0
+
+
+@pytest.mark.django_db
+class TestTokenBucketThrottle:
+    """Testes para os throttles por usuário e por IP nas views."""
+
+    @pytest.fixture(autouse=True)
+    def rates(self, settings):
+        settings.THROTTLE_BUCKETS = {
+            "ENABLED": True,
+            "USER_RATES": {"default": "1000/min", "post.feed": "2/min"},
+            "IP_RATES": {"default": "1000/min", "post.list": "2/min"},
+        }
+
+    @pytest.fixture
+    def user(self):
+        return User.objects.create_user(username="user", password="pass123")
+
+    def client_for(self, user=None):
+        client = APIClient()
+        if user:
+            client.force_authenticate(user=user)
+        return client
+
+    def test_feed_is_throttled_per_user(self, user):
+        """Testa 429 com Retry-After ao esgotar o balde do feed."""
+        client = self.client_for(user)
+        url = reverse("post-feed")
+
+        assert client.get(url).status_code == 200
+        assert client.get(url).status_code == 200
+        response = client.get(url)
+
+        assert response.status_code == 429
+        assert int(response["Retry-After"]) == 30
+
+    def test_users_have_separate_buckets(self, user):
+        """Testa que o limite de um usuário não afeta outro."""
+        other = User.objects.create_user(username="other", password="pass123")
+        url = reverse("post-feed")
+        for _ in range(2):
+            self.client_for(user).get(url)
+
+        assert self.client_for(user).get(url).status_code == 429
+        assert self.client_for(other).get(url).status_code == 200
+
+    def test_scopes_have_separate_buckets(self, user):
+        """Testa que cada ação tem o próprio balde."""
+        client = self.client_for(user)
+        for _ in range(3):
+            client.get(reverse("post-feed"))
+
+        assert client.get(reverse("user-me")).status_code == 200
+
+    def test_anonymous_requests_are_throttled_per_ip(self):
+        """Testa o limite por IP em requisições anônimas."""
+        url = reverse("post-list")
+        client = self.client_for()
+
+        assert client.get(url).status_code == 200
+        assert client.get(url).status_code == 200
+        assert client.get(url).status_code == 429
+        assert (
+            client.get(url, REMOTE_ADDR="10.0.0.2").status_code == 200
+        ), "outro IP tem o próprio balde"
+
+    def test_forwarded_for_is_ignored_without_proxies(self):
+        """Testa que, sem NUM_PROXIES, X-Forwarded-For não troca o balde."""
+        url = reverse("post-list")
+        client = self.client_for()
+
+        statuses = [
+            client.get(url, HTTP_X_FORWARDED_FOR=f"10.0.0.{i}").status_code
+            for i in range(3)
+        ]
+        assert statuses == [200, 200, 429]
+
+    def test_forwarded_for_with_trusted_proxy(self, settings):
+        """Testa o IP anexado pelo proxy confiável (NUM_PROXIES=1)."""
+        settings.REST_FRAMEWORK = {**settings.REST_FRAMEWORK, "NUM_PROXIES": 1}
+        url = reverse("post-list")
+        client = self.client_for()
+
+        # Entradas anteriores à do proxy são do cliente e não são confiáveis
+        statuses = [
+            client.get(url, HTTP_X_FORWARDED_FOR=forwarded).status_code
+            for forwarded in ["10.0.0.1", "1.2.3.4, 10.0.0.1", "5.6.7.8, 10.0.0.1"]
+        ]
+        assert statuses == [200, 200, 429]
+        assert client.get(url, HTTP_X_FORWARDED_FOR="10.0.0.2").status_code == 200
+
+    def test_disabled(self, settings, user):
+        """Testa que ENABLED=False não limita nada."""
+        settings.THROTTLE_BUCKETS = {
+            **settings.THROTTLE_BUCKETS,
+            "ENABLED": False,
+        }
+        client = self.client_for(user)
+
+        for _ in range(5):
+            assert client.get(reverse("post-feed")).status_code == 200
@@ -0,0 +1,18 @@
+"""
+Core throttling package.
+"""
+
+from .token_bucket import LocalBucketStore, parse_rate
+from .token_bucket_throttle import (
+    IPTokenBucketThrottle,
+    TokenBucketThrottle,
+    UserTokenBucketThrottle,
+)
+
+__all__ = [
+    "IPTokenBucketThrottle",
+    "LocalBucketStore",
+    "TokenBucketThrottle",
+    "UserTokenBucketThrottle",
+    "parse_rate",
+]
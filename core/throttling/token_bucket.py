@@ -0,0 +1,80 @@
+"""
+Token bucket - Baldes de fichas para limitar a taxa de requisições.
+
+Cada chave tem um balde com até ``capacity`` fichas, reabastecido
+continuamente a ``refill_rate`` fichas por segundo; cada requisição consome
+uma ficha. O estado de um balde é só (fichas, instante da última
+atualização), atualizado em O(1) a cada consumo, sem tocar o banco.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+DURATIONS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def parse_rate(rate):
+    """
+    Converte ``"<n>/<período>"`` (ex.: ``"60/min"``, ``"1000/hour"``) em
+    ``(capacidade, fichas por segundo)``.
+
+    ``ValueError`` se o formato for inválido ou a quantidade menor que 1
+    (para desligar o limite de um escopo, use None).
+    """
+    try:
+        count, period = rate.split("/")
+        count = int(count)
+        duration = DURATIONS[period[:1]]
+    except (AttributeError, KeyError, ValueError):
+        raise ValueError(f"Taxa inválida: {rate!r} (use '<n>/<período>').")
+    if count < 1:
+        raise ValueError(f"Taxa inválida: {rate!r} (mínimo de 1 requisição).")
+    return count, count / duration
+
+
+class LocalBucketStore:
+    """
+    Baldes em memória, com consumo atômico (lock) dentro do processo.
+
+    Mantém no máximo ``max_keys`` baldes: os usados há mais tempo são
+    descartados (voltam cheios, o que só favorece o cliente). Para limites
+    globais entre workers, um store compartilhado (ex.: script Lua no
+    Redis) implementa o mesmo ``consume``.
+    """
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()
+
+    def __len__(self):
+        return len(self._buckets)
+
+    def consume(self, key, capacity, refill_rate, now=None):
+        """
+        Consome uma ficha do balde ``key``. Retorna 0 se havia ficha ou os
+        segundos até a próxima ficha (requisição recusada).
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * refill_rate)
+            if tokens >= 1:
+                tokens -= 1
+                wait = 0.0
+            else:
+                wait = (1 - tokens) / refill_rate
+
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+store = LocalBucketStore()
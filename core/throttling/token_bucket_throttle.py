@@ -0,0 +1,83 @@
+"""
+Token bucket throttles - Limites por usuário e por IP em cada ação.
+"""
+
+from rest_framework.throttling import BaseThrottle
+
+from core.conf import app_settings
+from core.throttling import token_bucket
+
+
+def get_scope(view):
+    """
+    Escopo da requisição: ``<basename>.<action>`` em viewsets (ex.:
+    ``like.create``), ``throttle_scope`` ou o nome da classe nas demais.
+    """
+    basename = getattr(view, "basename", None)
+    action = getattr(view, "action", None)
+    if basename and action:
+        return f"{basename}.{action}"
+    return getattr(view, "throttle_scope", None) or type(view).__name__.lower()
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """
+    Throttle por token bucket, com a taxa escolhida pelo escopo da ação.
+
+    Subclasses definem ``kind`` e ``rates_setting``; ``get_ident`` é o IP
+    do cliente (BaseThrottle: ``REMOTE_ADDR``, ou ``X-Forwarded-For`` só
+    com ``NUM_PROXIES`` proxies confiáveis) e pode ser sobrescrito (None:
+    não limitar). A verificação é uma operação O(1) no store, sem acesso
+    ao banco.
+    """
+
+    kind = None
+    rates_setting = None
+
+    def get_store(self):
+        return token_bucket.store
+
+    def allow_request(self, request, view):
+        self.wait_seconds = None
+        options = app_settings("THROTTLE_BUCKETS")
+        if not options["ENABLED"]:
+            return True
+
+        scope = get_scope(view)
+        rates = options[self.rates_setting]
+        rate = rates.get(scope, rates.get("default"))
+        ident = self.get_ident(request)
+        if rate is None or ident is None:
+            return True
+
+        capacity, refill_rate = token_bucket.parse_rate(rate)
+        wait = self.get_store().consume(
+            f"{self.kind}:{scope}:{ident}", capacity, refill_rate
+        )
+        if wait:
+            self.wait_seconds = wait
+            return False
+        return True
+
+    def wait(self):
+        return self.wait_seconds
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    """Limite por usuário autenticado (``USER_RATES``)."""
+
+    kind = "user"
+    rates_setting = "USER_RATES"
+
+    def get_ident(self, request):
+        user = request.user
+        if user is None or not user.is_authenticated:
+            return None
+        return user.pk
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    """Limite por IP, autenticado ou não (``IP_RATES``)."""
+
+    kind = "ip"
+    rates_setting = "IP_RATES"
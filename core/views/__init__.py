@@ -0,0 +1,9 @@
+"""
+Core views package.
+"""
+
+from .fast_read_mixin import FastReadMixin
+from .sideload_mixin import SideloadMixin
+from .sparse_fieldsets_mixin import SparseFieldsetsMixin
+
+__all__ = ["FastReadMixin", "SideloadMixin", "SparseFieldsetsMixin"]
@@ -0,0 +1,84 @@
+"""
+FastReadMixin - Caminho rápido de leitura para list/retrieve.
+"""
+
+from django.core.exceptions import ValidationError
+from django.http import Http404
+
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+
+class FastReadMixin:
+    """
+    Serve list/retrieve com um FastSerializer a partir de ``.values()``.
+
+    Ligado por viewset com ``fast_serialization = True``. As demais ações,
+    métodos não seguros (e requisições que pedem opções não suportadas pelo
+    caminho rápido) continuam usando o serializer DRF.
+    """
+
+    fast_serializer_class = None
+    fast_serialization = False
+
+    def use_fast_serialization(self):
+        """Indica se a requisição atual pode usar o caminho rápido."""
+        return (
+            self.fast_serialization
+            and self.fast_serializer_class is not None
+            and self.request.method in SAFE_METHODS
+        )
+
+    def get_fast_serializer(self):
+        return self.fast_serializer_class(context=self.get_serializer_context())
+
+    def get_fast_object(self, row):
+        """
+        Instância do model montada com as colunas de ``row``, sem query.
+
+        Usada nas permissões de objeto: as colunas fora de ``row`` ficam
+        adiadas e são carregadas sob demanda se a permissão as acessar.
+        """
+        model = self.get_queryset().model
+        fields = [
+            field.attname
+            for field in model._meta.concrete_fields
+            if field.attname in row
+        ]
+        return model.from_db(self.get_queryset().db, fields, [row[f] for f in fields])
+
+    def list(self, request, *args, **kwargs):
+        if not self.use_fast_serialization():
+            return super().list(request, *args, **kwargs)
+
+        serializer = self.get_fast_serializer()
+        queryset = self.filter_queryset(self.get_queryset()).values(
+            *serializer.value_fields()
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.many(page))
+        return Response(serializer.many(queryset))
+
+    def retrieve(self, request, *args, **kwargs):
+        if not self.use_fast_serialization():
+            return super().retrieve(request, *args, **kwargs)
+
+        serializer = self.get_fast_serializer()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            row = (
+                self.filter_queryset(self.get_queryset())
+                .filter(**{self.lookup_field: self.kwargs[lookup_url_kwarg]})
+                .values(*serializer.value_fields())
+                .first()
+            )
+        except (TypeError, ValueError, ValidationError):
+            row = None
+        if row is None:
+            raise Http404
+
+        self.check_object_permissions(request, self.get_fast_object(row))
+        serializer.prepare([row])
+        return Response(serializer.to_representation(row))
@@ -0,0 +1,90 @@
+"""
+SideloadMixin - Objetos relacionados side-loaded e sem repetição.
+"""
+
+from rest_framework.permissions import SAFE_METHODS
+
+
+class SideloadMixin:
+    """
+    Formato opcional de resposta com relações side-loaded (?include=users).
+
+    Cada item passa a ter ``<campo>_id`` no lugar do objeto aninhado e a
+    resposta ganha ``includes`` com cada objeto relacionado uma única vez,
+    buscados em uma só consulta::
+
+        {"results": [{"id": 1, "author_id": 5, ...}],
+         "includes": {"users": {"5": {...}}}}
+
+    Em respostas de um único item (retrieve), ``includes`` vai dentro do
+    próprio objeto: ``{"id": 1, "author_id": 5, ..., "includes": {...}}``.
+    Listas sem paginação são envolvidas em ``{"results": [...], "includes"}``.
+
+    ``sideload_fields`` mapeia o campo aninhado para (nome em ``includes``,
+    serializer). Deve vir antes de SparseFieldsetsMixin e FastReadMixin.
+    """
+
+    sideload_fields = {}
+    include_query_param = "include"
+
+    def get_sideloaded_fields(self):
+        """Campos aninhados que serão side-loaded nesta requisição."""
+        if not hasattr(self, "_sideloaded_fields"):
+            self._sideloaded_fields = ()
+            if self.request is not None and self.request.method in SAFE_METHODS:
+                requested = self.request.query_params.get(self.include_query_param)
+                requested = {name.strip() for name in (requested or "").split(",")}
+                self._sideloaded_fields = tuple(
+                    field
+                    for field, (include, _) in self.sideload_fields.items()
+                    if include in requested
+                )
+        return self._sideloaded_fields
+
+    def expands(self, name):
+        if name in self.get_sideloaded_fields():
+            return False
+        return super().expands(name)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["sideload"] = self.get_sideloaded_fields()
+        return context
+
+    def use_fast_serialization(self):
+        return super().use_fast_serialization() and not self.get_sideloaded_fields()
+
+    def get_includes(self, data):
+        """Busca e serializa, em lote, os objetos referenciados em ``data``."""
+        includes = {}
+        for field in self.get_sideloaded_fields():
+            include, serializer_class = self.sideload_fields[field]
+            ids = {item[f"{field}_id"] for item in data if f"{field}_id" in item}
+            includes.setdefault(include, {})
+            if not ids:
+                continue
+            model = serializer_class.Meta.model
+            objects = model.objects.filter(pk__in=ids).order_by("pk")
+            serializer = serializer_class(
+                objects, many=True, context={"request": self.request}
+            )
+            includes[include].update(
+                (str(item["id"]), item) for item in serializer.data
+            )
+        return includes
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Anexa ``includes`` às respostas de sucesso: ao lado de ``results``
+        nas páginas e listas e dentro do objeto em respostas de um item.
+        """
+        response = super().finalize_response(request, response, *args, **kwargs)
+        data = getattr(response, "data", None)
+        if not self.get_sideloaded_fields() or response.status_code != 200:
+            return response
+        if isinstance(data, list):
+            response.data = {"results": data, "includes": self.get_includes(data)}
+        elif isinstance(data, dict):
+            items = data["results"] if "results" in data else [data]
+            data["includes"] = self.get_includes(items)
+        return response
@@ -0,0 +1,37 @@
+"""
+SparseFieldsetsMixin - Suporte a ?fields= / ?exclude= / ?expand= em viewsets.
+"""
+
+from rest_framework.permissions import SAFE_METHODS
+
+from core.serializers import FieldSet
+
+
+class SparseFieldsetsMixin:
+    """
+    Lê a seleção de campos da requisição e a repassa ao serializer.
+
+    Só vale para leituras. Viewsets usam ``get_fieldset()`` em
+    ``get_queryset()`` para pular joins de relações não expandidas. Deve
+    vir antes de FastReadMixin: seleções de campos usam o serializer DRF.
+    """
+
+    def get_fieldset(self):
+        if not hasattr(self, "_fieldset"):
+            self._fieldset = None
+            if self.request is not None and self.request.method in SAFE_METHODS:
+                self._fieldset = FieldSet.from_request(self.request)
+        return self._fieldset
+
+    def expands(self, name):
+        """Indica se a relação ``name`` será serializada por completo."""
+        fieldset = self.get_fieldset()
+        return fieldset is None or fieldset.expands(name)
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["fieldset"] = self.get_fieldset()
+        return context
+
+    def use_fast_serialization(self):
+        return super().use_fast_serialization() and self.get_fieldset() is None
@@ -0,0 +1,114 @@
+"""
+Comando: benchmark_renderers
+
+Compara tempo de codificação e tamanho da resposta entre o JSONRenderer do
+DRF, o FastJSONRenderer e o MessagePackRenderer, sobre a saída do
+PostSerializer para uma página de posts (sem acessar o banco).
+"""
+
+import timeit
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import FastJSONRenderer, MessagePackRenderer
+from posts.models import Post
+from posts.serializers import PostSerializer
+from users.models import User
+
+RENDERERS = [JSONRenderer, FastJSONRenderer, MessagePackRenderer]
+
+CONTENT = (
+    "Acabei de publicar a nova versão da API 🚀 — paginação por cursor, "
+    "contadores desnormalizados e respostas bem mais rápidas. #django #drf"
+)
+
+
+def build_page(size, authors):
+    """Monta a saída do PostSerializer para ``size`` posts em memória."""
+    now = timezone.now()
+    users = [
+        User(
+            id=i,
+            username=f"user{i}",
+            email=f"user{i}@example.com",
+            first_name="Usuário",
+            last_name=f"Número {i}",
+            bio="Desenvolvedor backend, café e código aberto.",
+            profile_image=f"profile_images/user{i}.jpg",
+            followers_count=1000 + i,
+            following_count=100 + i,
+            posts_count=500 + i,
+            created_at=now - timedelta(days=365),
+        )
+        for i in range(1, authors + 1)
+    ]
+    posts = [
+        Post(
+            id=i,
+            author=users[i % authors],
+            content=CONTENT[: 80 + i % 200],
+            image=f"post_images/{i}.jpg" if i % 3 == 0 else "",
+            likes_count=i * 7,
+            comments_count=i * 2,
+            created_at=now - timedelta(minutes=i),
+            updated_at=now - timedelta(minutes=i),
+        )
+        for i in range(1, size + 1)
+    ]
+
+    return {
+        "next": "http://localhost/api/posts/feed/?max_id=1",
+        "previous": None,
+        "results": PostSerializer(posts, many=True).data,
+    }
+
+
+class Command(BaseCommand):
+    help = "Compara tempo e tamanho de resposta entre os renderers da API."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--size", type=int, default=100, help="Posts por resposta (padrão: 100)."
+        )
+        parser.add_argument(
+            "--authors", type=int, default=20, help="Autores distintos (padrão: 20)."
+        )
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=200,
+            help="Codificações por medição (padrão: 200).",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Medições por renderer (padrão: 5)."
+        )
+
+    def handle(self, *args, **options):
+        data = build_page(options["size"], options["authors"])
+        number = options["number"]
+
+        baseline = None
+        self.stdout.write(
+            f"{'renderer':<22}{'media type':<22}{'bytes':>10}{'µs/resposta':>14}"
+            f"{'speedup':>10}"
+        )
+        for renderer_class in RENDERERS:
+            renderer = renderer_class()
+            payload = renderer.render(data, renderer.media_type)
+            best = min(
+                timeit.repeat(
+                    lambda: renderer.render(data, renderer.media_type),
+                    number=number,
+                    repeat=options["repeat"],
+                )
+            )
+            per_call = best / number * 1_000_000
+            baseline = baseline or per_call
+            self.stdout.write(
+                f"{renderer_class.__name__:<22}{renderer.media_type:<22}"
+                f"{len(payload):>10}{per_call:>14.1f}{baseline / per_call:>9.1f}x"
+            )
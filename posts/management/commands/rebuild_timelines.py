@@ -0,0 +1,37 @@
+"""
+Comando: rebuild_timelines
+
+Reconstrói as timelines materializadas a partir de Post e Follow.
+Útil para popular timelines de usuários criados antes do fan-out on write.
+"""
+
+from django.core.management.base import BaseCommand
+
+from posts.services import timeline
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = "Reconstrói as timelines materializadas dos usuários."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="ID do usuário a reconstruir (pode ser repetido).",
+        )
+
+    def handle(self, *args, **options):
+        user_ids = options["user_ids"]
+        if not user_ids:
+            user_ids = User.objects.order_by("id").values_list("id", flat=True)
+            user_ids = user_ids.iterator(chunk_size=1000)
+
+        total = 0
+        for user_id in user_ids:
+            timeline.rebuild(user_id)
+            total += 1
+
+        self.stdout.write(self.style.SUCCESS(f"{total} timeline(s) reconstruída(s)."))
@@ -0,0 +1,20 @@
+"""
+Comando: reconcile_post_counters
+
+Recalcula likes_count e comments_count de Post a partir de Like e Comment.
+Com o buffer de contadores ativo, rode após os workers gravarem os deltas
+pendentes para não relatar divergências transitórias.
+"""
+
+from core.management.reconcile import ReconcileCommand
+from posts.models import Comment, Like, Post
+
+
+class Command(ReconcileCommand):
+    help = "Detecta e corrige divergências nos contadores de posts."
+
+    model = Post
+    counters = {
+        "likes_count": (Like, "post_id"),
+        "comments_count": (Comment, "post_id"),
+    }
@@ -1,11 +1,12 @@
 """
 Posts models package.
 
-Expõe os models Post, Comment e Like.
+Expõe os models Post, Comment, Like e TimelineEntry.
 """
 
 from .comment import Comment
 from .like import Like
 from .post import Post
+from .timeline_entry import TimelineEntry
 
-__all__ = ["Post", "Comment", "Like"]
+__all__ = ["Post", "Comment", "Like", "TimelineEntry"]
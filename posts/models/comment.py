@@ -6,6 +6,21 @@ from django.conf import settings
 from django.db import models
 
 
+class CommentQuerySet(models.QuerySet):
+    """QuerySet de Comment com os joins usados pelos serializers."""
+
+    def with_related(self, user=True):
+        """
+        Carrega o usuário no mesmo SELECT (usado em CommentSerializer).
+
+        Com ``user=False`` (usuário não expandido na resposta) o join é
+        omitido.
+        """
+        if not user:
+            return self.all()
+        return self.select_related("user")
+
+
 class Comment(models.Model):
     """
     Modelo para comentários em posts.
@@ -37,6 +52,8 @@ class Comment(models.Model):
 
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Atualizado em")
 
+    objects = CommentQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Comentário"
         verbose_name_plural = "Comentários"
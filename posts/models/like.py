@@ -6,6 +6,14 @@ from django.conf import settings
 from django.db import models
 
 
+class LikeQuerySet(models.QuerySet):
+    """QuerySet de Like com os joins usados pelos serializers."""
+
+    def with_related(self):
+        """Carrega o usuário no mesmo SELECT (user_username do serializer)."""
+        return self.select_related("user")
+
+
 class Like(models.Model):
     """
     Modelo para curtidas em posts.
@@ -29,6 +37,8 @@ class Like(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Criado em")
 
+    objects = LikeQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Curtida"
         verbose_name_plural = "Curtidas"
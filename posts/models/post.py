@@ -5,8 +5,25 @@ Post model - Postagens do sistema.
 from django.conf import settings
 from django.db import models
 
+from core.db import CounterFieldsMixin
 
-class Post(models.Model):
+
+class PostQuerySet(models.QuerySet):
+    """QuerySet de Post com os joins usados pelos serializers."""
+
+    def with_related(self, author=True):
+        """
+        Carrega o autor no mesmo SELECT (usado em PostSerializer).
+
+        Com ``author=False`` (autor não expandido na resposta) o join é
+        omitido.
+        """
+        if not author:
+            return self.all()
+        return self.select_related("author")
+
+
+class Post(CounterFieldsMixin, models.Model):
     """
     Modelo para postagens (tweets).
 
@@ -34,10 +51,23 @@ class Post(models.Model):
         help_text="Imagem anexada ao post (opcional)",
     )
 
+    # Contadores desnormalizados (mantidos por posts.services.counters)
+    likes_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Curtidas"
+    )
+
+    comments_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Comentários"
+    )
+
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Criado em")
 
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Atualizado em")
 
+    objects = PostQuerySet.as_manager()
+
+    counter_fields = ("likes_count", "comments_count")
+
     class Meta:
         verbose_name = "Post"
         verbose_name_plural = "Posts"
@@ -49,13 +79,3 @@ class Post(models.Model):
 
     def __str__(self):
         return f"{self.author.username}: {self.content[:50]}"
-
-    @property
-    def likes_count(self):
-        """Retorna quantidade de curtidas."""
-        return self.likes.count()
-
-    @property
-    def comments_count(self):
-        """Retorna quantidade de comentários."""
-        return self.comments.count()
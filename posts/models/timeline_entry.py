@@ -0,0 +1,48 @@
+"""
+TimelineEntry model - Timeline materializada dos usuários.
+"""
+
+from django.conf import settings
+from django.db import models
+
+
+class TimelineEntry(models.Model):
+    """
+    Modelo para entradas da timeline (home feed) de um usuário.
+
+    Preenchido no momento da escrita (fan-out on write): quando um post é
+    criado, uma entrada é gravada para o autor e para cada seguidor. O feed
+    passa a ser lido com um único range scan no índice (user, -created_at).
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="timeline",
+        on_delete=models.CASCADE,
+        verbose_name="Usuário",
+        help_text="Dono da timeline",
+    )
+
+    post = models.ForeignKey(
+        "posts.Post",
+        related_name="timeline_entries",
+        on_delete=models.CASCADE,
+        verbose_name="Post",
+    )
+
+    created_at = models.DateTimeField(
+        verbose_name="Criado em",
+        help_text="Cópia de Post.created_at, usada para ordenar a timeline",
+    )
+
+    class Meta:
+        verbose_name = "Entrada de timeline"
+        verbose_name_plural = "Entradas de timeline"
+        ordering = ["-created_at"]
+        unique_together = ("user", "post")
+        indexes = [
+            models.Index(fields=["user", "-created_at"]),
+        ]
+
+    def __str__(self):
+        return f"Post {self.post_id} na timeline de {self.user_id}"
@@ -0,0 +1,8 @@
+"""
+Posts pagination package.
+"""
+
+from .comment_pagination import CommentPagination
+from .timeline_pagination import TimelinePagination
+
+__all__ = ["CommentPagination", "TimelinePagination"]
@@ -0,0 +1,18 @@
+"""
+Comment pagination.
+"""
+
+from core.pagination import KeysetPagination
+
+
+class CommentPagination(KeysetPagination):
+    """
+    Paginação keyset dos comentários de um post, do mais recente ao mais
+    antigo.
+
+    Pagina comentários pelo índice (post, -created_at); os cursores
+    max_id/since_id são IDs de comentários.
+    """
+
+    ordering_field = "created_at"
+    id_field = "id"
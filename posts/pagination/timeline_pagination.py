@@ -0,0 +1,17 @@
+"""
+Timeline pagination.
+"""
+
+from core.pagination import KeysetPagination
+
+
+class TimelinePagination(KeysetPagination):
+    """
+    Paginação keyset da home timeline.
+
+    Pagina entradas de TimelineEntry pelo índice (user, -created_at); os
+    cursores max_id/since_id são IDs de posts.
+    """
+
+    ordering_field = "created_at"
+    id_field = "post_id"
@@ -3,6 +3,7 @@ Posts serializers package.
 """
 
 from .comment_serializer import CommentSerializer
+from .fast_post_serializer import FastCommentSerializer, FastPostSerializer
 from .like_serializer import LikeSerializer
 from .post_serializer import PostCreateSerializer, PostSerializer
 
@@ -11,4 +12,6 @@ __all__ = [
     "PostCreateSerializer",
     "CommentSerializer",
     "LikeSerializer",
+    "FastPostSerializer",
+    "FastCommentSerializer",
 ]
@@ -4,13 +4,16 @@ Comment serializer.
 
 from rest_framework import serializers
 
+from core.serializers import DynamicFieldsMixin
 from posts.models import Comment
 from users.serializers import UserSerializer
 
 
-class CommentSerializer(serializers.ModelSerializer):
+class CommentSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     """
     Serializer para comentários.
+
+    Aceita seleção de campos (?fields= / ?exclude= / ?expand=).
     """
 
     user = UserSerializer(read_only=True)
@@ -0,0 +1,76 @@
+"""
+Fast post serializers.
+"""
+
+from core.serializers import FastSerializer
+from posts.models import Comment, Post
+from posts.services import counters, likes
+from users.serializers import FastUserSerializer
+
+
+class FastPostSerializer(FastSerializer):
+    """
+    Versão de leitura rápida do PostSerializer (mesma saída).
+    """
+
+    model = Post
+    fields = (
+        "id",
+        "author",
+        "content",
+        "image",
+        "likes_count",
+        "comments_count",
+        "liked_by_me",
+        "created_at",
+        "updated_at",
+    )
+    datetime_fields = ("created_at", "updated_at")
+    file_fields = ("image",)
+    nested = {"author": (FastUserSerializer, "author")}
+
+    @classmethod
+    def extra_value_fields(cls):
+        return (counters.LIKES, counters.COMMENTS)
+
+    def prepare(self, rows, prefix=""):
+        super().prepare(rows, prefix)
+        self.prepared = {row[f"{prefix}id"] for row in rows}
+        self.liked = set()
+        if self.viewer is not None:
+            self.liked = likes.liked_post_ids(self.viewer, self.prepared)
+
+    def get_liked_by_me(self, row, prefix=""):
+        if row[f"{prefix}id"] not in getattr(self, "prepared", ()):
+            # Serialização avulsa, sem prepare(): carrega só esta linha
+            self.prepare([row], prefix)
+        return row[f"{prefix}id"] in self.liked
+
+    def get_likes_count(self, row, prefix=""):
+        return self.get_counter(row, prefix, counters.LIKES)
+
+    def get_comments_count(self, row, prefix=""):
+        return self.get_counter(row, prefix, counters.COMMENTS)
+
+    def get_counter(self, row, prefix, field):
+        """Valor gravado + deltas pendentes no buffer de contadores."""
+        pending = counters.buffer.pending(row[f"{prefix}id"], field)
+        return max(row[f"{prefix}{field}"] + pending, 0)
+
+
+class FastCommentSerializer(FastSerializer):
+    """
+    Versão de leitura rápida do CommentSerializer (mesma saída).
+    """
+
+    model = Comment
+    fields = (
+        "id",
+        "user",
+        "post",
+        "content",
+        "created_at",
+        "updated_at",
+    )
+    datetime_fields = ("created_at", "updated_at")
+    nested = {"user": (FastUserSerializer, "user")}
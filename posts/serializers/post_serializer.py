@@ -4,18 +4,39 @@ Post serializers.
 
 from rest_framework import serializers
 
+from core.cache import FragmentCache
+from core.serializers import (
+    DynamicFieldsMixin,
+    FragmentCacheListSerializer,
+    FragmentCacheMixin,
+    ViewerStateMixin,
+)
 from posts.models import Post
+from posts.services import counters, likes
 from users.serializers import UserSerializer
 
 
-class PostSerializer(serializers.ModelSerializer):
+class PostSerializer(
+    DynamicFieldsMixin,
+    FragmentCacheMixin,
+    ViewerStateMixin,
+    serializers.ModelSerializer,
+):
     """
     Serializer para exibição de posts.
+
+    Aceita seleção de campos (?fields= / ?exclude= / ?expand=). Os campos
+    do próprio post ficam em cache por (id, updated_at); autor, contadores
+    e ``liked_by_me`` são sempre lidos na hora.
     """
 
+    fragment_cache = FragmentCache("POST_FRAGMENT_CACHE")
+    live_fields = ("author", "likes_count", "comments_count", "liked_by_me")
+
     author = UserSerializer(read_only=True)
-    likes_count = serializers.ReadOnlyField()
-    comments_count = serializers.ReadOnlyField()
+    likes_count = serializers.SerializerMethodField()
+    comments_count = serializers.SerializerMethodField()
+    liked_by_me = serializers.SerializerMethodField()
 
     class Meta:
         model = Post
@@ -26,10 +47,27 @@ class PostSerializer(serializers.ModelSerializer):
             "image",
             "likes_count",
             "comments_count",
+            "liked_by_me",
             "created_at",
             "updated_at",
         ]
         read_only_fields = ["id", "author", "created_at", "updated_at"]
+        list_serializer_class = FragmentCacheListSerializer
+
+    def get_likes_count(self, obj):
+        """Curtidas gravadas + pendentes no buffer de contadores."""
+        return counters.current(obj, counters.LIKES)
+
+    def get_comments_count(self, obj):
+        """Comentários gravados + pendentes no buffer de contadores."""
+        return counters.current(obj, counters.COMMENTS)
+
+    def get_liked_by_me(self, obj):
+        """Se o usuário autenticado curtiu o post (em lote por página)."""
+        return self.viewer_state("liked", obj)
+
+    def get_viewer_state(self, viewer, pks):
+        return {"liked": likes.liked_post_ids(viewer, pks)}
 
 
 class PostCreateSerializer(serializers.ModelSerializer):
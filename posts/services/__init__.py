@@ -0,0 +1,9 @@
+"""
+Posts services package.
+
+Regras de negócio que não pertencem a um model ou view específicos.
+"""
+
+from . import counters, likes, timeline
+
+__all__ = ["counters", "likes", "timeline"]
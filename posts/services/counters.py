@@ -0,0 +1,163 @@
+"""
+Counters service - Contadores desnormalizados de Post.
+
+Os contadores são atualizados com expressões F() em um único UPDATE, sem
+ler o valor atual, então escritas concorrentes não se sobrescrevem.
+
+Com ``POST_COUNTERS_BUFFER["ENABLED"]`` ativo, os deltas são acumulados em
+memória e aplicados em lote periodicamente. Em um post viral, milhares de
+curtidas viram um único UPDATE por intervalo em vez de disputar o lock da
+mesma linha a cada curtida. As leituras somam o valor gravado com os deltas
+pendentes do processo.
+
+Além da gravação disparada pelas escritas, uma thread em segundo plano
+grava o buffer a cada ``FLUSH_INTERVAL``, então um delta isolado em um
+worker ocioso não fica pendente indefinidamente.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.db import close_old_connections, transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from core.conf import app_settings
+from posts.models import Post
+
+LIKES = "likes_count"
+COMMENTS = "comments_count"
+
+logger = logging.getLogger(__name__)
+
+
+def _apply(post_ids, field, delta):
+    """Aplica ``delta`` ao contador ``field`` dos posts (nunca abaixo de zero)."""
+    Post.objects.filter(pk__in=post_ids).update(
+        **{field: Greatest(F(field) + delta, 0)}
+    )
+
+
+class CounterBuffer:
+    """
+    Buffer em memória de deltas de contadores, por processo.
+
+    Os deltas são agregados por (post, contador) e gravados agrupando os
+    posts com o mesmo delta em um único UPDATE. A gravação acontece na
+    escrita que ultrapassa ``FLUSH_INTERVAL`` ou ``MAX_PENDING``, na thread
+    de gravação periódica, ao final do processo ou chamando ``flush()``
+    explicitamente.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = defaultdict(int)
+        self._last_flush = time.monotonic()
+        self._flusher = None
+
+    def add(self, post_id, field, delta):
+        """
+        Acumula um delta e grava o buffer se estiver vencido. Uma falha na
+        gravação não propaga: os deltas voltam ao buffer para a próxima.
+        """
+        with self._lock:
+            self._pending[(post_id, field)] += delta
+            due = self._is_due()
+            self._start_flusher()
+
+        if due:
+            self.flush_safely()
+
+    def pending(self, post_id, field):
+        """Retorna o delta ainda não gravado de um contador."""
+        return self._pending.get((post_id, field), 0)
+
+    def flush(self):
+        """Grava todos os deltas pendentes no banco."""
+        with self._lock:
+            pending, self._pending = self._pending, defaultdict(int)
+            self._last_flush = time.monotonic()
+
+        # Agrupar posts com o mesmo (contador, delta) em um único UPDATE
+        groups = defaultdict(list)
+        for (post_id, field), delta in pending.items():
+            if delta:
+                groups[(field, delta)].append(post_id)
+
+        try:
+            with transaction.atomic():
+                for (field, delta), post_ids in groups.items():
+                    _apply(post_ids, field, delta)
+        except Exception:
+            # Devolver os deltas ao buffer para a próxima tentativa
+            with self._lock:
+                for key, delta in pending.items():
+                    self._pending[key] += delta
+            raise
+
+    def flush_safely(self):
+        """Grava o buffer registrando (sem propagar) erros do banco."""
+        try:
+            self.flush()
+        except Exception:
+            logger.exception("Falha ao gravar o buffer de contadores de Post")
+
+    def clear(self):
+        """Descarta os deltas pendentes sem gravar."""
+        with self._lock:
+            self._pending.clear()
+
+    def _start_flusher(self):
+        """Inicia a thread de gravação periódica (uma por processo)."""
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(
+                target=self._run_flusher, name="post-counters-flusher", daemon=True
+            )
+            self._flusher.start()
+
+    def _run_flusher(self):
+        while True:
+            time.sleep(app_settings("POST_COUNTERS_BUFFER")["FLUSH_INTERVAL"])
+            if self._pending:
+                self.flush_safely()
+                close_old_connections()
+
+    def _is_due(self):
+        options = app_settings("POST_COUNTERS_BUFFER")
+        return (
+            len(self._pending) >= options["MAX_PENDING"]
+            or time.monotonic() - self._last_flush >= options["FLUSH_INTERVAL"]
+        )
+
+
+buffer = CounterBuffer()
+
+
+@atexit.register
+def _flush_on_exit():
+    """Grava os deltas pendentes quando o processo termina."""
+    if app_settings("POST_COUNTERS_BUFFER")["ENABLED"]:
+        buffer.flush()
+
+
+def increment(post_id, field, delta=1):
+    """Soma ``delta`` ao contador ``field`` do post."""
+    if not app_settings("POST_COUNTERS_BUFFER")["ENABLED"]:
+        _apply([post_id], field, delta)
+        return
+
+    # Só acumula se a escrita que gerou o delta for confirmada
+    transaction.on_commit(lambda: buffer.add(post_id, field, delta))
+
+
+def decrement(post_id, field, delta=1):
+    """Subtrai ``delta`` do contador ``field`` do post."""
+    increment(post_id, field, -delta)
+
+
+def current(post, field):
+    """Valor do contador: gravado na linha + deltas pendentes no buffer."""
+    return max(getattr(post, field) + buffer.pending(post.pk, field), 0)
@@ -0,0 +1,31 @@
+"""
+Likes service - Curtir/descurtir e curtidas de um usuário em vários posts.
+"""
+
+from core.db import delete_existing, insert_ignore
+from posts.models import Like
+
+
+def like(user, post_id):
+    """
+    Curte o post (idempotente). Retorna o Like criado, ou None se já
+    estava curtido ou o post não existe.
+    """
+    return insert_ignore(Like, user=user, post_id=post_id)
+
+
+def unlike(user, post_id):
+    """Descurte o post (idempotente). Retorna True se havia curtida."""
+    return delete_existing(Like, user=user, post_id=post_id)
+
+
+def liked_post_ids(user, post_ids):
+    """IDs, dentre ``post_ids``, dos posts curtidos por ``user`` (uma consulta)."""
+    post_ids = list(post_ids)
+    if not post_ids:
+        return set()
+    return set(
+        Like.objects.filter(user_id=user.pk, post_id__in=post_ids).values_list(
+            "post_id", flat=True
+        )
+    )
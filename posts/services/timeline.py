@@ -0,0 +1,125 @@
+"""
+Timeline service - Fan-out on write da home timeline.
+
+Cada post é copiado (como TimelineEntry) para a timeline do autor e de
+todos os seus seguidores no momento da criação. Seguir/deixar de seguir
+alguém faz backfill/remoção dos posts daquele autor na timeline.
+"""
+
+from django.conf import settings
+
+from posts.models import Post, TimelineEntry
+from users.models import Follow
+
+# Quantidade de linhas gravadas por INSERT durante o fan-out
+BATCH_SIZE = 1000
+
+
+def _backfill_size():
+    """Quantidade de posts copiados para a timeline ao seguir alguém."""
+    return getattr(settings, "TIMELINE_BACKFILL_SIZE", 200)
+
+
+def _bulk_insert(entries):
+    """Grava as entradas ignorando as que já existem."""
+    TimelineEntry.objects.bulk_create(
+        entries, batch_size=BATCH_SIZE, ignore_conflicts=True
+    )
+
+
+def fan_out_post(post):
+    """
+    Distribui um post recém-criado para a timeline do autor e dos seguidores.
+
+    Os IDs dos seguidores são lidos em streaming, então a memória usada não
+    depende da quantidade de seguidores do autor.
+    """
+    follower_ids = (
+        Follow.objects.filter(following_id=post.author_id)
+        .order_by()
+        .values_list("follower_id", flat=True)
+        .iterator(chunk_size=BATCH_SIZE)
+    )
+
+    batch = [
+        TimelineEntry(user_id=post.author_id, post=post, created_at=post.created_at)
+    ]
+    for follower_id in follower_ids:
+        batch.append(
+            TimelineEntry(user_id=follower_id, post=post, created_at=post.created_at)
+        )
+        if len(batch) >= BATCH_SIZE:
+            _bulk_insert(batch)
+            batch = []
+
+    if batch:
+        _bulk_insert(batch)
+
+
+def backfill_follow(follower_id, following_id):
+    """Copia os posts mais recentes de quem passou a ser seguido."""
+    posts = (
+        Post.objects.filter(author_id=following_id)
+        .order_by("-created_at")
+        .values_list("id", "created_at")[: _backfill_size()]
+    )
+
+    _bulk_insert(
+        [
+            TimelineEntry(user_id=follower_id, post_id=post_id, created_at=created_at)
+            for post_id, created_at in posts
+        ]
+    )
+
+
+def backfill_follows(follower_id, following_ids):
+    """Backfill de vários usuários seguidos de uma vez."""
+    for following_id in following_ids:
+        backfill_follow(follower_id, following_id)
+
+
+def remove_follow(follower_id, following_id):
+    """Remove da timeline os posts de quem deixou de ser seguido."""
+    remove_follows(follower_id, [following_id])
+
+
+def remove_follows(follower_id, following_ids):
+    """Remove da timeline os posts de vários usuários, em um único DELETE."""
+    TimelineEntry.objects.filter(
+        user_id=follower_id, post__author_id__in=following_ids
+    ).delete()
+
+
+def rebuild(user_id):
+    """
+    Reconstrói do zero a timeline de um usuário.
+
+    Usado pelo comando ``rebuild_timelines`` para popular timelines de
+    usuários que já existiam antes da timeline materializada.
+    """
+    TimelineEntry.objects.filter(user_id=user_id).delete()
+
+    author_ids = list(
+        Follow.objects.filter(follower_id=user_id).values_list(
+            "following_id", flat=True
+        )
+    )
+    author_ids.append(user_id)
+
+    for author_id in author_ids:
+        backfill_follow(user_id, author_id)
+
+
+def home_timeline(user, author=True):
+    """
+    Retorna as entradas da timeline de um usuário, mais recentes primeiro.
+
+    A consulta percorre o índice (user, -created_at) de TimelineEntry e
+    traz post e autor (se ``author``) no mesmo SELECT.
+    """
+    related = "post__author" if author else "post"
+    return (
+        TimelineEntry.objects.filter(user_id=user.pk)
+        .select_related(related)
+        .order_by("-created_at", "-post_id")
+    )
@@ -0,0 +1,87 @@
+"""
+Posts signals.
+
+Mantém a timeline materializada, os contadores de Post e o contador de
+posts do autor sincronizados com posts, curtidas, comentários e follows,
+independente de onde a escrita aconteça (API, admin ou shell).
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from posts.models import Comment, Like, Post
+from posts.services import counters, timeline
+from users.models import Follow
+from users.services import counters as user_counters
+from users.services import follows
+
+
+@receiver(post_save, sender=Post)
+def fan_out_new_post(sender, instance, created, **kwargs):
+    """Distribui o post novo para as timelines."""
+    if created:
+        timeline.fan_out_post(instance)
+
+
+@receiver(post_save, sender=Post)
+def increment_posts_count(sender, instance, created, **kwargs):
+    """Incrementa o contador de posts do autor."""
+    if created:
+        user_counters.increment(instance.author_id, user_counters.POSTS)
+
+
+@receiver(post_delete, sender=Post)
+def decrement_posts_count(sender, instance, **kwargs):
+    """Decrementa o contador de posts do autor."""
+    user_counters.decrement(instance.author_id, user_counters.POSTS)
+
+
+@receiver(post_save, sender=Follow)
+def backfill_timeline_on_follow(sender, instance, created, **kwargs):
+    """Copia posts recentes de quem passou a ser seguido."""
+    if created:
+        timeline.backfill_follow(instance.follower_id, instance.following_id)
+
+
+@receiver(post_delete, sender=Follow)
+def prune_timeline_on_unfollow(sender, instance, **kwargs):
+    """Remove posts de quem deixou de ser seguido."""
+    timeline.remove_follow(instance.follower_id, instance.following_id)
+
+
+@receiver(follows.followed, sender=Follow)
+def backfill_timeline_on_bulk_follow(sender, follower_id, following_ids, **kwargs):
+    """Copia posts recentes de quem passou a ser seguido (em lote)."""
+    timeline.backfill_follows(follower_id, following_ids)
+
+
+@receiver(follows.unfollowed, sender=Follow)
+def prune_timeline_on_bulk_unfollow(sender, follower_id, following_ids, **kwargs):
+    """Remove posts de quem deixou de ser seguido (em lote)."""
+    timeline.remove_follows(follower_id, following_ids)
+
+
+@receiver(post_save, sender=Like)
+def increment_likes_count(sender, instance, created, **kwargs):
+    """Incrementa o contador de curtidas do post."""
+    if created:
+        counters.increment(instance.post_id, counters.LIKES)
+
+
+@receiver(post_delete, sender=Like)
+def decrement_likes_count(sender, instance, **kwargs):
+    """Decrementa o contador de curtidas do post."""
+    counters.decrement(instance.post_id, counters.LIKES)
+
+
+@receiver(post_save, sender=Comment)
+def increment_comments_count(sender, instance, created, **kwargs):
+    """Incrementa o contador de comentários do post."""
+    if created:
+        counters.increment(instance.post_id, counters.COMMENTS)
+
+
+@receiver(post_delete, sender=Comment)
+def decrement_comments_count(sender, instance, **kwargs):
+    """Decrementa o contador de comentários do post."""
+    counters.decrement(instance.post_id, counters.COMMENTS)
@@ -0,0 +1,85 @@
+"""
+Testes para os comandos de gerenciamento do app posts.
+"""
+
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+import pytest
+
+from posts.models import Comment, Like, Post
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestReconcilePostCounters:
+    """Testes para o comando reconcile_post_counters."""
+
+    @pytest.fixture
+    def post(self):
+        author = User.objects.create_user(username="author", password="pass123")
+        liker = User.objects.create_user(username="liker", password="pass123")
+        post = Post.objects.create(author=author, content="Post")
+        Like.objects.create(user=liker, post=post)
+        Comment.objects.create(user=liker, post=post, content="Comment")
+        return post
+
+    def test_reports_without_fixing(self, post):
+        """Testa que sem --fix apenas relata as divergências."""
+        Post.objects.filter(pk=post.pk).update(likes_count=7)
+        out = StringIO()
+
+        call_command("reconcile_post_counters", stdout=out)
+
+        post.refresh_from_db()
+        assert post.likes_count == 7
+        assert "likes_count: 1" in out.getvalue()
+
+    def test_fixes_drift(self, post):
+        """Testa correção de contadores divergentes."""
+        Post.objects.filter(pk=post.pk).update(likes_count=7, comments_count=0)
+
+        call_command("reconcile_post_counters", "--fix", stdout=StringIO())
+
+        post.refresh_from_db()
+        assert post.likes_count == 1
+        assert post.comments_count == 1
+
+    def test_small_chunks(self, post):
+        """Testa processamento em várias faixas de ID."""
+        other = Post.objects.create(author=post.author, content="Other")
+        Post.objects.filter(pk=other.pk).update(comments_count=3)
+
+        call_command(
+            "reconcile_post_counters", "--fix", "--chunk-size=1", stdout=StringIO()
+        )
+
+        other.refresh_from_db()
+        post.refresh_from_db()
+        assert other.comments_count == 0
+        assert post.comments_count == 1
+
+    def test_no_drift(self, post):
+        """Testa saída quando todos os contadores estão corretos."""
+        out = StringIO()
+
+        call_command("reconcile_post_counters", stdout=out)
+
+        assert "corretos" in out.getvalue()
+
+
+class TestBenchmarkRenderers:
+    """Testes para o comando benchmark_renderers."""
+
+    def test_reports_each_renderer(self):
+        """Testa relatório com tamanho e tempo de cada renderer."""
+        out = StringIO()
+
+        call_command("benchmark_renderers", size=5, number=1, repeat=1, stdout=out)
+
+        output = out.getvalue()
+        for name in ["JSONRenderer", "FastJSONRenderer", "MessagePackRenderer"]:
+            assert name in output
@@ -2,11 +2,21 @@
 Testes para os models do app posts.
 """
 
+import threading
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
 
 import pytest
 
-from posts.models import Comment, Like, Post
+from posts.models import Comment, Like, Post, TimelineEntry
+from posts.services import counters
+from users.models import Follow
+from users.services import follows
 
 User = get_user_model()
 
@@ -48,6 +58,8 @@ class TestPostModel:
         Like.objects.create(user=user2, post=post)
         Like.objects.create(user=user3, post=post)
 
+        # Contador é atualizado no banco, recarregar a instância
+        post.refresh_from_db()
         assert post.likes_count == 2
 
     def test_post_comments_count(self):
@@ -61,8 +73,42 @@ class TestPostModel:
         Comment.objects.create(user=user2, post=post, content="Comment 2")
         Comment.objects.create(user=user2, post=post, content="Comment 3")
 
+        post.refresh_from_db()
         assert post.comments_count == 3
 
+    def test_counters_decrement_on_delete(self):
+        """Testa que os contadores diminuem ao remover curtida/comentário."""
+        user = User.objects.create_user(username="author", password="pass123")
+        user2 = User.objects.create_user(username="user2", password="pass123")
+
+        post = Post.objects.create(author=user, content="Test")
+        like = Like.objects.create(user=user2, post=post)
+        comment = Comment.objects.create(user=user2, post=post, content="Comment")
+
+        like.delete()
+        comment.delete()
+
+        post.refresh_from_db()
+        assert post.likes_count == 0
+        assert post.comments_count == 0
+
+    def test_save_keeps_concurrent_counter_updates(self):
+        """Testa que o save() de update não regrava os contadores lidos antes."""
+        user = User.objects.create_user(username="author", password="pass123")
+        post = Post.objects.create(author=user, content="Original")
+
+        stale = Post.objects.get(pk=post.pk)
+        Post.objects.filter(pk=post.pk).update(
+            likes_count=F("likes_count") + 1, comments_count=F("comments_count") + 2
+        )
+        stale.content = "Updated"
+        stale.save()
+
+        post.refresh_from_db()
+        assert post.content == "Updated"
+        assert post.likes_count == 1
+        assert post.comments_count == 2
+
     def test_post_content_max_length(self):
         """Testa limite de caracteres do conteúdo."""
         user = User.objects.create_user(username="testuser", password="pass123")
@@ -160,3 +206,171 @@ class TestLikeModel:
         Like.objects.create(user=liker, post=post3)
 
         assert Like.objects.filter(user=liker).count() == 3
+
+
+@pytest.mark.django_db
+class TestTimelineEntryModel:
+    """Testes para o model TimelineEntry."""
+
+    def test_post_fans_out_to_author_and_followers(self):
+        """Testa que o post novo entra na timeline do autor e dos seguidores."""
+        author = User.objects.create_user(username="author", password="pass123")
+        follower = User.objects.create_user(username="follower", password="pass123")
+        stranger = User.objects.create_user(username="stranger", password="pass123")
+        Follow.objects.create(follower=follower, following=author)
+
+        post = Post.objects.create(author=author, content="Test post")
+
+        owners = set(
+            TimelineEntry.objects.filter(post=post).values_list("user_id", flat=True)
+        )
+        assert owners == {author.id, follower.id}
+        assert not TimelineEntry.objects.filter(user=stranger).exists()
+
+    def test_follow_backfills_recent_posts(self):
+        """Testa que seguir alguém copia os posts já existentes."""
+        author = User.objects.create_user(username="author", password="pass123")
+        follower = User.objects.create_user(username="follower", password="pass123")
+        post = Post.objects.create(author=author, content="Old post")
+
+        Follow.objects.create(follower=follower, following=author)
+
+        entry = TimelineEntry.objects.get(user=follower)
+        assert entry.post == post
+        assert entry.created_at == post.created_at
+
+    def test_bulk_follow_and_unfollow_update_timeline(self):
+        """Testa backfill e remoção na timeline pelo follow em lote."""
+        author = User.objects.create_user(username="author", password="pass123")
+        other = User.objects.create_user(username="other", password="pass123")
+        follower = User.objects.create_user(username="follower", password="pass123")
+        post = Post.objects.create(author=author, content="Author post")
+        Post.objects.create(author=other, content="Other post")
+        Follow.objects.create(follower=follower, following=other)
+
+        follows.bulk_update(follower, follow_ids=[author.id], unfollow_ids=[other.id])
+
+        assert list(
+            TimelineEntry.objects.filter(user=follower).values_list("post", flat=True)
+        ) == [post.id]
+
+    def test_rebuild_timelines_command(self):
+        """Testa reconstrução da timeline a partir de Post e Follow."""
+        author = User.objects.create_user(username="author", password="pass123")
+        follower = User.objects.create_user(username="follower", password="pass123")
+        Follow.objects.create(follower=follower, following=author)
+        post = Post.objects.create(author=author, content="Post")
+        TimelineEntry.objects.all().delete()
+
+        call_command("rebuild_timelines", stdout=StringIO())
+
+        assert set(
+            TimelineEntry.objects.filter(post=post).values_list("user_id", flat=True)
+        ) == {author.id, follower.id}
+
+
+@pytest.mark.django_db
+class TestPostCounterBuffer:
+    """Testes para o buffer de contadores de Post."""
+
+    BUFFERED = {"ENABLED": True, "FLUSH_INTERVAL": 3600, "MAX_PENDING": 1000}
+
+    @pytest.fixture(autouse=True)
+    def clean_buffer(self, settings):
+        settings.POST_COUNTERS_BUFFER = self.BUFFERED
+        counters.buffer.clear()
+        yield
+        counters.buffer.clear()
+
+    def test_like_storm_is_flushed_in_one_update(
+        self, django_capture_on_commit_callbacks, django_assert_num_queries
+    ):
+        """Testa que muitas curtidas no mesmo post viram um único UPDATE."""
+        author = User.objects.create_user(username="author", password="pass123")
+        post = Post.objects.create(author=author, content="Viral")
+        likers = [
+            User.objects.create_user(username=f"liker{i}", password="pass123")
+            for i in range(20)
+        ]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            # Apenas os INSERTs das curtidas, nenhum UPDATE no post
+            with django_assert_num_queries(len(likers)):
+                for liker in likers:
+                    Like.objects.create(user=liker, post=post)
+
+        post.refresh_from_db()
+        assert post.likes_count == 0
+        assert counters.current(post, counters.LIKES) == 20
+
+        with CaptureQueriesContext(connection) as context:
+            counters.buffer.flush()
+
+        updates = [q for q in context.captured_queries if "UPDATE" in q["sql"]]
+        assert len(updates) == 1
+
+        post.refresh_from_db()
+        assert post.likes_count == 20
+        assert counters.current(post, counters.LIKES) == 20
+
+    def test_flush_when_max_pending_is_reached(
+        self, settings, django_capture_on_commit_callbacks
+    ):
+        """Testa gravação antecipada ao atingir MAX_PENDING."""
+        settings.POST_COUNTERS_BUFFER = {**self.BUFFERED, "MAX_PENDING": 2}
+        author = User.objects.create_user(username="author", password="pass123")
+        liker = User.objects.create_user(username="liker", password="pass123")
+        post1 = Post.objects.create(author=author, content="Post 1")
+        post2 = Post.objects.create(author=author, content="Post 2")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Like.objects.create(user=liker, post=post1)
+            Comment.objects.create(user=liker, post=post2, content="Comment")
+
+        post1.refresh_from_db()
+        post2.refresh_from_db()
+        assert post1.likes_count == 1
+        assert post2.comments_count == 1
+
+    def test_serializer_reads_pending_deltas(self, django_capture_on_commit_callbacks):
+        """Testa que o serializer soma o valor gravado e os deltas pendentes."""
+        from posts.serializers import PostSerializer
+
+        author = User.objects.create_user(username="author", password="pass123")
+        liker = User.objects.create_user(username="liker", password="pass123")
+        post = Post.objects.create(author=author, content="Post")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Like.objects.create(user=liker, post=post)
+
+        assert PostSerializer(post).data["likes_count"] == 1
+
+    def test_flush_error_keeps_deltas(self, settings, monkeypatch):
+        """Testa que erro ao gravar não propaga e mantém os deltas."""
+        settings.POST_COUNTERS_BUFFER = {**self.BUFFERED, "MAX_PENDING": 1}
+
+        def fail(*args):
+            raise DatabaseError("database is locked")
+
+        monkeypatch.setattr(counters, "_apply", fail)
+
+        counters.buffer.add(1, counters.LIKES, 1)
+
+        assert counters.buffer.pending(1, counters.LIKES) == 1
+
+    def test_background_flusher(self, settings):
+        """Testa gravação periódica sem novas escritas."""
+        settings.POST_COUNTERS_BUFFER = {**self.BUFFERED, "FLUSH_INTERVAL": 0.01}
+        buffer = counters.CounterBuffer()
+        flushed = threading.Event()
+
+        def flush():
+            buffer.clear()
+            flushed.set()
+
+        buffer.flush = flush
+        # Delta pendente sem passar por add(), que grava se estiver vencido
+        buffer._pending[(1, counters.LIKES)] = 1
+        buffer._start_flusher()
+
+        assert flushed.wait(timeout=5)
@@ -5,10 +5,15 @@ Testes para os serializers do app posts.
 from django.contrib.auth import get_user_model
 
 import pytest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
 
+from core.serializers import FieldSet
 from posts.models import Comment, Like, Post
 from posts.serializers import (
     CommentSerializer,
+    FastCommentSerializer,
+    FastPostSerializer,
     LikeSerializer,
     PostCreateSerializer,
     PostSerializer,
@@ -50,6 +55,7 @@ class TestPostSerializer:
         Comment.objects.create(user=user3, post=post, content="Comment 2")
         Comment.objects.create(user=user3, post=post, content="Comment 3")
 
+        post.refresh_from_db()
         serializer = PostSerializer(post)
         data = serializer.data
 
@@ -162,3 +168,146 @@ class TestLikeSerializer:
 
         # Nota: Na prática, o user é definido pelo viewset (request.user)
         # Aqui só validamos que os dados são válidos
+
+
+@pytest.mark.django_db
+class TestFastSerializersParity:
+    """Testes de paridade entre os serializers rápidos e os do DRF."""
+
+    @pytest.fixture
+    def context(self):
+        return {"request": APIRequestFactory().get("/api/posts/")}
+
+    @pytest.fixture
+    def post(self):
+        author = User.objects.create_user(
+            username="author",
+            email="author@example.com",
+            password="pass123",
+            first_name="Áuthor",
+            bio="Bio com acentuação",
+            profile_image="profile_images/author.png",
+        )
+        liker = User.objects.create_user(username="liker", password="pass123")
+        post = Post.objects.create(
+            author=author, content="Post “unicode” 🐦", image="post_images/a.png"
+        )
+        Like.objects.create(user=liker, post=post)
+        Comment.objects.create(user=liker, post=post, content="Comment")
+        return Post.objects.with_related().get(pk=post.pk)
+
+    def render(self, data):
+        return JSONRenderer().render(data)
+
+    def test_post_parity(self, post, context):
+        """Testa que FastPostSerializer gera o mesmo JSON que PostSerializer."""
+        row = Post.objects.values(*FastPostSerializer.value_fields()).get(pk=post.pk)
+
+        expected = self.render(PostSerializer(post, context=context).data)
+        fast = self.render(FastPostSerializer(context).to_representation(row))
+
+        assert fast == expected
+
+    def test_post_parity_without_request(self, post):
+        """Testa paridade sem request (URLs relativas)."""
+        row = Post.objects.values(*FastPostSerializer.value_fields()).get(pk=post.pk)
+
+        expected = self.render(PostSerializer(post).data)
+        fast = self.render(FastPostSerializer().to_representation(row))
+
+        assert fast == expected
+
+    def test_comment_parity(self, post, context):
+        """Testa que FastCommentSerializer gera o mesmo JSON."""
+        comment = Comment.objects.with_related().get(post=post)
+        row = Comment.objects.values(*FastCommentSerializer.value_fields()).get(
+            pk=comment.pk
+        )
+
+        expected = self.render(CommentSerializer(comment, context=context).data)
+        fast = self.render(FastCommentSerializer(context).to_representation(row))
+
+        assert fast == expected
+
+
+@pytest.mark.django_db
+class TestPostFragmentCache:
+    """Testes para o cache de fragmentos do PostSerializer."""
+
+    @pytest.fixture(autouse=True)
+    def clean_cache(self):
+        PostSerializer.fragment_cache.clear()
+        yield
+        PostSerializer.fragment_cache.clear()
+
+    @pytest.fixture
+    def posts(self):
+        author = User.objects.create_user(username="author", password="pass123")
+        return [
+            Post.objects.create(author=author, content=f"Post {i}") for i in range(3)
+        ]
+
+    def test_same_output_as_without_cache(self, settings, posts):
+        """Testa saída idêntica com e sem cache (inclusive a ordem dos campos)."""
+        cached = PostSerializer(posts, many=True).data
+        cached_again = PostSerializer(posts, many=True).data
+        settings.POST_FRAGMENT_CACHE = {"ENABLED": False}
+        uncached = PostSerializer(posts, many=True).data
+
+        assert JSONRenderer().render(cached) == JSONRenderer().render(uncached)
+        assert JSONRenderer().render(cached_again) == JSONRenderer().render(uncached)
+
+    def test_fragment_reused_until_post_is_saved(self, posts):
+        """Testa que o fragmento vale até o post mudar (updated_at)."""
+        post = posts[0]
+        PostSerializer(post).data
+
+        post.content = "Alterado sem salvar"
+        assert PostSerializer(post).data["content"] == "Post 0"
+
+        post.save()
+        assert PostSerializer(post).data["content"] == "Alterado sem salvar"
+
+    def test_live_fields_are_not_cached(self, posts):
+        """Testa que contadores e autor são lidos a cada serialização."""
+        post = posts[0]
+        PostSerializer(post).data
+        liker = User.objects.create_user(username="liker", password="pass123")
+        Like.objects.create(user=liker, post=post)
+        post.refresh_from_db()
+
+        assert PostSerializer(post).data["likes_count"] == 1
+
+    def test_list_uses_one_batch_read_and_write(self, monkeypatch, posts):
+        """Testa uma leitura e uma gravação em lote por página."""
+        cache = PostSerializer.fragment_cache
+        calls = {"get_many": 0, "set_many": []}
+        get_many, set_many = cache.get_many, cache.set_many
+
+        def spy_get_many(keys):
+            calls["get_many"] += 1
+            return get_many(keys)
+
+        def spy_set_many(mapping):
+            calls["set_many"].append(len(mapping))
+            return set_many(mapping)
+
+        monkeypatch.setattr(cache, "get_many", spy_get_many)
+        monkeypatch.setattr(cache, "set_many", spy_set_many)
+
+        PostSerializer(posts[:2], many=True).data
+        PostSerializer(posts, many=True).data
+
+        assert calls["get_many"] == 2
+        # Primeira página: 2 faltas; segunda: apenas o post novo
+        assert calls["set_many"] == [2, 1]
+
+    def test_variants_by_fieldset(self, posts):
+        """Testa fragmentos separados para seleções de campos diferentes."""
+        post = posts[0]
+        sparse = PostSerializer(post, context={"fieldset": FieldSet(fields=["id"])})
+
+        assert set(sparse.data) == {"id"}
+        full = PostSerializer(post).data
+        assert "content" in full
+        assert full["author"]["username"]
@@ -3,13 +3,18 @@ Testes para as views do app posts.
 """
 
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 import pytest
 from rest_framework import status
+from rest_framework.permissions import BasePermission
 from rest_framework.test import APIClient
 
 from posts.models import Comment, Like, Post
+from posts.views import CommentViewSet, PostViewSet
+from users.models import Follow
 
 User = get_user_model()
 
@@ -58,6 +63,32 @@ class TestPostViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 2
 
+    def test_list_posts_counters_read_from_row(self, api_client, user, another_user):
+        """Testa que os contadores vêm da própria linha do post."""
+        post = Post.objects.create(author=user, content="Post")
+        Like.objects.create(user=another_user, post=post)
+        Comment.objects.create(user=another_user, post=post, content="Comment")
+
+        url = reverse("post-list")
+        response = api_client.get(url)
+
+        assert response.data["results"][0]["likes_count"] == 1
+        assert response.data["results"][0]["comments_count"] == 1
+
+    def test_list_posts_constant_queries(
+        self, api_client, user, another_user, django_assert_num_queries
+    ):
+        """Testa que a listagem não faz consultas por post (N+1)."""
+        for i in range(10):
+            author = user if i % 2 else another_user
+            Post.objects.create(author=author, content=f"Post {i}")
+
+        # COUNT da paginação + SELECT com join no autor
+        with django_assert_num_queries(2):
+            response = api_client.get(reverse("post-list"))
+
+        assert len(response.data["results"]) == 10
+
     def test_retrieve_post(self, api_client, user):
         """Testa obter detalhes de post."""
         post = Post.objects.create(author=user, content="Test post")
@@ -153,7 +184,88 @@ class TestPostViewSet:
         response = authenticated_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2  # Apenas posts de quem segue + próprios
+        # Apenas posts de quem segue + próprios
+        assert len(response.data["results"]) == 2
+
+    def test_feed_post_created_via_api_reaches_followers(
+        self, authenticated_client, user, another_user
+    ):
+        """Testa que post criado pela API aparece no feed dos seguidores."""
+        from users.models import Follow
+
+        Follow.objects.create(follower=another_user, following=user)
+
+        response = authenticated_client.post(
+            reverse("post-list"), {"content": "Fan-out"}, format="json"
+        )
+        assert response.status_code == status.HTTP_201_CREATED
+
+        follower_client = APIClient()
+        follower_client.force_authenticate(user=another_user)
+        response = follower_client.get(reverse("post-feed"))
+
+        assert [post["content"] for post in response.data["results"]] == ["Fan-out"]
+
+    def test_feed_after_unfollow(self, authenticated_client, user, another_user):
+        """Testa que posts de quem deixou de ser seguido saem do feed."""
+        from users.models import Follow
+
+        follow = Follow.objects.create(follower=user, following=another_user)
+        Post.objects.create(author=another_user, content="Post from followed")
+
+        follow.delete()
+
+        response = authenticated_client.get(reverse("post-feed"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == 0
+
+    def test_feed_unauthenticated(self, api_client):
+        """Testa que o feed exige autenticação."""
+        response = api_client.get(reverse("post-feed"))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_feed_cursor_pagination(self, authenticated_client, user):
+        """Testa paginação do feed com max_id/since_id/limit."""
+        posts = [
+            Post.objects.create(author=user, content=f"Post {i}") for i in range(5)
+        ]
+        url = reverse("post-feed")
+
+        first = authenticated_client.get(url, {"limit": 2})
+        assert [p["id"] for p in first.data["results"]] == [posts[4].id, posts[3].id]
+        assert "count" not in first.data
+        assert f"max_id={posts[3].id}" in first.data["next"]
+
+        second = authenticated_client.get(url, {"limit": 2, "max_id": posts[3].id})
+        assert [p["id"] for p in second.data["results"]] == [posts[2].id, posts[1].id]
+
+        last = authenticated_client.get(url, {"limit": 2, "max_id": posts[1].id})
+        assert [p["id"] for p in last.data["results"]] == [posts[0].id]
+        assert last.data["next"] is None
+
+        newer = authenticated_client.get(url, {"since_id": posts[2].id})
+        assert [p["id"] for p in newer.data["results"]] == [posts[4].id, posts[3].id]
+
+    def test_feed_cursor_of_deleted_post(self, authenticated_client, user):
+        """Testa max_id apontando para um post que foi deletado."""
+        older = Post.objects.create(author=user, content="Older")
+        deleted = Post.objects.create(author=user, content="Deleted")
+        deleted_id = deleted.id
+        deleted.delete()
+
+        response = authenticated_client.get(
+            reverse("post-feed"), {"max_id": deleted_id}
+        )
+
+        assert [p["id"] for p in response.data["results"]] == [older.id]
+
+    def test_feed_invalid_cursor(self, authenticated_client):
+        """Testa cursor inválido."""
+        response = authenticated_client.get(reverse("post-feed"), {"max_id": "abc"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
 
 
 @pytest.mark.django_db
@@ -172,6 +284,20 @@ class TestCommentViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 2
 
+    def test_list_comments_constant_queries(
+        self, api_client, user, another_user, django_assert_num_queries
+    ):
+        """Testa que a listagem não faz consultas por comentário (N+1)."""
+        post = Post.objects.create(author=user, content="Post")
+        for i in range(10):
+            commenter = user if i % 2 else another_user
+            Comment.objects.create(user=commenter, post=post, content=f"C {i}")
+
+        with django_assert_num_queries(2):
+            response = api_client.get(reverse("comment-list"))
+
+        assert len(response.data["results"]) == 10
+
     def test_create_comment_authenticated(self, authenticated_client, user):
         """Testa criação de comentário autenticado."""
         post = Post.objects.create(author=user, content="Post")
@@ -183,6 +309,8 @@ class TestCommentViewSet:
 
         assert response.status_code == status.HTTP_201_CREATED
         assert Comment.objects.filter(content="New comment", user=user).exists()
+        post.refresh_from_db()
+        assert post.comments_count == 1
 
     def test_create_comment_unauthenticated(self, api_client, user):
         """Testa criação de comentário sem autenticação."""
@@ -236,6 +364,47 @@ class TestCommentViewSet:
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Comment.objects.filter(pk=comment.pk).exists()
 
+    def test_post_comments_keyset_pagination(
+        self, api_client, user, another_user, django_assert_num_queries
+    ):
+        """Testa /posts/{id}/comments/: só o post, por cursor e sem COUNT."""
+        post = Post.objects.create(author=user, content="Post")
+        other = Post.objects.create(author=user, content="Other")
+        comments = [
+            Comment.objects.create(
+                user=another_user if i % 2 else user, post=post, content=f"C {i}"
+            )
+            for i in range(5)
+        ]
+        Comment.objects.create(user=user, post=other, content="Elsewhere")
+        url = reverse("post-comments", kwargs={"post_pk": post.pk})
+
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(url, {"limit": 3})
+
+        # Verificação do post + página com os usuários no mesmo SELECT
+        assert len(context.captured_queries) == 2
+        assert not any("COUNT" in q["sql"] for q in context.captured_queries)
+        assert response.status_code == status.HTTP_200_OK
+        ids = [item["id"] for item in response.data["results"]]
+        assert ids == [c.id for c in reversed(comments)][:3]
+        assert response.data["results"][0]["user"]["username"] == "testuser"
+        assert f"max_id={ids[-1]}" in response.data["next"]
+
+        response = api_client.get(url, {"limit": 3, "max_id": ids[-1]})
+
+        assert [item["id"] for item in response.data["results"]] == [
+            comments[1].id,
+            comments[0].id,
+        ]
+        assert response.data["next"] is None
+
+    def test_post_comments_missing_post(self, api_client):
+        """Testa 404 para post inexistente."""
+        response = api_client.get(reverse("post-comments", kwargs={"post_pk": 999}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
 
 @pytest.mark.django_db
 class TestLikeViewSet:
@@ -252,6 +421,20 @@ class TestLikeViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 1
 
+    def test_list_likes_constant_queries(
+        self, api_client, user, django_assert_num_queries
+    ):
+        """Testa que a listagem não faz consultas por curtida (N+1)."""
+        post = Post.objects.create(author=user, content="Post")
+        for i in range(10):
+            liker = User.objects.create_user(username=f"liker{i}", password="pass")
+            Like.objects.create(user=liker, post=post)
+
+        with django_assert_num_queries(2):
+            response = api_client.get(reverse("like-list"))
+
+        assert len(response.data["results"]) == 10
+
     def test_create_like_authenticated(self, authenticated_client, user):
         """Testa curtir post."""
         post = Post.objects.create(author=user, content="Post")
@@ -261,6 +444,8 @@ class TestLikeViewSet:
 
         assert response.status_code == status.HTTP_201_CREATED
         assert Like.objects.filter(user=user, post=post).exists()
+        post.refresh_from_db()
+        assert post.likes_count == 1
 
     def test_create_like_unauthenticated(self, api_client, user):
         """Testa curtir sem autenticação."""
@@ -291,6 +476,8 @@ class TestLikeViewSet:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Like.objects.filter(user=user, post=post).exists()
+        post.refresh_from_db()
+        assert post.likes_count == 0
 
     def test_cannot_unlike_others_like(self, authenticated_client, user, another_user):
         """Testa que não pode desfazer curtida de outro usuário."""
@@ -302,3 +489,394 @@ class TestLikeViewSet:
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert Like.objects.filter(user=another_user, post=post).exists()
+
+    def test_like_action_is_idempotent(self, authenticated_client, user):
+        """Testa PUT/DELETE /posts/{id}/like/ repetidos."""
+        post = Post.objects.create(author=user, content="Post")
+        url = reverse("post-like", kwargs={"pk": post.pk})
+
+        for _ in range(2):
+            response = authenticated_client.put(url)
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+        post.refresh_from_db()
+        assert post.likes_count == 1
+        assert Like.objects.filter(user=user, post=post).count() == 1
+
+        for _ in range(2):
+            response = authenticated_client.delete(url)
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+        post.refresh_from_db()
+        assert post.likes_count == 0
+        assert not Like.objects.filter(user=user, post=post).exists()
+
+    def test_like_action_single_statement(self, authenticated_client, user):
+        """Testa que curtir/descurtir é um único statement, sem SELECT."""
+        post = Post.objects.create(author=user, content="Post")
+        url = reverse("post-like", kwargs={"pk": post.pk})
+
+        for method, keyword in (("put", "INSERT"), ("delete", "DELETE")):
+            with CaptureQueriesContext(connection) as context:
+                getattr(authenticated_client, method)(url)
+
+            statements = [q["sql"].split()[0] for q in context.captured_queries]
+            assert statements.count(keyword) == 1
+            assert "SELECT" not in statements
+
+    def test_like_action_missing_post(self, authenticated_client):
+        """Testa 404 para post inexistente."""
+        for method in ("put", "delete"):
+            response = getattr(authenticated_client, method)(
+                reverse("post-like", kwargs={"pk": 999})
+            )
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert not Like.objects.exists()
+
+    def test_like_action_id_out_of_range(self, authenticated_client):
+        """Testa 404 (e não 500) para IDs fora da faixa de 64 bits."""
+        for pk in ("99999999999999999999", "-99999999999999999999"):
+            for method in ("put", "delete"):
+                response = getattr(authenticated_client, method)(
+                    reverse("post-like", kwargs={"pk": pk})
+                )
+                assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_like_action_unauthenticated(self, api_client, user):
+        """Testa que exige autenticação."""
+        post = Post.objects.create(author=user, content="Post")
+
+        response = api_client.put(reverse("post-like", kwargs={"pk": post.pk}))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestFastReadPath:
+    """Testes do caminho rápido de leitura (FastReadMixin)."""
+
+    @pytest.fixture
+    def posts(self, user, another_user):
+        user.profile_image = "profile_images/me.png"
+        user.save()
+        posts = [
+            Post.objects.create(
+                author=user, content="Post 1", image="post_images/1.png"
+            ),
+            Post.objects.create(author=another_user, content="Post 2"),
+        ]
+        Like.objects.create(user=another_user, post=posts[0])
+        Comment.objects.create(user=another_user, post=posts[0], content="Comment")
+        return posts
+
+    def get_both(self, monkeypatch, viewset, client, url):
+        """Faz a mesma requisição com o caminho rápido desligado e ligado."""
+        monkeypatch.setattr(viewset, "fast_serialization", False)
+        slow = client.get(url)
+        monkeypatch.setattr(viewset, "fast_serialization", True)
+        fast = client.get(url)
+        return slow, fast
+
+    def test_post_list_parity(self, monkeypatch, api_client, posts):
+        """Testa que a listagem rápida de posts é idêntica."""
+        slow, fast = self.get_both(
+            monkeypatch, PostViewSet, api_client, reverse("post-list")
+        )
+
+        assert fast.status_code == status.HTTP_200_OK
+        assert fast.content == slow.content
+
+    def test_post_retrieve_parity(self, monkeypatch, api_client, posts):
+        """Testa que o detalhe rápido de post é idêntico."""
+        url = reverse("post-detail", kwargs={"pk": posts[0].pk})
+        slow, fast = self.get_both(monkeypatch, PostViewSet, api_client, url)
+
+        assert fast.content == slow.content
+
+    def test_post_list_parity_authenticated(self, monkeypatch, api_client, posts):
+        """Testa paridade dos campos do usuário autenticado (liked_by_me)."""
+        viewer = posts[1].author
+        Follow.objects.create(follower=viewer, following=posts[0].author)
+        api_client.force_authenticate(user=viewer)
+
+        slow, fast = self.get_both(
+            monkeypatch, PostViewSet, api_client, reverse("post-list")
+        )
+
+        assert b'"liked_by_me":true' in fast.content
+        assert fast.content == slow.content
+
+    def test_post_retrieve_not_found(self, monkeypatch, api_client):
+        """Testa 404 no caminho rápido."""
+        monkeypatch.setattr(PostViewSet, "fast_serialization", True)
+
+        response = api_client.get(reverse("post-detail", kwargs={"pk": 999}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_retrieve_object_permissions(self, monkeypatch, api_client, posts):
+        """Testa que a permissão de objeto recebe uma instância de Post."""
+
+        class IsAuthorOnly(BasePermission):
+            def has_object_permission(self, request, view, obj):
+                return obj.author == request.user
+
+        monkeypatch.setattr(PostViewSet, "fast_serialization", True)
+        monkeypatch.setattr(PostViewSet, "permission_classes", [IsAuthorOnly])
+        url = reverse("post-detail", kwargs={"pk": posts[0].pk})
+
+        assert api_client.get(url).status_code == status.HTTP_401_UNAUTHORIZED
+        api_client.force_authenticate(user=posts[0].author)
+        assert api_client.get(url).status_code == status.HTTP_200_OK
+
+    def test_comment_list_parity(self, monkeypatch, api_client, posts):
+        """Testa que a listagem rápida de comentários é idêntica."""
+        slow, fast = self.get_both(
+            monkeypatch, CommentViewSet, api_client, reverse("comment-list")
+        )
+
+        assert fast.content == slow.content
+
+
+@pytest.mark.django_db
+class TestSparseFieldsets:
+    """Testes de seleção de campos (?fields= / ?exclude= / ?expand=)."""
+
+    @pytest.fixture
+    def post(self, user):
+        return Post.objects.create(author=user, content="Post")
+
+    def test_fields(self, api_client, post):
+        """Testa retorno apenas dos campos pedidos."""
+        response = api_client.get(reverse("post-list"), {"fields": "id,content"})
+
+        assert response.data["results"] == [{"id": post.id, "content": "Post"}]
+
+    def test_unexpanded_author_is_id_without_join(self, api_client, post, user):
+        """Testa autor não expandido retornado como ID, sem join."""
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(reverse("post-list"), {"fields": "id,author"})
+
+        assert response.data["results"] == [{"id": post.id, "author": user.id}]
+        assert all("users_user" not in q["sql"] for q in context.captured_queries)
+
+    def test_expand_author(self, api_client, post):
+        """Testa autor expandido por completo."""
+        response = api_client.get(
+            reverse("post-list"), {"fields": "id,author", "expand": "author"}
+        )
+
+        assert response.data["results"][0]["author"]["username"] == "testuser"
+        assert "bio" in response.data["results"][0]["author"]
+
+    def test_author_subfields(self, api_client, post):
+        """Testa seleção de subcampos do autor."""
+        response = api_client.get(
+            reverse("post-detail", kwargs={"pk": post.pk}),
+            {"fields": "id,author.id,author.username"},
+        )
+
+        assert response.data == {
+            "id": post.id,
+            "author": {"id": post.author_id, "username": "testuser"},
+        }
+
+    def test_exclude(self, api_client, post):
+        """Testa remoção de campos."""
+        response = api_client.get(
+            reverse("post-list"), {"exclude": "author,image,updated_at"}
+        )
+
+        result = response.data["results"][0]
+        assert "author" not in result
+        assert "image" not in result
+        assert result["content"] == "Post"
+
+    def test_feed_fields(self, authenticated_client, post):
+        """Testa seleção de campos no feed."""
+        response = authenticated_client.get(
+            reverse("post-feed"), {"fields": "id,author.username"}
+        )
+
+        assert response.data["results"] == [
+            {"id": post.id, "author": {"username": "testuser"}}
+        ]
+
+    def test_comment_fields(self, api_client, post, user):
+        """Testa seleção de campos em comentários."""
+        Comment.objects.create(user=user, post=post, content="Comment")
+
+        response = api_client.get(
+            reverse("comment-list"), {"fields": "content,user.username"}
+        )
+
+        assert response.data["results"] == [
+            {"user": {"username": "testuser"}, "content": "Comment"}
+        ]
+
+
+@pytest.mark.django_db
+class TestSideloadedUsers:
+    """Testes do formato com usuários side-loaded (?include=users)."""
+
+    @pytest.fixture
+    def posts(self, user, another_user):
+        return [
+            Post.objects.create(author=author, content=f"Post {i}")
+            for i, author in enumerate([user, another_user, user, user])
+        ]
+
+    def test_posts_reference_authors_by_id(self, api_client, posts, user):
+        """Testa posts com author_id e cada autor uma única vez em includes."""
+        response = api_client.get(reverse("post-list"), {"include": "users"})
+
+        results = response.data["results"]
+        assert all("author" not in item for item in results)
+        assert {item["author_id"] for item in results} == {p.author_id for p in posts}
+        users = response.data["includes"]["users"]
+        assert set(users) == {str(p.author_id) for p in posts}
+        assert users[str(user.id)]["username"] == "testuser"
+
+    def test_authors_fetched_in_one_query(self, api_client, posts):
+        """Testa autores buscados em uma consulta, sem join na listagem."""
+        with CaptureQueriesContext(connection) as context:
+            api_client.get(reverse("post-list"), {"include": "users"})
+
+        user_queries = [
+            q["sql"] for q in context.captured_queries if "users_user" in q["sql"]
+        ]
+        assert len(user_queries) == 1
+        assert "posts_post" not in user_queries[0]
+
+    def test_default_format_is_unchanged(self, api_client, posts):
+        """Testa que sem ?include o autor continua aninhado."""
+        response = api_client.get(reverse("post-list"))
+
+        assert "includes" not in response.data
+        assert response.data["results"][0]["author"]["username"]
+
+    def test_feed(self, authenticated_client, posts, user):
+        """Testa usuários side-loaded no feed."""
+        response = authenticated_client.get(reverse("post-feed"), {"include": "users"})
+
+        assert response.data["results"][0]["author_id"] == user.id
+        assert set(response.data["includes"]["users"]) == {str(user.id)}
+
+    def test_comments(self, api_client, posts, user, another_user):
+        """Testa usuários side-loaded em comentários."""
+        for author in [user, another_user, user]:
+            Comment.objects.create(user=author, post=posts[0], content="Comment")
+
+        response = api_client.get(reverse("comment-list"), {"include": "users"})
+
+        assert all("user" not in item for item in response.data["results"])
+        assert set(response.data["includes"]["users"]) == {
+            str(user.id),
+            str(another_user.id),
+        }
+
+    def test_retrieve(self, api_client, posts, another_user):
+        """Testa o autor side-loaded dentro do objeto no detalhe do post."""
+        response = api_client.get(
+            reverse("post-detail", args=[posts[1].id]), {"include": "users"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert "author" not in response.data
+        assert response.data["author_id"] == another_user.id
+        assert set(response.data["includes"]["users"]) == {str(another_user.id)}
+
+    def test_retrieve_not_found(self, api_client):
+        """Testa que respostas de erro não ganham includes."""
+        response = api_client.get(
+            reverse("post-detail", args=[999]), {"include": "users"}
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert "includes" not in response.data
+
+    def test_unpaginated_list(self, monkeypatch, api_client, posts):
+        """Testa que listas sem paginação são envolvidas com includes."""
+        monkeypatch.setattr(PostViewSet, "pagination_class", None)
+
+        response = api_client.get(reverse("post-list"), {"include": "users"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["results"]) == len(posts)
+        assert len(response.data["includes"]["users"]) == 2
+
+    def test_no_ids_skips_query(self, api_client, posts):
+        """Testa que sem ids referenciados não há consulta de usuários."""
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.get(
+                reverse("post-list"), {"include": "users", "fields": "id"}
+            )
+
+        assert response.data["includes"] == {"users": {}}
+        assert not any("users_user" in q["sql"] for q in context.captured_queries)
+
+    def test_with_sparse_fields(self, api_client, posts):
+        """Testa combinação com ?fields=."""
+        response = api_client.get(
+            reverse("post-list"), {"include": "users", "fields": "id,author"}
+        )
+
+        assert set(response.data["results"][0]) == {"id", "author_id"}
+        assert len(response.data["includes"]["users"]) == 2
+
+
+@pytest.mark.django_db
+class TestViewerState:
+    """Testes dos campos relativos ao usuário autenticado."""
+
+    def create_posts(self, author, count):
+        return [
+            Post.objects.create(author=author, content=f"Post {i}")
+            for i in range(count)
+        ]
+
+    def test_liked_by_me(self, authenticated_client, user, another_user):
+        """Testa liked_by_me e followed_by_me/follows_me do autor."""
+        liked, other = self.create_posts(another_user, 2)
+        Like.objects.create(user=user, post=liked)
+        Follow.objects.create(follower=another_user, following=user)
+
+        response = authenticated_client.get(reverse("post-list"))
+
+        results = {item["id"]: item for item in response.data["results"]}
+        assert results[liked.id]["liked_by_me"] is True
+        assert results[other.id]["liked_by_me"] is False
+        assert results[liked.id]["author"]["followed_by_me"] is False
+        assert results[liked.id]["author"]["follows_me"] is True
+
+    def test_anonymous(self, api_client, user):
+        """Testa estados falsos para anônimos, sem consultas extras."""
+        self.create_posts(user, 1)
+
+        response = api_client.get(reverse("post-list"))
+
+        assert response.data["results"][0]["liked_by_me"] is False
+        assert response.data["results"][0]["author"]["followed_by_me"] is False
+
+    def test_one_query_per_page(
+        self, authenticated_client, user, another_user, django_assert_num_queries
+    ):
+        """Testa uma consulta de curtidas e uma de follows por página."""
+        for author in [user, another_user]:
+            for post in self.create_posts(author, 3):
+                Like.objects.create(user=user, post=post)
+
+        # COUNT + posts + curtidas + follows
+        with django_assert_num_queries(4):
+            response = authenticated_client.get(reverse("post-list"))
+
+        assert all(item["liked_by_me"] for item in response.data["results"])
+
+    def test_feed(self, authenticated_client, user, another_user):
+        """Testa liked_by_me no feed."""
+        Follow.objects.create(follower=user, following=another_user)
+        (post,) = self.create_posts(another_user, 1)
+        Like.objects.create(user=user, post=post)
+
+        response = authenticated_client.get(reverse("post-feed"))
+
+        assert response.data["results"][0]["liked_by_me"] is True
+        assert response.data["results"][0]["author"]["followed_by_me"] is True
@@ -6,6 +6,7 @@ from django.urls import include, path
 
 from rest_framework.routers import DefaultRouter
 
+from posts.pagination import CommentPagination
 from posts.views import CommentViewSet, LikeViewSet, PostViewSet
 
 router = DefaultRouter()
@@ -13,6 +14,12 @@ router.register(r"posts", PostViewSet, basename="post")
 router.register(r"comments", CommentViewSet, basename="comment")
 router.register(r"likes", LikeViewSet, basename="like")
 
+# Comentários de um post, paginados por cursor no índice (post, -created_at)
+post_comments = CommentViewSet.as_view(
+    {"get": "list"}, pagination_class=CommentPagination
+)
+
 urlpatterns = [
+    path("posts/<int:post_pk>/comments/", post_comments, name="post-comments"),
     path("", include(router.urls)),
 ]
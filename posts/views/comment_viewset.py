@@ -2,15 +2,22 @@
 Comment ViewSet.
 """
 
+from django.db import transaction
+from django.http import Http404
+
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 
-from posts.models import Comment
+from core.views import FastReadMixin, SideloadMixin, SparseFieldsetsMixin
+from posts.models import Comment, Post
 from posts.permissions import IsAuthorOrReadOnly
-from posts.serializers import CommentSerializer
+from posts.serializers import CommentSerializer, FastCommentSerializer
+from users.serializers import UserSerializer
 
 
-class CommentViewSet(viewsets.ModelViewSet):
+class CommentViewSet(
+    SideloadMixin, SparseFieldsetsMixin, FastReadMixin, viewsets.ModelViewSet
+):
     """
     ViewSet para comentários.
 
@@ -19,12 +26,39 @@ class CommentViewSet(viewsets.ModelViewSet):
     create: Cria novo comentário
     update: Atualiza comentário (apenas autor)
     destroy: Deleta comentário (apenas autor)
+
+    Também atende ``/api/posts/{post_pk}/comments/`` (apenas list): os
+    comentários de um post, paginados por cursor (CommentPagination).
     """
 
-    queryset = Comment.objects.all().select_related("user", "post")
+    queryset = Comment.objects.with_related()
     serializer_class = CommentSerializer
+    fast_serializer_class = FastCommentSerializer
+    fast_serialization = False  # True: list/retrieve via FastCommentSerializer
+    sideload_fields = {"user": ("users", UserSerializer)}
     permission_classes = [IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
 
+    def get_queryset(self):
+        """Pula o join com o usuário quando ele não é expandido."""
+        queryset = Comment.objects.with_related(user=self.expands("user"))
+        if "post_pk" in self.kwargs:
+            queryset = queryset.filter(post_id=self.kwargs["post_pk"])
+        return queryset
+
+    def list(self, request, *args, **kwargs):
+        """Lista comentários; na rota aninhada, 404 se o post não existe."""
+        post_pk = kwargs.get("post_pk")
+        if post_pk is not None and not Post.objects.filter(pk=post_pk).exists():
+            raise Http404
+        return super().list(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         """Define o usuário como o usuário autenticado."""
-        serializer.save(user=self.request.user)
+        # Comentário e contador do post na mesma transação
+        with transaction.atomic():
+            serializer.save(user=self.request.user)
+
+    def perform_destroy(self, instance):
+        """Deleta o comentário e atualiza o contador do post."""
+        with transaction.atomic():
+            instance.delete()
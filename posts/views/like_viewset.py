@@ -2,12 +2,15 @@
 Like ViewSet.
 """
 
+from django.db import transaction
+
 from rest_framework import status, viewsets
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
 from posts.models import Like
 from posts.serializers import LikeSerializer
+from posts.services import likes
 
 
 class LikeViewSet(viewsets.ModelViewSet):
@@ -19,7 +22,7 @@ class LikeViewSet(viewsets.ModelViewSet):
     destroy: Descurtir um post
     """
 
-    queryset = Like.objects.all().select_related("user", "post")
+    queryset = Like.objects.with_related()
     serializer_class = LikeSerializer
     permission_classes = [IsAuthenticated]
 
@@ -43,17 +46,15 @@ class LikeViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
 
-        # Verificar se já não curtiu
-        if Like.objects.filter(
-            user=request.user, post=serializer.validated_data["post"]
-        ).exists():
+        # Um INSERT ... ON CONFLICT DO NOTHING: a constraint única decide se
+        # já curtiu, sem consulta prévia nem corrida entre requisições
+        like = likes.like(request.user, serializer.validated_data["post"].pk)
+        if like is None:
             return Response(
                 {"detail": "Você já curtiu este post."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-
-        serializer.save(user=request.user)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(self.get_serializer(like).data, status=status.HTTP_201_CREATED)
 
     def destroy(self, request, *args, **kwargs):
         """
@@ -68,5 +69,6 @@ class LikeViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        self.perform_destroy(instance)
+        with transaction.atomic():
+            self.perform_destroy(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
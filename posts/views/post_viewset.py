@@ -2,17 +2,31 @@
 Post ViewSet.
 """
 
-from rest_framework import viewsets
+from django.db import transaction
+from django.http import Http404
+
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
 
+from core.db import to_pk
+from core.views import FastReadMixin, SideloadMixin, SparseFieldsetsMixin
 from posts.models import Post
+from posts.pagination import TimelinePagination
 from posts.permissions import IsAuthorOrReadOnly
-from posts.serializers import PostCreateSerializer, PostSerializer
+from posts.serializers import (
+    FastPostSerializer,
+    PostCreateSerializer,
+    PostSerializer,
+)
+from posts.services import likes, timeline
+from users.serializers import UserSerializer
 
 
-class PostViewSet(viewsets.ModelViewSet):
+class PostViewSet(
+    SideloadMixin, SparseFieldsetsMixin, FastReadMixin, viewsets.ModelViewSet
+):
     """
     ViewSet para operações com posts.
 
@@ -23,10 +37,17 @@ class PostViewSet(viewsets.ModelViewSet):
     destroy: Deleta post (apenas autor)
     """
 
-    queryset = Post.objects.all().select_related("author")
+    queryset = Post.objects.with_related()
     serializer_class = PostSerializer
+    fast_serializer_class = FastPostSerializer
+    fast_serialization = False  # True: list/retrieve via FastPostSerializer
+    sideload_fields = {"author": ("users", UserSerializer)}
     permission_classes = [IsAuthenticatedOrReadOnly, IsAuthorOrReadOnly]
 
+    def get_queryset(self):
+        """Pula o join com o autor quando ele não é expandido."""
+        return Post.objects.with_related(author=self.expands("author"))
+
     def get_serializer_class(self):
         """Retorna serializer apropriado para cada ação."""
         if self.action in ["create", "update", "partial_update"]:
@@ -35,20 +56,57 @@ class PostViewSet(viewsets.ModelViewSet):
 
     def perform_create(self, serializer):
         """Define o autor como o usuário autenticado."""
-        serializer.save(author=self.request.user)
+        # Post, timelines e contador do autor na mesma transação
+        with transaction.atomic():
+            serializer.save(author=self.request.user)
+
+    def perform_destroy(self, instance):
+        """Deleta o post e atualiza o contador do autor."""
+        with transaction.atomic():
+            instance.delete()
 
-    @action(detail=False, methods=["get"])
+    @action(
+        detail=False,
+        methods=["get"],
+        permission_classes=[IsAuthenticated],
+        pagination_class=TimelinePagination,
+    )
     def feed(self, request):
         """
         Feed personalizado: posts de usuários que o usuário segue.
-        """
-        # Pegar IDs dos usuários que o usuário segue
-        following_ids = request.user.following.values_list("following_id", flat=True)
 
-        # Posts dos usuários seguidos + posts do próprio usuário
-        posts = Post.objects.filter(
-            author_id__in=list(following_ids) + [request.user.id]
-        ).select_related("author")
+        Lido da timeline materializada (preenchida na criação do post),
+        que já contém os posts dos usuários seguidos + os próprios.
+        Paginado por cursor (max_id/since_id/limit), sem COUNT(*).
+        """
+        entries = self.paginate_queryset(
+            timeline.home_timeline(request.user, author=self.expands("author"))
+        )
+        posts = [entry.post for entry in entries]
 
         serializer = self.get_serializer(posts, many=True)
-        return Response(serializer.data)
+        return self.get_paginated_response(serializer.data)
+
+    @action(
+        detail=True, methods=["put", "delete"], permission_classes=[IsAuthenticated]
+    )
+    def like(self, request, pk=None):
+        """
+        Curtir (PUT) ou descurtir (DELETE) o post, sem o ID da curtida.
+
+        Idempotente e um único statement: repetir a requisição não muda
+        nada. O post só é consultado quando nada mudou, para responder 404
+        se ele não existir.
+        """
+        try:
+            post_id = to_pk(Post, pk)
+        except ValueError:
+            raise Http404
+        if request.method == "PUT":
+            changed = likes.like(request.user, post_id) is not None
+        else:
+            changed = likes.unlike(request.user, post_id)
+
+        if not changed and not Post.objects.filter(pk=post_id).exists():
+            raise Http404
+        return Response(status=status.HTTP_204_NO_CONTENT)
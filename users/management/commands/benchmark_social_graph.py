@@ -0,0 +1,147 @@
+"""
+Comando: benchmark_social_graph
+
+Compara o grafo social em memória (users.services.graph) com consultas
+pelo ORM para as perguntas mais comuns: A segue B?, quem segue B e
+quantos seguidores B tem.
+
+Por padrão gera um grafo sintético dentro de uma transação desfeita ao
+final; com ``--existing`` usa os follows já gravados no banco.
+"""
+
+import random
+import time
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from users.models import Follow, User
+from users.services.graph import SocialGraph
+
+BATCH_SIZE = 5000
+
+
+class Command(BaseCommand):
+    help = "Compara o grafo social em memória com consultas pelo ORM."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--users", type=int, default=2000, help="Usuários sintéticos."
+        )
+        parser.add_argument(
+            "--follows", type=int, default=50, help="Follows por usuário sintético."
+        )
+        parser.add_argument(
+            "--queries", type=int, default=2000, help="Consultas por medição."
+        )
+        parser.add_argument(
+            "--seed", type=int, default=42, help="Semente do gerador aleatório."
+        )
+        parser.add_argument(
+            "--existing",
+            action="store_true",
+            help="Usa os follows existentes em vez de gerar dados.",
+        )
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        if options["existing"]:
+            self.run(rng, options)
+            return
+
+        with transaction.atomic():
+            self.populate(rng, options["users"], options["follows"])
+            self.run(rng, options)
+            transaction.set_rollback(True)
+
+    def populate(self, rng, users, follows):
+        """Cria usuários e follows sintéticos (bulk, sem signals)."""
+        password = make_password(None)
+        created = User.objects.bulk_create(
+            [
+                User(username=f"bench_{i}", email="", password=password)
+                for i in range(users)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        ids = [user.pk for user in created]
+
+        batch = []
+        for follower_id in ids:
+            for following_id in rng.sample(ids, min(follows, len(ids))):
+                if following_id != follower_id:
+                    batch.append(
+                        Follow(follower_id=follower_id, following_id=following_id)
+                    )
+            if len(batch) >= BATCH_SIZE:
+                Follow.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+        Follow.objects.bulk_create(batch, ignore_conflicts=True)
+
+    def run(self, rng, options):
+        user_ids = list(User.objects.values_list("id", flat=True))
+        if len(user_ids) < 2:
+            self.stdout.write(self.style.WARNING("Usuários insuficientes."))
+            return
+
+        started = time.perf_counter()
+        graph = SocialGraph()
+        graph.load()
+        load_time = time.perf_counter() - started
+
+        edges = len(graph.following.csr.targets)
+        self.stdout.write(
+            f"{len(user_ids)} usuários, {edges} follows: carga em "
+            f"{load_time * 1000:.0f} ms, {graph.nbytes / 1024:.0f} KiB de arrays"
+        )
+
+        pairs = [tuple(rng.sample(user_ids, 2)) for _ in range(options["queries"])]
+        targets = [pair[1] for pair in pairs]
+        cases = [
+            (
+                "A segue B?",
+                lambda a, b: Follow.objects.filter(
+                    follower_id=a, following_id=b
+                ).exists(),
+                graph.follows,
+                pairs,
+            ),
+            (
+                "quem segue B",
+                lambda b: list(
+                    Follow.objects.filter(following_id=b).values_list(
+                        "follower_id", flat=True
+                    )
+                ),
+                graph.follower_ids,
+                targets,
+            ),
+            (
+                "seguidores de B",
+                lambda b: Follow.objects.filter(following_id=b).count(),
+                graph.followers_count,
+                targets,
+            ),
+        ]
+
+        self.stdout.write(
+            f"{'consulta':<18}{'ORM µs':>12}{'grafo µs':>12}{'speedup':>10}"
+        )
+        for name, orm, in_memory, arguments in cases:
+            orm_time = self.measure(orm, arguments)
+            graph_time = self.measure(in_memory, arguments)
+            self.stdout.write(
+                f"{name:<18}{orm_time:>12.1f}{graph_time:>12.2f}"
+                f"{orm_time / max(graph_time, 1e-9):>9.0f}x"
+            )
+
+    def measure(self, function, arguments):
+        """Tempo médio por chamada, em microssegundos."""
+        started = time.perf_counter()
+        for argument in arguments:
+            if isinstance(argument, tuple):
+                function(*argument)
+            else:
+                function(argument)
+        return (time.perf_counter() - started) / len(arguments) * 1_000_000
@@ -0,0 +1,21 @@
+"""
+Comando: reconcile_user_counters
+
+Recalcula followers_count, following_count e posts_count de User a partir
+de Follow e Post.
+"""
+
+from core.management.reconcile import ReconcileCommand
+from posts.models import Post
+from users.models import Follow, User
+
+
+class Command(ReconcileCommand):
+    help = "Detecta e corrige divergências nos contadores de usuários."
+
+    model = User
+    counters = {
+        "followers_count": (Follow, "following_id"),
+        "following_count": (Follow, "follower_id"),
+        "posts_count": (Post, "author_id"),
+    }
@@ -0,0 +1,46 @@
+"""
+Comando: refresh_suggestions
+
+Recalcula as sugestões de quem seguir (top-K por conexões em comum).
+Sem opções, consome a fila de usuários afetados por follows/unfollows
+desde a última execução; pensado para rodar periodicamente (cron).
+"""
+
+from django.core.management.base import BaseCommand
+
+from users.services import suggestions
+
+
+class Command(BaseCommand):
+    help = "Recalcula as sugestões de quem seguir."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recalcula todos os usuários em vez de apenas a fila.",
+        )
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="ID do usuário a recalcular (pode ser repetido).",
+        )
+        parser.add_argument(
+            "--top-k",
+            type=int,
+            default=None,
+            help="Sugestões guardadas por usuário (padrão: SUGGESTIONS_TOP_K).",
+        )
+
+    def handle(self, *args, **options):
+        k = options["top_k"]
+        if options["user_ids"]:
+            total = suggestions.refresh(options["user_ids"], k=k)
+        elif options["all"]:
+            total = suggestions.refresh_all(k=k)
+        else:
+            total = suggestions.refresh_pending(k=k)
+
+        self.stdout.write(self.style.SUCCESS(f"{total} usuário(s) recalculado(s)."))
@@ -0,0 +1,61 @@
+# Generated by Django 6.0 on 2026-10-18 13:00
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_counters(apps, schema_editor):
+    """Preenche os contadores com os valores atuais."""
+    User = apps.get_model("users", "User")
+    Follow = apps.get_model("users", "Follow")
+    Post = apps.get_model("posts", "Post")
+
+    def count_of(model, field):
+        counts = (
+            model.objects.filter(**{field: OuterRef("pk")})
+            .order_by()
+            .values(field)
+            .annotate(total=Count("pk"))
+            .values("total")
+        )
+        return Coalesce(Subquery(counts), 0)
+
+    User.objects.update(
+        followers_count=count_of(Follow, "following"),
+        following_count=count_of(Follow, "follower"),
+        posts_count=count_of(Post, "author"),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+        ("posts", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="followers_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Seguidores"
+            ),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="following_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Seguindo"
+            ),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="posts_count",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="Posts"
+            ),
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
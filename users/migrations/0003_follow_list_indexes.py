@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-10-18 20:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0002_user_counters"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="follow",
+            index=models.Index(
+                fields=["following", "-created_at"],
+                name="users_follo_followi_f424c9_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="follow",
+            index=models.Index(
+                fields=["follower", "-created_at"],
+                name="users_follo_followe_b6ba3d_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 6.0 on 2026-10-18 21:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_follow_list_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SuggestionRefresh",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="+",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Usuário",
+                    ),
+                ),
+                ("queued_at", models.DateTimeField(verbose_name="Enfileirado em")),
+            ],
+            options={
+                "verbose_name": "Recálculo de sugestões",
+                "verbose_name_plural": "Recálculos de sugestões",
+            },
+        ),
+        migrations.CreateModel(
+            name="FollowSuggestion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "mutual_count",
+                    models.PositiveIntegerField(
+                        help_text="Quantos usuários seguidos pelo usuário seguem o sugerido",
+                        verbose_name="Conexões em comum",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Criado em"),
+                ),
+                (
+                    "suggested",
+                    models.ForeignKey(
+                        help_text="Usuário sugerido",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Sugerido",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        help_text="Usuário que recebe a sugestão",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="suggestions",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="Usuário",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Sugestão de follow",
+                "verbose_name_plural": "Sugestões de follow",
+                "ordering": ["-mutual_count", "suggested"],
+                "indexes": [
+                    models.Index(
+                        fields=["user", "-mutual_count"],
+                        name="users_follo_user_id_bf6803_idx",
+                    )
+                ],
+                "unique_together": {("user", "suggested")},
+            },
+        ),
+    ]
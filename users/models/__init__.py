@@ -5,6 +5,8 @@ Expõe os models User e Follow para serem importados facilmente.
 """
 
 from .follow import Follow
+from .follow_suggestion import FollowSuggestion
+from .suggestion_refresh import SuggestionRefresh
 from .user import User
 
-__all__ = ["User", "Follow"]
+__all__ = ["User", "Follow", "FollowSuggestion", "SuggestionRefresh"]
@@ -7,6 +7,14 @@ from django.core.exceptions import ValidationError
 from django.db import models
 
 
+class FollowQuerySet(models.QuerySet):
+    """QuerySet de Follow com os joins usados pelos serializers."""
+
+    def with_related(self):
+        """Carrega follower e following no mesmo SELECT."""
+        return self.select_related("follower", "following")
+
+
 class Follow(models.Model):
     """
     Modelo para relacionamento de seguir entre usuários.
@@ -32,6 +40,8 @@ class Follow(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Criado em")
 
+    objects = FollowQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Seguir"
         verbose_name_plural = "Seguidores"
@@ -40,6 +50,9 @@ class Follow(models.Model):
         indexes = [
             models.Index(fields=["follower", "following"]),
             models.Index(fields=["-created_at"]),
+            # Listas paginadas de seguidores / seguindo
+            models.Index(fields=["following", "-created_at"]),
+            models.Index(fields=["follower", "-created_at"]),
         ]
 
     def __str__(self):
@@ -0,0 +1,51 @@
+"""
+FollowSuggestion model - Sugestões de quem seguir.
+"""
+
+from django.conf import settings
+from django.db import models
+
+
+class FollowSuggestion(models.Model):
+    """
+    Modelo para sugestões de quem seguir, pré-calculadas em lote.
+
+    Candidatos a dois passos no grafo (seguidos por quem o usuário segue),
+    ordenados pela quantidade de conexões em comum. Gravados pelo comando
+    refresh_suggestions; o endpoint apenas lê o top-K do usuário.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="suggestions",
+        on_delete=models.CASCADE,
+        verbose_name="Usuário",
+        help_text="Usuário que recebe a sugestão",
+    )
+
+    suggested = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        related_name="+",
+        on_delete=models.CASCADE,
+        verbose_name="Sugerido",
+        help_text="Usuário sugerido",
+    )
+
+    mutual_count = models.PositiveIntegerField(
+        verbose_name="Conexões em comum",
+        help_text="Quantos usuários seguidos pelo usuário seguem o sugerido",
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Criado em")
+
+    class Meta:
+        verbose_name = "Sugestão de follow"
+        verbose_name_plural = "Sugestões de follow"
+        ordering = ["-mutual_count", "suggested"]
+        unique_together = ("user", "suggested")
+        indexes = [
+            models.Index(fields=["user", "-mutual_count"]),
+        ]
+
+    def __str__(self):
+        return f"Sugerir {self.suggested_id} para {self.user_id}"
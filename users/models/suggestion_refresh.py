@@ -0,0 +1,33 @@
+"""
+SuggestionRefresh model - Fila de sugestões desatualizadas.
+"""
+
+from django.conf import settings
+from django.db import models
+
+
+class SuggestionRefresh(models.Model):
+    """
+    Usuário cujas sugestões precisam ser recalculadas.
+
+    Um follow/unfollow enfileira o follower (uma linha por usuário, com
+    ``queued_at`` atualizado); o comando refresh_suggestions consome a fila
+    e recalcula também os seguidores de quem foi enfileirado.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        primary_key=True,
+        related_name="+",
+        on_delete=models.CASCADE,
+        verbose_name="Usuário",
+    )
+
+    queued_at = models.DateTimeField(verbose_name="Enfileirado em")
+
+    class Meta:
+        verbose_name = "Recálculo de sugestões"
+        verbose_name_plural = "Recálculos de sugestões"
+
+    def __str__(self):
+        return f"Recalcular sugestões de {self.user_id}"
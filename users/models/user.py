@@ -5,14 +5,17 @@ User model - Usuário customizado do sistema.
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 
+from core.db import CounterFieldsMixin
 
-class User(AbstractUser):
+
+class User(CounterFieldsMixin, AbstractUser):
     """
     Modelo de usuário customizado estendendo AbstractUser.
 
     Adiciona campos específicos para a rede social:
     - bio: biografia do usuário
     - profile_image: foto de perfil
+    - followers_count / following_count / posts_count: contadores
     - created_at: data de criação
     - updated_at: data da última atualização
     """
@@ -34,11 +37,26 @@ class User(AbstractUser):
         help_text="Imagem de perfil do usuário",
     )
 
+    # Contadores desnormalizados (mantidos por users.services.counters)
+    followers_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Seguidores"
+    )
+
+    following_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Seguindo"
+    )
+
+    posts_count = models.PositiveIntegerField(
+        default=0, editable=False, verbose_name="Posts"
+    )
+
     # Timestamps
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Criado em")
 
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Atualizado em")
 
+    counter_fields = ("followers_count", "following_count", "posts_count")
+
     class Meta:
         verbose_name = "Usuário"
         verbose_name_plural = "Usuários"
@@ -46,19 +64,3 @@ class User(AbstractUser):
 
     def __str__(self):
         return self.username
-
-    # Properties para contadores
-    @property
-    def followers_count(self):
-        """Retorna quantidade de seguidores."""
-        return self.followers.count()
-
-    @property
-    def following_count(self):
-        """Retorna quantidade de pessoas que o usuário segue."""
-        return self.following.count()
-
-    @property
-    def posts_count(self):
-        """Retorna quantidade de posts do usuário."""
-        return self.posts.count()
@@ -0,0 +1,7 @@
+"""
+Users pagination package.
+"""
+
+from .follow_pagination import FollowersPagination, FollowingPagination
+
+__all__ = ["FollowersPagination", "FollowingPagination"]
@@ -0,0 +1,29 @@
+"""
+Follow pagination.
+"""
+
+from core.pagination import KeysetPagination
+
+
+class FollowersPagination(KeysetPagination):
+    """
+    Paginação keyset de seguidores, do follow mais recente ao mais antigo.
+
+    Pagina linhas de Follow pelo índice (following, -created_at); os
+    cursores max_id/since_id são IDs dos seguidores.
+    """
+
+    ordering_field = "created_at"
+    id_field = "follower_id"
+
+
+class FollowingPagination(KeysetPagination):
+    """
+    Paginação keyset de quem o usuário segue.
+
+    Pagina linhas de Follow pelo índice (follower, -created_at); os
+    cursores max_id/since_id são IDs dos usuários seguidos.
+    """
+
+    ordering_field = "created_at"
+    id_field = "following_id"
@@ -2,11 +2,17 @@
 Users serializers package.
 """
 
+from .bulk_follow_serializer import BulkFollowSerializer
+from .fast_user_serializer import FastUserSerializer
 from .follow_serializer import FollowSerializer
+from .follow_suggestion_serializer import FollowSuggestionSerializer
 from .user_serializer import UserCreateSerializer, UserSerializer
 
 __all__ = [
     "UserSerializer",
     "UserCreateSerializer",
     "FollowSerializer",
+    "BulkFollowSerializer",
+    "FollowSuggestionSerializer",
+    "FastUserSerializer",
 ]
@@ -0,0 +1,38 @@
+"""
+Bulk follow serializer.
+"""
+
+from rest_framework import serializers
+
+MAX_BULK_FOLLOW_IDS = 200
+
+
+class BulkFollowSerializer(serializers.Serializer):
+    """
+    Serializer para seguir/deixar de seguir vários usuários de uma vez.
+    """
+
+    follow = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        max_length=MAX_BULK_FOLLOW_IDS,
+    )
+    unfollow = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        required=False,
+        max_length=MAX_BULK_FOLLOW_IDS,
+    )
+
+    def validate(self, attrs):
+        """Valida que há ao menos um ID e nenhum nas duas listas."""
+        follow = attrs.setdefault("follow", [])
+        unfollow = attrs.setdefault("unfollow", [])
+        if not follow and not unfollow:
+            raise serializers.ValidationError(
+                "Informe ao menos um ID em follow ou unfollow."
+            )
+        if set(follow) & set(unfollow):
+            raise serializers.ValidationError(
+                "Um mesmo ID não pode estar em follow e unfollow."
+            )
+        return attrs
@@ -0,0 +1,52 @@
+"""
+Fast user serializer.
+"""
+
+from core.serializers import FastSerializer
+from users.models import User
+from users.services import relationships
+
+
+class FastUserSerializer(FastSerializer):
+    """
+    Versão de leitura rápida do UserSerializer (mesma saída).
+    """
+
+    model = User
+    fields = (
+        "id",
+        "username",
+        "email",
+        "first_name",
+        "last_name",
+        "bio",
+        "profile_image",
+        "followers_count",
+        "following_count",
+        "posts_count",
+        "followed_by_me",
+        "follows_me",
+        "created_at",
+    )
+    datetime_fields = ("created_at",)
+    file_fields = ("profile_image",)
+
+    def prepare(self, rows, prefix=""):
+        super().prepare(rows, prefix)
+        self.prepared = {row[f"{prefix}id"] for row in rows}
+        self.following, self.followers = set(), set()
+        if self.viewer is not None:
+            self.following, self.followers = relationships.between(
+                self.viewer, self.prepared
+            )
+
+    def get_followed_by_me(self, row, prefix=""):
+        if row[f"{prefix}id"] not in getattr(self, "prepared", ()):
+            # Serialização avulsa, sem prepare(): carrega só esta linha
+            self.prepare([row], prefix)
+        return row[f"{prefix}id"] in self.following
+
+    def get_follows_me(self, row, prefix=""):
+        if row[f"{prefix}id"] not in getattr(self, "prepared", ()):
+            self.prepare([row], prefix)
+        return row[f"{prefix}id"] in self.followers
@@ -0,0 +1,20 @@
+"""
+Follow suggestion serializer.
+"""
+
+from rest_framework import serializers
+
+from users.models import FollowSuggestion
+from users.serializers.user_serializer import UserSerializer
+
+
+class FollowSuggestionSerializer(serializers.ModelSerializer):
+    """
+    Serializer para sugestões de quem seguir.
+    """
+
+    user = UserSerializer(source="suggested", read_only=True)
+
+    class Meta:
+        model = FollowSuggestion
+        fields = ["user", "mutual_count"]
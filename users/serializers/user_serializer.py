@@ -4,17 +4,24 @@ User serializers.
 
 from rest_framework import serializers
 
+from core.serializers import DynamicFieldsMixin, ViewerStateMixin
 from users.models import User
+from users.services import relationships
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(DynamicFieldsMixin, ViewerStateMixin, serializers.ModelSerializer):
     """
     Serializer para exibição de usuário.
+
+    Aceita seleção de campos (?fields= / ?exclude=). ``followed_by_me`` e
+    ``follows_me`` são calculados em lote para a página inteira.
     """
 
     followers_count = serializers.ReadOnlyField()
     following_count = serializers.ReadOnlyField()
     posts_count = serializers.ReadOnlyField()
+    followed_by_me = serializers.SerializerMethodField()
+    follows_me = serializers.SerializerMethodField()
 
     class Meta:
         model = User
@@ -29,10 +36,24 @@ class UserSerializer(serializers.ModelSerializer):
             "followers_count",
             "following_count",
             "posts_count",
+            "followed_by_me",
+            "follows_me",
             "created_at",
         ]
         read_only_fields = ["id", "created_at"]
 
+    def get_followed_by_me(self, obj):
+        """Se o usuário autenticado segue este usuário."""
+        return self.viewer_state("following", obj)
+
+    def get_follows_me(self, obj):
+        """Se este usuário segue o usuário autenticado."""
+        return self.viewer_state("followers", obj)
+
+    def get_viewer_state(self, viewer, pks):
+        following, followers = relationships.between(viewer, pks)
+        return {"following": following, "followers": followers}
+
 
 class UserCreateSerializer(serializers.ModelSerializer):
     """
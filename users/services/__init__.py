@@ -0,0 +1,9 @@
+"""
+Users services package.
+
+Regras de negócio que não pertencem a um model ou view específicos.
+"""
+
+from . import counters, follows, graph, relationships, suggestions
+
+__all__ = ["counters", "follows", "graph", "relationships", "suggestions"]
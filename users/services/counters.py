@@ -0,0 +1,33 @@
+"""
+Counters service - Contadores desnormalizados de User.
+
+Mesma estratégia dos contadores de Post: um UPDATE com expressão F() por
+evento, atômico no banco e sem ler o valor atual.
+"""
+
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from users.models import User
+
+FOLLOWERS = "followers_count"
+FOLLOWING = "following_count"
+POSTS = "posts_count"
+
+
+def increment(user_ids, field, delta=1):
+    """
+    Soma ``delta`` ao contador ``field`` de um ou mais usuários.
+
+    Aceita um ID ou uma lista de IDs; o valor nunca fica abaixo de zero.
+    """
+    if isinstance(user_ids, int):
+        user_ids = [user_ids]
+    User.objects.filter(pk__in=user_ids).update(
+        **{field: Greatest(F(field) + delta, 0)}
+    )
+
+
+def decrement(user_ids, field, delta=1):
+    """Subtrai ``delta`` do contador ``field`` de um ou mais usuários."""
+    increment(user_ids, field, -delta)
@@ -0,0 +1,139 @@
+"""
+Follows service - Seguir/deixar de seguir um ou vários usuários.
+
+``follow``/``unfollow`` são um único statement idempotente, apoiado na
+constraint única de Follow (os receivers de post_save/post_delete cuidam
+do resto).
+
+No lote, as escritas não disparam os signals por linha de Follow, então
+``bulk_update`` faz em lote o que os receivers fariam por follow
+(contadores, grafo em memória, fila de sugestões) e emite
+``followed``/``unfollowed`` para os demais apps (ex.: timeline em posts).
+Os efeitos partem das linhas que as escritas de fato inseriram/removeram
+(RETURNING), não de uma leitura prévia: follows/unfollows simultâneos pelos
+endpoints individuais não fazem os contadores divergirem.
+"""
+
+from django.db import transaction
+from django.dispatch import Signal
+
+from core.db import (
+    delete_existing,
+    delete_returning,
+    insert_ignore,
+    insert_ignore_many,
+)
+from users.models import Follow, User
+from users.services import counters, graph, suggestions
+
+# Enviados com sender=Follow, follower_id e following_ids
+followed = Signal()
+unfollowed = Signal()
+
+FOLLOWED = "followed"
+ALREADY_FOLLOWING = "already_following"
+NOT_FOUND = "not_found"
+SELF = "self"
+UNFOLLOWED = "unfollowed"
+NOT_FOLLOWING = "not_following"
+
+
+def follow(user, following_id):
+    """
+    Segue o usuário (idempotente). Retorna o Follow criado, ou None se já
+    seguia ou o usuário não existe.
+    """
+    return insert_ignore(Follow, follower=user, following_id=following_id)
+
+
+def unfollow(user, following_id):
+    """Deixa de seguir o usuário (idempotente). Retorna True se seguia."""
+    return delete_existing(Follow, follower=user, following_id=following_id)
+
+
+def bulk_update(user, follow_ids=(), unfollow_ids=()):
+    """
+    Segue ``follow_ids`` e deixa de seguir ``unfollow_ids`` em uma transação.
+
+    Um INSERT idempotente e um DELETE, ambos com RETURNING, com os contadores
+    atualizados na mesma transação. Retorna ``(follow, unfollow)``: dicts
+    de ID para o resultado de cada um.
+    """
+    follow_ids = list(dict.fromkeys(follow_ids))
+    unfollow_ids = list(dict.fromkeys(unfollow_ids))
+
+    with transaction.atomic():
+        existing = set(
+            User.objects.filter(pk__in=follow_ids).values_list("pk", flat=True)
+        )
+
+        candidates = [
+            user_id
+            for user_id in follow_ids
+            if user_id != user.pk and user_id in existing
+        ]
+        inserted_ids = {
+            row.following_id
+            for row in insert_ignore_many(
+                Follow,
+                [Follow(follower=user, following_id=uid) for uid in candidates],
+            )
+        }
+
+        follow = {}
+        for user_id in follow_ids:
+            if user_id == user.pk:
+                follow[user_id] = SELF
+            elif user_id not in existing:
+                follow[user_id] = NOT_FOUND
+            elif user_id in inserted_ids:
+                follow[user_id] = FOLLOWED
+            else:
+                follow[user_id] = ALREADY_FOLLOWING
+
+        deleted_ids = set()
+        if unfollow_ids:
+            deleted_ids = {
+                row.following_id
+                for row in delete_returning(
+                    Follow.objects.filter(follower=user, following_id__in=unfollow_ids)
+                )
+            }
+        unfollow = {
+            user_id: UNFOLLOWED if user_id in deleted_ids else NOT_FOLLOWING
+            for user_id in unfollow_ids
+        }
+
+        created = [uid for uid, outcome in follow.items() if outcome == FOLLOWED]
+        deleted = [uid for uid, outcome in unfollow.items() if outcome == UNFOLLOWED]
+
+        if created:
+            counters.increment(created, counters.FOLLOWERS)
+        if deleted:
+            counters.decrement(deleted, counters.FOLLOWERS)
+        if len(created) != len(deleted):
+            counters.increment(user.pk, counters.FOLLOWING, len(created) - len(deleted))
+
+        if created or deleted:
+            suggestions.enqueue([user.pk])
+            _update_graph(user.pk, created, deleted)
+        if created:
+            followed.send(sender=Follow, follower_id=user.pk, following_ids=created)
+        if deleted:
+            unfollowed.send(sender=Follow, follower_id=user.pk, following_ids=deleted)
+
+    return follow, unfollow
+
+
+def _update_graph(follower_id, created, deleted):
+    """Aplica as mudanças no grafo em memória, se carregado, após o commit."""
+    if not graph.graph.loaded:
+        return
+
+    def apply():
+        for following_id in created:
+            graph.graph.follow(follower_id, following_id)
+        for following_id in deleted:
+            graph.graph.unfollow(follower_id, following_id)
+
+    transaction.on_commit(apply)
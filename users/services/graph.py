@@ -0,0 +1,371 @@
+"""
+Graph service - Grafo social compacto em memória.
+
+O grafo de follows é carregado do banco em duas listas de adjacência no
+formato CSR (compressed sparse row): para cada ID de usuário, ``offsets``
+aponta o trecho de ``targets`` com os vizinhos, ordenados. São arrays de
+inteiros (poucos bytes por aresta, sem objetos Python por follow), e as
+perguntas mais comuns não tocam o banco:
+
+- quem segue B / quem A segue: fatia do array
+- A segue B?: busca binária na fatia
+- quantos seguidores/seguindo: diferença de offsets
+
+Follows e unfollows confirmados são aplicados incrementalmente (via
+signals) em um overlay pequeno, incorporado aos arrays quando passa de
+``COMPACT_THRESHOLD`` alterações. Cada processo tem o próprio grafo; com
+vários workers, ``MAX_AGE`` limita por quanto tempo um processo pode ficar
+sem ver follows feitos em outro.
+
+Só a primeira carga acontece na requisição (e uma única vez, mesmo com
+requisições simultâneas). Recargas por idade e compactações rodam em uma
+thread em segundo plano, uma de cada vez, enquanto as requisições seguem
+usando o grafo atual; follows aplicados durante a reconstrução são
+reaplicados no grafo novo antes da troca.
+"""
+
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+
+from django.db import connection
+from django.db.models import Max
+
+from core.conf import app_settings
+from users.models import Follow, User
+
+CHUNK_SIZE = 10000
+
+
+def _typecode(max_value):
+    """Menor tipo de array que comporta ``max_value``."""
+    return "i" if max_value < 2**31 else "q"
+
+
+class CSR:
+    """
+    Lista de adjacência compacta e imutável.
+
+    Os vizinhos de ``node`` são ``targets[offsets[node]:offsets[node + 1]]``,
+    em ordem crescente.
+    """
+
+    __slots__ = ("offsets", "targets")
+
+    def __init__(self, offsets, targets):
+        self.offsets = offsets
+        self.targets = targets
+
+    @classmethod
+    def empty(cls):
+        return cls(array("q", [0]), array("i"))
+
+    @classmethod
+    def from_sorted_pairs(cls, pairs, max_node):
+        """
+        Monta a estrutura a partir de pares (origem, destino) já ordenados
+        por origem e destino, lidos em streaming.
+        """
+        offsets = array("q", bytes(8 * (max_node + 2)))
+        targets = array(_typecode(max_node))
+        for source, target in pairs:
+            if source + 1 >= len(offsets):
+                # Usuário criado depois de calcular max_node
+                offsets.extend(array("q", bytes(8 * (source + 2 - len(offsets)))))
+            offsets[source + 1] += 1
+            targets.append(target)
+
+        for node in range(1, len(offsets)):
+            offsets[node] += offsets[node - 1]
+        return cls(offsets, targets)
+
+    @property
+    def nbytes(self):
+        return (
+            len(self.offsets) * self.offsets.itemsize
+            + len(self.targets) * self.targets.itemsize
+        )
+
+    def _bounds(self, node):
+        if node < 0 or node + 1 >= len(self.offsets):
+            return 0, 0
+        return self.offsets[node], self.offsets[node + 1]
+
+    def neighbors(self, node):
+        start, end = self._bounds(node)
+        return self.targets[start:end]
+
+    def degree(self, node):
+        start, end = self._bounds(node)
+        return end - start
+
+    def contains(self, source, target):
+        start, end = self._bounds(source)
+        index = bisect_left(self.targets, target, start, end)
+        return index < end and self.targets[index] == target
+
+
+class Adjacency:
+    """CSR base + overlay de arestas adicionadas/removidas desde a carga."""
+
+    def __init__(self, csr):
+        self.csr = csr
+        self.added = defaultdict(set)
+        self.removed = defaultdict(set)
+        self.changes = 0
+
+    def add(self, source, target):
+        if target in self.removed[source]:
+            self.removed[source].discard(target)
+        elif not self.csr.contains(source, target):
+            self.added[source].add(target)
+        self.changes += 1
+
+    def remove(self, source, target):
+        if target in self.added[source]:
+            self.added[source].discard(target)
+        elif self.csr.contains(source, target):
+            self.removed[source].add(target)
+        self.changes += 1
+
+    def contains(self, source, target):
+        if target in self.added.get(source, ()):
+            return True
+        return target not in self.removed.get(source, ()) and self.csr.contains(
+            source, target
+        )
+
+    def neighbors(self, node):
+        removed = self.removed.get(node)
+        neighbors = [
+            target
+            for target in self.csr.neighbors(node)
+            if not removed or target not in removed
+        ]
+        added = self.added.get(node)
+        if added:
+            neighbors = sorted(set(neighbors) | added)
+        return neighbors
+
+    def degree(self, node):
+        return (
+            self.csr.degree(node)
+            + len(self.added.get(node, ()))
+            - len(self.removed.get(node, ()))
+        )
+
+    def copy(self):
+        """Cópia do overlay (o CSR é imutável e compartilhado)."""
+        adjacency = Adjacency(self.csr)
+        adjacency.added = defaultdict(set, {k: set(v) for k, v in self.added.items()})
+        adjacency.removed = defaultdict(
+            set, {k: set(v) for k, v in self.removed.items()}
+        )
+        adjacency.changes = self.changes
+        return adjacency
+
+    def compact(self):
+        """Incorpora o overlay em um novo CSR (sem acessar o banco)."""
+        max_node = len(self.csr.offsets) - 2
+        for source, targets in self.added.items():
+            if targets:
+                max_node = max(max_node, source, *targets)
+
+        def merged():
+            for node in range(max_node + 1):
+                for target in self.neighbors(node):
+                    yield node, target
+
+        return Adjacency(CSR.from_sorted_pairs(merged(), max_node))
+
+
+class SocialGraph:
+    """Grafo de follows nas duas direções (seguindo e seguidores)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self.following = Adjacency(CSR.empty())
+        self.followers = Adjacency(CSR.empty())
+        self.loaded_at = None
+        # Reconstrução em segundo plano (recarga ou compactação) em andamento
+        # e os follows/unfollows aplicados desde o seu início
+        self._rebuild = None
+        self._replay = None
+
+    @property
+    def loaded(self):
+        return self.loaded_at is not None
+
+    @property
+    def nbytes(self):
+        """Memória ocupada pelos arrays (sem o overlay)."""
+        return self.following.csr.nbytes + self.followers.csr.nbytes
+
+    def load(self):
+        """Carrega o grafo do banco, em duas leituras ordenadas em streaming."""
+        self.wait_for_rebuild()
+        started = time.monotonic()
+        following, followers = self._read()
+        with self._lock:
+            self._swap(following, followers, started)
+
+    def load_once(self):
+        """Carrega o grafo se ainda não carregado (uma carga por vez)."""
+        with self._load_lock:
+            if not self.loaded:
+                self.load()
+
+    def reload_in_background(self):
+        """Agenda uma recarga do banco, se nenhuma reconstrução estiver ativa."""
+        with self._lock:
+            self._start_rebuild(self._reload)
+
+    def wait_for_rebuild(self, timeout=None):
+        """Aguarda a reconstrução em segundo plano em andamento, se houver."""
+        rebuild = self._rebuild
+        if rebuild is not None:
+            rebuild.join(timeout)
+
+    def follow(self, follower_id, following_id):
+        """Aplica um follow confirmado."""
+        with self._lock:
+            self._apply(
+                self.following, self.followers, "follow", follower_id, following_id
+            )
+            self._compact_if_needed()
+
+    def unfollow(self, follower_id, following_id):
+        """Aplica um unfollow confirmado."""
+        with self._lock:
+            self._apply(
+                self.following, self.followers, "unfollow", follower_id, following_id
+            )
+            self._compact_if_needed()
+
+    def follows(self, follower_id, following_id):
+        """Se ``follower_id`` segue ``following_id``."""
+        return self.following.contains(follower_id, following_id)
+
+    def following_ids(self, user_id):
+        """IDs de quem o usuário segue, em ordem crescente."""
+        return list(self.following.neighbors(user_id))
+
+    def follower_ids(self, user_id):
+        """IDs dos seguidores do usuário, em ordem crescente."""
+        return list(self.followers.neighbors(user_id))
+
+    def following_count(self, user_id):
+        return self.following.degree(user_id)
+
+    def followers_count(self, user_id):
+        return self.followers.degree(user_id)
+
+    def clear(self):
+        self.wait_for_rebuild()
+        with self._lock:
+            self.following = Adjacency(CSR.empty())
+            self.followers = Adjacency(CSR.empty())
+            self.loaded_at = None
+
+    def _read(self):
+        max_node = User.objects.aggregate(max_id=Max("id"))["max_id"] or 0
+        following = CSR.from_sorted_pairs(
+            Follow.objects.order_by("follower_id", "following_id")
+            .values_list("follower_id", "following_id")
+            .iterator(chunk_size=CHUNK_SIZE),
+            max_node,
+        )
+        followers = CSR.from_sorted_pairs(
+            Follow.objects.order_by("following_id", "follower_id")
+            .values_list("following_id", "follower_id")
+            .iterator(chunk_size=CHUNK_SIZE),
+            max_node,
+        )
+        return Adjacency(following), Adjacency(followers)
+
+    def _apply(self, following, followers, operation, follower_id, following_id):
+        if operation == "follow":
+            following.add(follower_id, following_id)
+            followers.add(following_id, follower_id)
+        else:
+            following.remove(follower_id, following_id)
+            followers.remove(following_id, follower_id)
+        if self._replay is not None:
+            self._replay.append((operation, follower_id, following_id))
+
+    def _swap(self, following, followers, loaded_at=None):
+        """Troca as adjacências (com o lock), reaplicando o que veio depois."""
+        replay, self._replay = self._replay, None
+        for operation, follower_id, following_id in replay or ():
+            self._apply(following, followers, operation, follower_id, following_id)
+        self.following = following
+        self.followers = followers
+        if loaded_at is not None:
+            self.loaded_at = loaded_at
+
+    def _start_rebuild(self, prepare):
+        """
+        Inicia uma reconstrução em uma thread, salvo se já houver uma em
+        andamento. ``prepare`` roda aqui, com o lock, e retorna a função que
+        monta (fora do lock) as novas adjacências.
+        """
+        if self._rebuild is not None and self._rebuild.is_alive():
+            return
+        self._replay = []
+        self._rebuild = threading.Thread(
+            target=self._run_rebuild, args=(prepare(),), daemon=True
+        )
+        self._rebuild.start()
+
+    def _run_rebuild(self, build):
+        try:
+            following, followers, loaded_at = build()
+        except Exception:
+            with self._lock:
+                self._replay = None
+            raise
+        with self._lock:
+            self._swap(following, followers, loaded_at)
+
+    def _reload(self):
+        def build():
+            started = time.monotonic()
+            try:
+                following, followers = self._read()
+            finally:
+                connection.close()
+            return following, followers, started
+
+        return build
+
+    def _compaction(self):
+        # Cópias tiradas com o lock; a compactação roda fora dele
+        following, followers = self.following.copy(), self.followers.copy()
+        return lambda: (following.compact(), followers.compact(), None)
+
+    def _compact_if_needed(self):
+        threshold = app_settings("SOCIAL_GRAPH")["COMPACT_THRESHOLD"]
+        if self.following.changes >= threshold:
+            self._start_rebuild(self._compaction)
+
+
+graph = SocialGraph()
+
+
+def get_graph():
+    """
+    Retorna o grafo do processo, carregando-o sob demanda. Se mais velho
+    que ``MAX_AGE``, agenda a recarga em segundo plano e responde com o
+    grafo atual. None quando desativado.
+    """
+    options = app_settings("SOCIAL_GRAPH")
+    if not options["ENABLED"]:
+        return None
+    if not graph.loaded:
+        graph.load_once()
+    elif time.monotonic() - graph.loaded_at > options["MAX_AGE"]:
+        graph.reload_in_background()
+    return graph
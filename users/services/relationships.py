@@ -0,0 +1,44 @@
+"""
+Relationships service - Relações de follow entre um usuário e vários outros.
+"""
+
+from django.db.models import Q
+
+from users.models import Follow
+from users.services import graph
+
+
+def between(user, user_ids):
+    """
+    Retorna ``(following, followers)``: quais de ``user_ids`` o ``user``
+    segue e quais seguem o ``user``.
+
+    Com o grafo social em memória ativo, responde sem acessar o banco; senão
+    uma única consulta em Follow cobre as duas direções, usando o índice
+    (follower, following) e o índice da FK ``following``.
+    """
+    user_ids = list(user_ids)
+    following, followers = set(), set()
+    if not user_ids:
+        return following, followers
+
+    social_graph = graph.get_graph()
+    if social_graph is not None:
+        for user_id in user_ids:
+            if social_graph.follows(user.pk, user_id):
+                following.add(user_id)
+            if social_graph.follows(user_id, user.pk):
+                followers.add(user_id)
+        return following, followers
+
+    rows = Follow.objects.filter(
+        Q(follower_id=user.pk, following_id__in=user_ids)
+        | Q(following_id=user.pk, follower_id__in=user_ids)
+    ).values_list("follower_id", "following_id")
+
+    for follower_id, following_id in rows:
+        if follower_id == user.pk:
+            following.add(following_id)
+        if following_id == user.pk:
+            followers.add(follower_id)
+    return following, followers
@@ -0,0 +1,137 @@
+"""
+Suggestions service - Sugestões de quem seguir por conexões em comum.
+
+Os candidatos de um usuário são os seguidos por quem ele segue (dois
+passos no grafo), pontuados pela quantidade de caminhos: quantos dos seus
+seguidos seguem o candidato. O cálculo roda em lote sobre o grafo em
+memória (users.services.graph): a contagem de cada usuário é um
+``Counter.update`` sobre fatias dos arrays CSR, sem consultas por usuário,
+e apenas o top-K é gravado em FollowSuggestion.
+
+Follows e unfollows enfileiram o follower em SuggestionRefresh; o refresh
+incremental recalcula os enfileirados e os seguidores deles (cujos
+caminhos de dois passos passam pelo usuário enfileirado).
+"""
+
+import heapq
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from users.models import Follow, FollowSuggestion, SuggestionRefresh, User
+from users.services import graph
+
+BATCH_SIZE = 500
+
+
+def top_k():
+    """Quantidade de sugestões guardadas por usuário."""
+    return getattr(settings, "SUGGESTIONS_TOP_K", 20)
+
+
+def load_graph():
+    """Grafo do processo, se ativo, ou uma carga avulsa para o job."""
+    social_graph = graph.get_graph()
+    if social_graph is None:
+        social_graph = graph.SocialGraph()
+        social_graph.load()
+    return social_graph
+
+
+def candidates(social_graph, user_id, k):
+    """
+    Top-``k`` candidatos de ``user_id`` como pares (id, conexões em comum),
+    do maior para o menor (empates pelo menor ID).
+    """
+    following = social_graph.following_ids(user_id)
+    counts = Counter()
+    for followed_id in following:
+        counts.update(social_graph.following.neighbors(followed_id))
+
+    excluded = set(following)
+    excluded.add(user_id)
+    return heapq.nsmallest(
+        k,
+        ((uid, n) for uid, n in counts.items() if uid not in excluded),
+        key=lambda item: (-item[1], item[0]),
+    )
+
+
+def refresh(user_ids, social_graph=None, k=None):
+    """Recalcula e grava as sugestões de ``user_ids``. Retorna o total."""
+    social_graph = social_graph or load_graph()
+    k = k or top_k()
+    user_ids = list(user_ids)
+
+    for start in range(0, len(user_ids), BATCH_SIZE):
+        batch = user_ids[start : start + BATCH_SIZE]
+        rows = [
+            FollowSuggestion(user_id=user_id, suggested_id=uid, mutual_count=n)
+            for user_id in batch
+            for uid, n in candidates(social_graph, user_id, k)
+        ]
+        with transaction.atomic():
+            FollowSuggestion.objects.filter(user_id__in=batch).delete()
+            FollowSuggestion.objects.bulk_create(rows, batch_size=1000)
+    return len(user_ids)
+
+
+def refresh_all(k=None):
+    """Recalcula as sugestões de todos os usuários."""
+    social_graph = load_graph()
+    user_ids = User.objects.order_by("id").values_list("id", flat=True)
+    return refresh(user_ids.iterator(chunk_size=1000), social_graph, k)
+
+
+def refresh_pending(k=None):
+    """Consome a fila: recalcula os enfileirados e os seguidores deles."""
+    started = timezone.now()
+    queued = list(
+        SuggestionRefresh.objects.filter(queued_at__lte=started).values_list(
+            "user_id", flat=True
+        )
+    )
+    if not queued:
+        return 0
+
+    social_graph = load_graph()
+    affected = set(queued)
+    for user_id in queued:
+        affected.update(social_graph.follower_ids(user_id))
+
+    total = refresh(sorted(affected), social_graph, k)
+    # Reenfileirados durante o cálculo (queued_at maior) ficam para a próxima
+    SuggestionRefresh.objects.filter(
+        user_id__in=queued, queued_at__lte=started
+    ).delete()
+    return total
+
+
+def enqueue(user_ids):
+    """Marca as sugestões de ``user_ids`` como desatualizadas."""
+    now = timezone.now()
+    SuggestionRefresh.objects.bulk_create(
+        [SuggestionRefresh(user_id=user_id, queued_at=now) for user_id in user_ids],
+        update_conflicts=True,
+        unique_fields=["user"],
+        update_fields=["queued_at"],
+    )
+
+
+def for_user(user, limit):
+    """
+    Sugestões gravadas de ``user`` (com o usuário sugerido no mesmo
+    SELECT), sem quem ele passou a seguir depois do último cálculo.
+    """
+    already_following = Follow.objects.filter(
+        follower=user, following=OuterRef("suggested_id")
+    )
+    return list(
+        FollowSuggestion.objects.filter(user=user)
+        .exclude(Exists(already_following))
+        .select_related("suggested")
+        .order_by("-mutual_count", "suggested_id")[:limit]
+    )
@@ -0,0 +1,60 @@
+"""
+Users signals.
+
+Mantém os contadores de seguidores/seguindo e o grafo social em memória
+sincronizados com Follow, e enfileira o recálculo de sugestões (novos
+usuários e follows/unfollows).
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from users.models import Follow, User
+from users.services import counters, graph, suggestions
+
+
+@receiver(post_save, sender=Follow)
+def increment_follow_counters(sender, instance, created, **kwargs):
+    """Incrementa seguindo do follower e seguidores do seguido."""
+    if created:
+        counters.increment(instance.follower_id, counters.FOLLOWING)
+        counters.increment(instance.following_id, counters.FOLLOWERS)
+
+
+@receiver(post_delete, sender=Follow)
+def decrement_follow_counters(sender, instance, **kwargs):
+    """Decrementa seguindo do follower e seguidores do seguido."""
+    counters.decrement(instance.follower_id, counters.FOLLOWING)
+    counters.decrement(instance.following_id, counters.FOLLOWERS)
+
+
+@receiver(post_save, sender=Follow)
+def add_follow_to_graph(sender, instance, created, **kwargs):
+    """Aplica o follow no grafo em memória, se carregado, após o commit."""
+    if created and graph.graph.loaded:
+        follower_id, following_id = instance.follower_id, instance.following_id
+        transaction.on_commit(lambda: graph.graph.follow(follower_id, following_id))
+
+
+@receiver(post_delete, sender=Follow)
+def remove_follow_from_graph(sender, instance, **kwargs):
+    """Aplica o unfollow no grafo em memória, se carregado, após o commit."""
+    if graph.graph.loaded:
+        follower_id, following_id = instance.follower_id, instance.following_id
+        transaction.on_commit(lambda: graph.graph.unfollow(follower_id, following_id))
+
+
+@receiver(post_save, sender=Follow)
+@receiver(post_delete, sender=Follow)
+def enqueue_suggestions_refresh(sender, instance, **kwargs):
+    """Marca as sugestões do follower como desatualizadas."""
+    if kwargs.get("created", True):
+        suggestions.enqueue([instance.follower_id])
+
+
+@receiver(post_save, sender=User)
+def enqueue_new_user_suggestions(sender, instance, created, **kwargs):
+    """Enfileira o primeiro cálculo de sugestões de um usuário novo."""
+    if created and not kwargs.get("raw"):
+        suggestions.enqueue([instance.pk])
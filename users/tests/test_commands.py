@@ -0,0 +1,126 @@
+"""
+Testes para os comandos de gerenciamento do app users.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+
+import pytest
+
+from core.management import reconcile
+from posts.models import Post
+from users.models import Follow
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestReconcileUserCounters:
+    """Testes para o comando reconcile_user_counters."""
+
+    def test_fixes_drift(self):
+        """Testa correção de contadores divergentes."""
+        user1 = User.objects.create_user(username="user1", password="pass123")
+        user2 = User.objects.create_user(username="user2", password="pass123")
+        Follow.objects.create(follower=user1, following=user2)
+        Post.objects.create(author=user1, content="Post")
+        User.objects.update(followers_count=5, following_count=5, posts_count=5)
+        out = StringIO()
+
+        call_command("reconcile_user_counters", "--fix", stdout=out)
+
+        user1.refresh_from_db()
+        user2.refresh_from_db()
+        assert (user1.followers_count, user1.following_count) == (0, 1)
+        assert (user2.followers_count, user2.following_count) == (1, 0)
+        assert (user1.posts_count, user2.posts_count) == (1, 0)
+        assert "posts_count: 2" in out.getvalue()
+
+    def test_fix_ignores_writes_between_reads(self):
+        """
+        Testa que um follow entre a leitura do contador e o COUNT não é
+        somado duas vezes na correção.
+        """
+        from users.management.commands.reconcile_user_counters import Command
+
+        user1 = User.objects.create_user(username="user1", password="pass123")
+        user2 = User.objects.create_user(username="user2", password="pass123")
+        User.objects.filter(pk=user2.pk).update(followers_count=5)
+        # Leitura: gravado 5; follow concorrente (6); COUNT lido depois: 1
+        Follow.objects.create(follower=user1, following=user2)
+
+        Command().apply_fixes([(user2.pk, "followers_count", 5, 1)])
+
+        user2.refresh_from_db()
+        assert user2.followers_count == 1
+
+
+@pytest.mark.django_db(transaction=True)
+class TestReconcileWorkers:
+    """Testes para a reconciliação distribuída em vários workers."""
+
+    def test_fixes_drift_with_workers(self, monkeypatch):
+        """Testa --workers (com threads no lugar de processos no teste)."""
+        # O banco de teste em memória não é visível em outros processos
+        monkeypatch.setattr(reconcile, "ProcessPoolExecutor", ThreadPoolExecutor)
+        users = [
+            User.objects.create_user(username=f"user{i}", password="pass123")
+            for i in range(4)
+        ]
+        Follow.objects.create(follower=users[0], following=users[1])
+        User.objects.update(followers_count=3)
+        out = StringIO()
+
+        call_command(
+            "reconcile_user_counters",
+            "--fix",
+            "--workers=2",
+            "--chunk-size=1",
+            stdout=out,
+        )
+
+        assert dict(User.objects.values_list("username", "followers_count")) == {
+            "user0": 0,
+            "user1": 1,
+            "user2": 0,
+            "user3": 0,
+        }
+        assert "followers_count: 4" in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestBenchmarkSocialGraph:
+    """Testes para o comando benchmark_social_graph."""
+
+    def test_synthetic_graph_is_rolled_back(self):
+        """Testa o relatório e que os dados sintéticos não ficam no banco."""
+        out = StringIO()
+
+        call_command(
+            "benchmark_social_graph", users=20, follows=5, queries=10, stdout=out
+        )
+
+        assert "A segue B?" in out.getvalue()
+        assert not User.objects.filter(username__startswith="bench_").exists()
+
+
+@pytest.mark.django_db
+class TestRefreshSuggestions:
+    """Testes para o comando refresh_suggestions."""
+
+    def test_all(self):
+        """Testa o recálculo completo."""
+        me = User.objects.create_user(username="me", password="pass123")
+        friend = User.objects.create_user(username="friend", password="pass123")
+        other = User.objects.create_user(username="other", password="pass123")
+        Follow.objects.create(follower=me, following=friend)
+        Follow.objects.create(follower=friend, following=other)
+        out = StringIO()
+
+        call_command("refresh_suggestions", "--all", stdout=out)
+
+        assert "3 usuário(s)" in out.getvalue()
+        assert list(me.suggestions.values_list("suggested_id", flat=True)) == [other.id]
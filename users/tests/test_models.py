@@ -3,6 +3,7 @@ Testes para os models do app users.
 """
 
 from django.contrib.auth import get_user_model
+from django.db.models import F
 
 import pytest
 
@@ -61,6 +62,8 @@ class TestUserModel:
         Follow.objects.create(follower=user2, following=user1)
         Follow.objects.create(follower=user3, following=user1)
 
+        # Contador é atualizado no banco, recarregar a instância
+        user1.refresh_from_db()
         assert user1.followers_count == 2
 
     def test_user_following_count(self):
@@ -73,8 +76,53 @@ class TestUserModel:
         Follow.objects.create(follower=user1, following=user2)
         Follow.objects.create(follower=user1, following=user3)
 
+        user1.refresh_from_db()
         assert user1.following_count == 2
 
+    def test_user_counters_on_unfollow(self):
+        """Testa que deixar de seguir decrementa os contadores."""
+        user1 = User.objects.create_user(username="user1", password="pass123")
+        user2 = User.objects.create_user(username="user2", password="pass123")
+
+        follow = Follow.objects.create(follower=user1, following=user2)
+        follow.delete()
+
+        user1.refresh_from_db()
+        user2.refresh_from_db()
+        assert user1.following_count == 0
+        assert user2.followers_count == 0
+
+    def test_user_posts_count(self):
+        """Testa contagem de posts do usuário."""
+        from posts.models import Post
+
+        user = User.objects.create_user(username="user1", password="pass123")
+        Post.objects.create(author=user, content="Post 1")
+        post = Post.objects.create(author=user, content="Post 2")
+        post.delete()
+
+        user.refresh_from_db()
+        assert user.posts_count == 1
+
+    def test_save_keeps_concurrent_counter_updates(self):
+        """Testa que o save() de update não regrava os contadores lidos antes."""
+        user = User.objects.create_user(username="user1", password="pass123")
+
+        stale = User.objects.get(pk=user.pk)
+        User.objects.filter(pk=user.pk).update(
+            followers_count=F("followers_count") + 1,
+            following_count=F("following_count") + 2,
+            posts_count=F("posts_count") + 3,
+        )
+        stale.bio = "Nova bio"
+        stale.save()
+
+        user.refresh_from_db()
+        assert user.bio == "Nova bio"
+        assert user.followers_count == 1
+        assert user.following_count == 2
+        assert user.posts_count == 3
+
 
 @pytest.mark.django_db
 class TestFollowModel:
@@ -5,9 +5,15 @@ Testes para os serializers do app users.
 from django.contrib.auth import get_user_model
 
 import pytest
+from rest_framework.renderers import JSONRenderer
 
 from users.models import Follow
-from users.serializers import FollowSerializer, UserCreateSerializer, UserSerializer
+from users.serializers import (
+    FastUserSerializer,
+    FollowSerializer,
+    UserCreateSerializer,
+    UserSerializer,
+)
 
 User = get_user_model()
 
@@ -50,6 +56,7 @@ class TestUserSerializer:
         Follow.objects.create(follower=user2, following=user1)
         Follow.objects.create(follower=user3, following=user1)
 
+        user1.refresh_from_db()
         serializer = UserSerializer(user1)
         data = serializer.data
 
@@ -167,3 +174,25 @@ class TestFollowSerializer:
         serializer = FollowSerializer(data=data)
         assert not serializer.is_valid()
         assert "non_field_errors" in serializer.errors
+
+
+@pytest.mark.django_db
+class TestFastUserSerializer:
+    """Testes de paridade do FastUserSerializer."""
+
+    def test_parity_with_user_serializer(self):
+        """Testa que gera o mesmo JSON que o UserSerializer."""
+        user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            last_name="Úser",
+            profile_image="profile_images/me.png",
+        )
+        row = User.objects.values(*FastUserSerializer.value_fields()).get(pk=user.pk)
+        user.refresh_from_db()
+
+        renderer = JSONRenderer()
+        assert renderer.render(
+            FastUserSerializer().to_representation(row)
+        ) == renderer.render(UserSerializer(user).data)
@@ -0,0 +1,215 @@
+"""
+Testes para os services do app users.
+"""
+
+import threading
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+
+import pytest
+
+from users.models import Follow
+from users.services import graph, relationships, suggestions
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+class TestSocialGraph:
+    """Testes para o grafo social em memória."""
+
+    @pytest.fixture(autouse=True)
+    def enabled(self, settings):
+        settings.SOCIAL_GRAPH = {"ENABLED": True, "MAX_AGE": 3600}
+        graph.graph.clear()
+        yield
+        graph.graph.clear()
+
+    @pytest.fixture
+    def users(self):
+        return [
+            User.objects.create_user(username=f"user{i}", password="pass123")
+            for i in range(4)
+        ]
+
+    def test_load(self, users):
+        """Testa as consultas sobre o grafo carregado do banco."""
+        a, b, c, d = users
+        Follow.objects.create(follower=a, following=b)
+        Follow.objects.create(follower=c, following=b)
+        Follow.objects.create(follower=b, following=a)
+
+        social_graph = graph.get_graph()
+
+        assert social_graph.follows(a.id, b.id)
+        assert not social_graph.follows(b.id, c.id)
+        assert social_graph.follower_ids(b.id) == sorted([a.id, c.id])
+        assert social_graph.following_ids(a.id) == [b.id]
+        assert social_graph.followers_count(b.id) == 2
+        assert social_graph.following_count(d.id) == 0
+        assert social_graph.followers_count(9999) == 0
+
+    def test_incremental_updates(self, users, django_capture_on_commit_callbacks):
+        """Testa follow/unfollow aplicados após o commit."""
+        a, b, c, _ = users
+        Follow.objects.create(follower=a, following=b)
+        social_graph = graph.get_graph()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Follow.objects.create(follower=c, following=b)
+            Follow.objects.get(follower=a, following=b).delete()
+
+        assert social_graph.follower_ids(b.id) == [c.id]
+        assert not social_graph.follows(a.id, b.id)
+        assert social_graph.followers_count(b.id) == 1
+
+    def test_not_applied_before_commit(self, users, django_capture_on_commit_callbacks):
+        """Testa que follows não confirmados não entram no grafo."""
+        a, b, _, _ = users
+        social_graph = graph.get_graph()
+
+        with django_capture_on_commit_callbacks(execute=False):
+            Follow.objects.create(follower=a, following=b)
+
+        assert not social_graph.follows(a.id, b.id)
+
+    def test_compaction(self, settings, users):
+        """Testa que a compactação do overlay preserva o grafo."""
+        settings.SOCIAL_GRAPH = {**settings.SOCIAL_GRAPH, "COMPACT_THRESHOLD": 2}
+        a, b, c, d = users
+        Follow.objects.create(follower=a, following=b)
+        social_graph = graph.get_graph()
+
+        social_graph.follow(d.id + 10, a.id)  # usuário além dos arrays
+        social_graph.unfollow(a.id, b.id)
+        social_graph.wait_for_rebuild()
+        assert social_graph.following.changes == 0
+
+        social_graph.follow(c.id, b.id)
+        assert social_graph.follower_ids(b.id) == [c.id]
+        assert social_graph.follows(d.id + 10, a.id)
+        assert social_graph.followers_count(a.id) == 1
+
+    def test_changes_during_compaction_are_kept(self, settings, users):
+        """Testa follows aplicados enquanto a compactação roda."""
+        settings.SOCIAL_GRAPH = {**settings.SOCIAL_GRAPH, "COMPACT_THRESHOLD": 1}
+        a, b, c, d = users
+        social_graph = graph.get_graph()
+        compact = graph.Adjacency.compact
+        release = threading.Event()
+
+        def slow_compact(adjacency):
+            release.wait(timeout=5)
+            return compact(adjacency)
+
+        with patch.object(graph.Adjacency, "compact", slow_compact):
+            social_graph.follow(a.id, b.id)  # dispara a compactação
+            social_graph.follow(c.id, b.id)  # durante a compactação
+            release.set()
+            social_graph.wait_for_rebuild()
+
+        assert social_graph.follower_ids(b.id) == [a.id, c.id]
+        assert social_graph.following.csr.contains(a.id, b.id)
+
+    def test_stale_graph_reloads_in_background(self, settings, users):
+        """Testa que o grafo vencido é devolvido e recarregado uma única vez."""
+        social_graph = graph.get_graph()
+        settings.SOCIAL_GRAPH = {**settings.SOCIAL_GRAPH, "MAX_AGE": 0}
+        reads = []
+        release = threading.Event()
+
+        def slow_read():
+            reads.append(1)
+            release.wait(timeout=5)
+            return graph.Adjacency(graph.CSR.empty()), graph.Adjacency(
+                graph.CSR.empty()
+            )
+
+        with patch.object(social_graph, "_read", slow_read):
+            for _ in range(3):
+                assert graph.get_graph() is social_graph
+            release.set()
+            social_graph.wait_for_rebuild()
+
+        assert reads == [1]
+
+    def test_relationships_without_queries(self, users, django_assert_num_queries):
+        """Testa relationships.between respondido pelo grafo."""
+        a, b, c, _ = users
+        Follow.objects.create(follower=a, following=b)
+        Follow.objects.create(follower=c, following=a)
+        graph.get_graph()
+
+        with django_assert_num_queries(0):
+            following, followers = relationships.between(a, [b.id, c.id])
+
+        assert following == {b.id}
+        assert followers == {c.id}
+
+
+@pytest.mark.django_db
+class TestSuggestions:
+    """Testes para as sugestões de quem seguir."""
+
+    @pytest.fixture
+    def users(self):
+        return {
+            name: User.objects.create_user(username=name, password="pass123")
+            for name in ["me", "a", "b", "c", "x", "y"]
+        }
+
+    def follow(self, users, follower, following):
+        Follow.objects.create(follower=users[follower], following=users[following])
+
+    def test_ranked_by_mutual_connections(self, users):
+        """Testa ranking por conexões em comum, sem quem já é seguido."""
+        for followed in ["a", "b", "c"]:
+            self.follow(users, "me", followed)
+        for follower in ["a", "b"]:
+            self.follow(users, follower, "x")
+        self.follow(users, "c", "y")
+        self.follow(users, "a", "b")
+
+        suggestions.refresh([users["me"].id])
+
+        stored = suggestions.for_user(users["me"], 10)
+        assert [(s.suggested.username, s.mutual_count) for s in stored] == [
+            ("x", 2),
+            ("y", 1),
+        ]
+
+    def test_top_k(self, users):
+        """Testa que apenas o top-K é gravado."""
+        self.follow(users, "me", "a")
+        self.follow(users, "a", "x")
+        self.follow(users, "a", "y")
+
+        suggestions.refresh([users["me"].id], k=1)
+
+        assert users["me"].suggestions.count() == 1
+
+    def test_refresh_pending(self, users):
+        """Testa o recálculo incremental: enfileirados e seus seguidores."""
+        self.follow(users, "me", "a")
+        suggestions.refresh_pending()
+        assert not suggestions.for_user(users["me"], 10)
+
+        # "a" segue "x": muda as sugestões de "a" e de quem segue "a"
+        self.follow(users, "a", "x")
+        assert suggestions.refresh_pending() == 2
+
+        assert [s.suggested_id for s in suggestions.for_user(users["me"], 10)] == [
+            users["x"].id
+        ]
+        assert suggestions.refresh_pending() == 0
+
+    def test_followed_after_refresh_is_hidden(self, users):
+        """Testa que seguir um sugerido o remove na hora."""
+        self.follow(users, "me", "a")
+        self.follow(users, "a", "x")
+        suggestions.refresh([users["me"].id])
+
+        self.follow(users, "me", "x")
+
+        assert suggestions.for_user(users["me"], 10) == []
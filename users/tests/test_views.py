@@ -2,14 +2,21 @@
 Testes para as views do app users.
 """
 
+from io import StringIO
+
 from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.urls import reverse
 
 import pytest
 from rest_framework import status
 from rest_framework.test import APIClient
 
-from users.models import Follow
+from users.models import Follow, SuggestionRefresh
+from users.pagination import FollowingPagination
+from users.serializers import UserSerializer
+from users.services import follows
+from users.views import UserViewSet
 
 User = get_user_model()
 
@@ -50,6 +57,36 @@ class TestUserViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data["results"]) == 2
 
+    def test_list_users_constant_queries(self, api_client, django_assert_num_queries):
+        """Testa que a listagem não faz consultas por usuário (N+1)."""
+        for i in range(10):
+            User.objects.create_user(username=f"user{i}", password="pass123")
+
+        with django_assert_num_queries(2):
+            response = api_client.get(reverse("user-list"))
+
+        assert len(response.data["results"]) == 10
+
+    def test_list_users_fast_path_parity(self, monkeypatch, api_client, user):
+        """Testa que a listagem rápida de usuários é idêntica."""
+        User.objects.create_user(username="user2", password="pass123", bio="Bio")
+        url = reverse("user-list")
+
+        slow = api_client.get(url)
+        monkeypatch.setattr(UserViewSet, "fast_serialization", True)
+        fast = api_client.get(url)
+
+        assert fast.content == slow.content
+
+    def test_list_users_sparse_fields(self, api_client, user):
+        """Testa seleção de campos na listagem de usuários."""
+        url = reverse("user-list")
+        response = api_client.get(url, {"fields": "id,username,followers_count"})
+
+        assert response.data["results"] == [
+            {"id": user.id, "username": "testuser", "followers_count": 0}
+        ]
+
     def test_retrieve_user(self, api_client, user):
         """Testa obter detalhes de usuário."""
         url = reverse("user-detail", kwargs={"pk": user.pk})
@@ -74,7 +111,7 @@ class TestUserViewSet:
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
-    def test_user_followers(self, api_client, user):
+    def test_user_followers(self, api_client, user, django_assert_num_queries):
         """Testa endpoint de seguidores."""
         follower1 = User.objects.create_user(username="follower1", password="pass123")
         follower2 = User.objects.create_user(username="follower2", password="pass123")
@@ -83,10 +120,12 @@ class TestUserViewSet:
         Follow.objects.create(follower=follower2, following=user)
 
         url = reverse("user-followers", kwargs={"pk": user.pk})
-        response = api_client.get(url)
+        # Usuário + página de seguidores com join
+        with django_assert_num_queries(2):
+            response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data["results"]) == 2
 
     def test_user_following(self, api_client, user):
         """Testa endpoint de quem o usuário segue."""
@@ -100,13 +139,66 @@ class TestUserViewSet:
         response = api_client.get(url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2
+        assert len(response.data["results"]) == 2
+
+    def test_followers_cursor_pagination(self, api_client, user):
+        """Testa páginas de seguidores do follow mais recente ao mais antigo."""
+        followers = [
+            User.objects.create_user(username=f"follower{i}", password="pass123")
+            for i in range(5)
+        ]
+        for follower in followers:
+            Follow.objects.create(follower=follower, following=user)
+        url = reverse("user-followers", kwargs={"pk": user.pk})
+
+        first = api_client.get(url, {"limit": 2})
+        second = api_client.get(first.data["next"])
+        third = api_client.get(second.data["next"])
+
+        pages = [first, second, third]
+        usernames = [u["username"] for page in pages for u in page.data["results"]]
+        assert usernames == [f"follower{i}" for i in reversed(range(5))]
+        assert "count" not in first.data
+        assert third.data["next"] is None
+
+    def test_following_page_is_bounded(self, monkeypatch, api_client, user):
+        """Testa o limite máximo de itens por página."""
+        monkeypatch.setattr(FollowingPagination, "max_limit", 2)
+        for i in range(3):
+            other = User.objects.create_user(username=f"user{i}", password="pass123")
+            Follow.objects.create(follower=user, following=other)
+        url = reverse("user-following", kwargs={"pk": user.pk})
+
+        response = api_client.get(url, {"limit": 1000})
+
+        assert len(response.data["results"]) == 2
+        assert response.data["next"] is not None
+
+    def test_followers_not_found(self, api_client):
+        """Testa 404 para usuário inexistente."""
+        response = api_client.get(reverse("user-followers", kwargs={"pk": 999}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
 @pytest.mark.django_db
 class TestFollowViewSet:
     """Testes para o FollowViewSet."""
 
+    def test_list_follows_constant_queries(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Testa que a listagem não faz consultas por follow (N+1)."""
+        for i in range(10):
+            other = User.objects.create_user(username=f"user{i}", password="pass")
+            Follow.objects.create(follower=other, following=user)
+
+        with django_assert_num_queries(2):
+            response = authenticated_client.get(reverse("follow-list"))
+
+        assert len(response.data["results"]) == 10
+        assert response.data["results"][0]["following_username"] == "testuser"
+
     def test_create_follow_authenticated(self, authenticated_client, user):
         """Testa seguir usuário estando autenticado."""
         user_to_follow = User.objects.create_user(username="user2", password="pass123")
@@ -170,3 +262,312 @@ class TestFollowViewSet:
 
         assert response.status_code == status.HTTP_403_FORBIDDEN
         assert Follow.objects.filter(follower=user2, following=user3).exists()
+
+    def test_follow_action_is_idempotent(self, authenticated_client, user):
+        """Testa PUT/DELETE /users/{id}/follow/ repetidos."""
+        other = User.objects.create_user(username="other", password="pass123")
+        url = reverse("user-follow", kwargs={"pk": other.pk})
+
+        for _ in range(2):
+            response = authenticated_client.put(url)
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+        other.refresh_from_db()
+        assert other.followers_count == 1
+        assert Follow.objects.filter(follower=user, following=other).count() == 1
+
+        for _ in range(2):
+            response = authenticated_client.delete(url)
+            assert response.status_code == status.HTTP_204_NO_CONTENT
+        other.refresh_from_db()
+        user.refresh_from_db()
+        assert other.followers_count == 0
+        assert user.following_count == 0
+
+    def test_follow_action_errors(self, authenticated_client, user):
+        """Testa seguir a si mesmo e usuário inexistente."""
+        response = authenticated_client.put(
+            reverse("user-follow", kwargs={"pk": user.pk})
+        )
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = authenticated_client.put(reverse("user-follow", kwargs={"pk": 999}))
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert not Follow.objects.exists()
+
+    def test_follow_action_id_out_of_range(self, authenticated_client):
+        """Testa 404 (e não 500) para IDs fora da faixa de 64 bits."""
+        for method in ("put", "delete"):
+            response = getattr(authenticated_client, method)(
+                reverse("user-follow", kwargs={"pk": "99999999999999999999"})
+            )
+            assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestViewerState:
+    """Testes de followed_by_me / follows_me."""
+
+    def test_relationship_flags(
+        self, authenticated_client, user, django_assert_num_queries
+    ):
+        """Testa as duas direções com uma consulta de follows por página."""
+        followed = User.objects.create_user(username="followed", password="pass123")
+        follower = User.objects.create_user(username="follower", password="pass123")
+        mutual = User.objects.create_user(username="mutual", password="pass123")
+        stranger = User.objects.create_user(username="stranger", password="pass123")
+        Follow.objects.create(follower=user, following=followed)
+        Follow.objects.create(follower=follower, following=user)
+        Follow.objects.create(follower=user, following=mutual)
+        Follow.objects.create(follower=mutual, following=user)
+
+        # COUNT + usuários + follows
+        with django_assert_num_queries(3):
+            response = authenticated_client.get(reverse("user-list"))
+
+        flags = {
+            item["username"]: (item["followed_by_me"], item["follows_me"])
+            for item in response.data["results"]
+        }
+        assert flags[followed.username] == (True, False)
+        assert flags[follower.username] == (False, True)
+        assert flags[mutual.username] == (True, True)
+        assert flags[stranger.username] == (False, False)
+
+    def test_retrieve(self, authenticated_client, user):
+        """Testa as flags no detalhe do usuário."""
+        other = User.objects.create_user(username="other", password="pass123")
+        Follow.objects.create(follower=user, following=other)
+
+        response = authenticated_client.get(
+            reverse("user-detail", kwargs={"pk": other.pk})
+        )
+
+        assert response.data["followed_by_me"] is True
+        assert response.data["follows_me"] is False
+
+
+@pytest.mark.django_db
+class TestSuggestionsEndpoint:
+    """Testes do endpoint /api/users/suggestions/."""
+
+    def test_suggestions(self, authenticated_client, user, django_assert_num_queries):
+        """Testa a leitura das sugestões pré-calculadas."""
+        friend = User.objects.create_user(username="friend", password="pass123")
+        other = User.objects.create_user(username="other", password="pass123")
+        Follow.objects.create(follower=user, following=friend)
+        Follow.objects.create(follower=friend, following=other)
+        call_command("refresh_suggestions", stdout=StringIO())
+
+        # Sugestões com join + flags de follow
+        with django_assert_num_queries(2):
+            response = authenticated_client.get(reverse("user-suggestions"))
+
+        other.refresh_from_db()
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {"user": UserSerializer(other).data, "mutual_count": 1}
+        ]
+
+    def test_new_user_is_enqueued(self, user):
+        """Testa que o usuário novo entra na fila de cálculo."""
+        assert SuggestionRefresh.objects.filter(user=user).exists()
+
+    def test_empty_does_not_enqueue(self, authenticated_client, user):
+        """Testa que a leitura sem sugestões não escreve na fila."""
+        SuggestionRefresh.objects.all().delete()
+
+        response = authenticated_client.get(reverse("user-suggestions"))
+
+        assert response.data == []
+        assert not SuggestionRefresh.objects.exists()
+
+    def test_invalid_limit(self, authenticated_client):
+        """Testa limit inválido."""
+        response = authenticated_client.get(
+            reverse("user-suggestions"), {"limit": "abc"}
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_unauthenticated(self, api_client):
+        """Testa que exige autenticação."""
+        response = api_client.get(reverse("user-suggestions"))
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestRelationshipsEndpoint:
+    """Testes do endpoint /api/users/relationships/."""
+
+    def test_relationships(self, authenticated_client, user, django_assert_num_queries):
+        """Testa as duas direções com uma única consulta em Follow."""
+        followed = User.objects.create_user(username="followed", password="pass123")
+        follower = User.objects.create_user(username="follower", password="pass123")
+        Follow.objects.create(follower=user, following=followed)
+        Follow.objects.create(follower=follower, following=user)
+        ids = [followed.id, follower.id, 999, followed.id]
+
+        with django_assert_num_queries(1):
+            response = authenticated_client.get(
+                reverse("user-relationships"), {"ids": ",".join(map(str, ids))}
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == [
+            {"id": followed.id, "following": True, "followed_by": False},
+            {"id": follower.id, "following": False, "followed_by": True},
+            {"id": 999, "following": False, "followed_by": False},
+        ]
+
+    @pytest.mark.parametrize(
+        "ids",
+        ["", "1,abc", "1,99999999999999999999", ",".join(map(str, range(201)))],
+    )
+    def test_invalid_ids(self, authenticated_client, ids):
+        """Testa IDs ausentes, inválidos, fora da faixa ou acima do limite."""
+        response = authenticated_client.get(reverse("user-relationships"), {"ids": ids})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_unauthenticated(self, api_client):
+        """Testa que exige autenticação."""
+        response = api_client.get(reverse("user-relationships"), {"ids": "1"})
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.django_db
+class TestBulkFollowEndpoint:
+    """Testes do endpoint /api/follows/bulk/."""
+
+    def test_bulk_follow_and_unfollow(self, authenticated_client, user):
+        """Testa o resultado de cada ID e os contadores."""
+        new = User.objects.create_user(username="new", password="pass123")
+        followed = User.objects.create_user(username="followed", password="pass123")
+        old = User.objects.create_user(username="old", password="pass123")
+        stranger = User.objects.create_user(username="stranger", password="pass123")
+        Follow.objects.create(follower=user, following=followed)
+        Follow.objects.create(follower=user, following=old)
+
+        response = authenticated_client.post(
+            reverse("follow-bulk"),
+            {
+                "follow": [new.id, followed.id, user.id, 999, new.id],
+                "unfollow": [old.id, stranger.id],
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "follow": {
+                str(new.id): "followed",
+                str(followed.id): "already_following",
+                str(user.id): "self",
+                "999": "not_found",
+            },
+            "unfollow": {
+                str(old.id): "unfollowed",
+                str(stranger.id): "not_following",
+            },
+        }
+        assert set(
+            Follow.objects.filter(follower=user).values_list("following_id", flat=True)
+        ) == {new.id, followed.id}
+
+        user.refresh_from_db()
+        new.refresh_from_db()
+        old.refresh_from_db()
+        assert user.following_count == 2
+        assert new.followers_count == 1
+        assert old.followers_count == 0
+        assert SuggestionRefresh.objects.filter(user=user).exists()
+
+    def test_bulk_constant_queries(
+        self, authenticated_client, user, django_assert_max_num_queries
+    ):
+        """Testa que a quantidade de escritas não cresce com os IDs."""
+        others = [
+            User.objects.create_user(username=f"user{i}", password="pass")
+            for i in range(20)
+        ]
+        for other in others[10:]:
+            Follow.objects.create(follower=user, following=other)
+
+        # Sem posts, o backfill da timeline é uma consulta por seguido
+        with django_assert_max_num_queries(11 + 10):
+            response = authenticated_client.post(
+                reverse("follow-bulk"),
+                {
+                    "follow": [other.id for other in others[:10]],
+                    "unfollow": [other.id for other in others[10:]],
+                },
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert set(response.json()["follow"].values()) == {"followed"}
+        assert set(response.json()["unfollow"].values()) == {"unfollowed"}
+
+    def test_concurrent_single_writes_keep_counters(self, user, monkeypatch):
+        """
+        Testa follow/unfollow individuais concorrentes ao lote: os contadores
+        refletem só as linhas que cada escrita de fato alterou.
+        """
+        target = User.objects.create_user(username="target", password="pass123")
+        old = User.objects.create_user(username="old", password="pass123")
+        Follow.objects.create(follower=user, following=old)
+        insert_ignore_many = follows.insert_ignore_many
+        delete_returning = follows.delete_returning
+
+        def follow_first(model, instances):
+            # Outra requisição segue o mesmo usuário antes do INSERT em lote
+            follows.follow(user, target.id)
+            return insert_ignore_many(model, instances)
+
+        def unfollow_first(queryset):
+            follows.unfollow(user, old.id)
+            return delete_returning(queryset)
+
+        monkeypatch.setattr(follows, "insert_ignore_many", follow_first)
+        monkeypatch.setattr(follows, "delete_returning", unfollow_first)
+
+        follow, unfollow = follows.bulk_update(
+            user, follow_ids=[target.id], unfollow_ids=[old.id]
+        )
+
+        assert follow == {target.id: follows.ALREADY_FOLLOWING}
+        assert unfollow == {old.id: follows.NOT_FOLLOWING}
+        user.refresh_from_db()
+        target.refresh_from_db()
+        old.refresh_from_db()
+        assert user.following_count == 1
+        assert target.followers_count == 1
+        assert old.followers_count == 0
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {},
+            {"follow": [], "unfollow": []},
+            {"follow": [2], "unfollow": [2]},
+            {"follow": ["abc"]},
+            {"follow": list(range(1, 202))},
+        ],
+    )
+    def test_invalid_body(self, authenticated_client, data):
+        """Testa corpo vazio, IDs repetidos nas duas listas ou acima do limite."""
+        response = authenticated_client.post(
+            reverse("follow-bulk"), data, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_unauthenticated(self, api_client):
+        """Testa que exige autenticação."""
+        response = api_client.post(
+            reverse("follow-bulk"), {"follow": [1]}, format="json"
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -2,12 +2,16 @@
 Follow ViewSet.
 """
 
+from django.db import transaction
+
 from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from users.models import Follow
-from users.serializers import FollowSerializer
+from users.serializers import BulkFollowSerializer, FollowSerializer
+from users.services import follows
 
 
 class FollowViewSet(viewsets.ModelViewSet):
@@ -17,9 +21,10 @@ class FollowViewSet(viewsets.ModelViewSet):
     list: Lista todos os follows
     create: Seguir um usuário
     destroy: Deixar de seguir
+    bulk: Seguir/deixar de seguir vários usuários
     """
 
-    queryset = Follow.objects.all()
+    queryset = Follow.objects.with_related()
     serializer_class = FollowSerializer
     permission_classes = [IsAuthenticated]
 
@@ -34,17 +39,18 @@ class FollowViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(data=data)
         serializer.is_valid(raise_exception=True)
 
-        # Verificar se já não está seguindo
-        if Follow.objects.filter(
-            follower=request.user, following=serializer.validated_data["following"]
-        ).exists():
+        # Um INSERT ... ON CONFLICT DO NOTHING: a constraint única decide se
+        # já segue, sem consulta prévia nem corrida entre requisições
+        follow = follows.follow(request.user, serializer.validated_data["following"].pk)
+        if follow is None:
             return Response(
                 {"detail": "Você já segue este usuário."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-
-        self.perform_create(serializer)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        follow.following = serializer.validated_data["following"]
+        return Response(
+            self.get_serializer(follow).data, status=status.HTTP_201_CREATED
+        )
 
     def destroy(self, request, *args, **kwargs):
         """
@@ -59,5 +65,29 @@ class FollowViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        self.perform_destroy(instance)
+        with transaction.atomic():
+            self.perform_destroy(instance)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request):
+        """
+        Seguir e deixar de seguir vários usuários em uma requisição.
+
+        Um INSERT e um DELETE para todos os IDs, com o resultado de cada um
+        (ex.: ``followed``, ``already_following``, ``not_found``).
+        """
+        serializer = BulkFollowSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        follow, unfollow = follows.bulk_update(
+            request.user,
+            follow_ids=serializer.validated_data["follow"],
+            unfollow_ids=serializer.validated_data["unfollow"],
+        )
+        return Response(
+            {
+                "follow": {str(uid): outcome for uid, outcome in follow.items()},
+                "unfollow": {str(uid): outcome for uid, outcome in unfollow.items()},
+            }
+        )
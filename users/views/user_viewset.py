@@ -2,17 +2,29 @@
 User ViewSet.
 """
 
-from rest_framework import viewsets
+from django.http import Http404
+
+from rest_framework import status, viewsets
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
-from users.models import User
+from core.db import to_pk
+from core.views import FastReadMixin, SparseFieldsetsMixin
+from users.models import Follow, User
+from users.pagination import FollowersPagination, FollowingPagination
 from users.permissions import IsOwnerOrReadOnly
-from users.serializers import UserCreateSerializer, UserSerializer
+from users.serializers import (
+    FastUserSerializer,
+    FollowSuggestionSerializer,
+    UserCreateSerializer,
+    UserSerializer,
+)
+from users.services import follows, relationships, suggestions
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(SparseFieldsetsMixin, FastReadMixin, viewsets.ModelViewSet):
     """
     ViewSet para operações com usuários.
 
@@ -25,6 +37,8 @@ class UserViewSet(viewsets.ModelViewSet):
 
     queryset = User.objects.all()
     serializer_class = UserSerializer
+    fast_serializer_class = FastUserSerializer
+    fast_serialization = False  # True: list/retrieve via FastUserSerializer
 
     def get_serializer_class(self):
         """Retorna serializer apropriado para cada ação."""
@@ -45,29 +59,125 @@ class UserViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=["get"])
     def me(self, request):
         """Retorna dados do usuário autenticado."""
-        serializer = self.get_serializer(request.user)
+        # request.user pode vir do cache de tokens, com contadores antigos
+        user = self.get_queryset().get(pk=request.user.pk)
+        serializer = self.get_serializer(user)
         return Response(serializer.data)
 
-    @action(detail=True, methods=["get"])
-    def followers(self, request, pk=None):
-        """Lista seguidores de um usuário."""
-        user = self.get_object()
-        followers = user.followers.all()
+    @action(detail=True, methods=["put", "delete"])
+    def follow(self, request, pk=None):
+        """
+        Seguir (PUT) ou deixar de seguir (DELETE), sem o ID do Follow.
+
+        Idempotente e um único statement: repetir a requisição não muda
+        nada. O usuário só é consultado quando nada mudou, para responder
+        404 se ele não existir.
+        """
+        try:
+            user_id = to_pk(User, pk)
+        except ValueError:
+            raise Http404
+        if user_id == request.user.pk:
+            raise ValidationError({"detail": "Você não pode seguir a si mesmo."})
+
+        if request.method == "PUT":
+            changed = follows.follow(request.user, user_id) is not None
+        else:
+            changed = follows.unfollow(request.user, user_id)
+
+        if not changed and not User.objects.filter(pk=user_id).exists():
+            raise Http404
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    max_relationship_ids = 200
+
+    @action(detail=False, methods=["get"])
+    def relationships(self, request):
+        """
+        Relações do usuário autenticado com vários usuários (?ids=1,2,3).
+
+        Uma única consulta em Follow cobre as duas direções, para até
+        ``max_relationship_ids`` IDs.
+        """
+        user_ids = self.get_relationship_ids(request)
+        following, followers = relationships.between(request.user, user_ids)
+        return Response(
+            [
+                {
+                    "id": user_id,
+                    "following": user_id in following,
+                    "followed_by": user_id in followers,
+                }
+                for user_id in user_ids
+            ]
+        )
 
-        # Pegar os usuários que seguem (follower)
-        follower_users = [follow.follower for follow in followers]
-        serializer = UserSerializer(follower_users, many=True)
+    def get_relationship_ids(self, request):
+        """Lê ?ids= (IDs inteiros separados por vírgula, sem repetição)."""
+        value = request.query_params.get("ids", "")
+        try:
+            user_ids = [to_pk(User, part) for part in value.split(",") if part.strip()]
+        except ValueError:
+            raise ValidationError(
+                {"ids": "Informe IDs inteiros válidos separados por vírgula."}
+            )
+        user_ids = list(dict.fromkeys(user_ids))
+        if not user_ids:
+            raise ValidationError({"ids": "Informe ao menos um ID."})
+        if len(user_ids) > self.max_relationship_ids:
+            raise ValidationError(
+                {"ids": f"Máximo de {self.max_relationship_ids} IDs por requisição."}
+            )
+        return user_ids
 
+    @action(detail=False, methods=["get"])
+    def suggestions(self, request):
+        """
+        Sugestões de quem seguir, por conexões em comum.
+
+        Lê o top-K pré-calculado (comando refresh_suggestions), sem
+        escritas: o usuário entra na fila ao se registrar e ao seguir ou
+        deixar de seguir alguém.
+        """
+        limit = self.get_suggestions_limit(request)
+        items = suggestions.for_user(request.user, limit)
+
+        serializer = FollowSuggestionSerializer(
+            items, many=True, context=self.get_serializer_context()
+        )
         return Response(serializer.data)
 
-    @action(detail=True, methods=["get"])
-    def following(self, request, pk=None):
-        """Lista usuários que um usuário segue."""
+    def get_suggestions_limit(self, request):
+        """Lê ?limit= (padrão 10, máximo SUGGESTIONS_TOP_K)."""
+        value = request.query_params.get("limit", 10)
+        try:
+            limit = int(value)
+        except (TypeError, ValueError):
+            raise ValidationError({"limit": "Deve ser um inteiro."})
+        if limit < 1:
+            raise ValidationError({"limit": "Deve ser maior que 0."})
+        return min(limit, suggestions.top_k())
+
+    @action(detail=True, methods=["get"], pagination_class=FollowersPagination)
+    def followers(self, request, pk=None):
+        """Lista seguidores de um usuário (paginação por cursor)."""
         user = self.get_object()
-        following = user.following.all()
+        follows = Follow.objects.filter(following=user).select_related("follower")
+        return self.paginate_follows(follows, "follower")
 
-        # Pegar os usuários sendo seguidos (following)
-        following_users = [follow.following for follow in following]
-        serializer = UserSerializer(following_users, many=True)
+    @action(detail=True, methods=["get"], pagination_class=FollowingPagination)
+    def following(self, request, pk=None):
+        """Lista usuários que um usuário segue (paginação por cursor)."""
+        user = self.get_object()
+        follows = Follow.objects.filter(follower=user).select_related("following")
+        return self.paginate_follows(follows, "following")
 
-        return Response(serializer.data)
+    def paginate_follows(self, follows, side):
+        """
+        Pagina as linhas de Follow (com o usuário de ``side`` no mesmo
+        SELECT, via join) e responde com os usuários.
+        """
+        page = self.paginate_queryset(follows)
+        users = [getattr(follow, side) for follow in page]
+        serializer = self.get_serializer(users, many=True)
+        return self.get_paginated_response(serializer.data)